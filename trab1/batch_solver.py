@@ -0,0 +1,93 @@
+# Runs many (maze, algorithm, seed) jobs on a process pool.
+# Run from the repository root, e.g.:
+#   python -m trab1.batch_solver --algorithms dfs a_star uniform \
+#       --sizes 20 50 --seeds 1 2 3 --repetitions 10 --timeout 30
+# or with the jobs listed in a ';' separated file with the columns
+# algoritmo;linhas;colunas;semente;obstaculos;repeticoes:
+#   python -m trab1.batch_solver --jobs jobs.csv
+from trab1.src.batch import ALGORITHMS, Job, JobResult, run_batch
+import argparse
+import csv
+
+
+def read_jobs(file_name):
+    jobs = []
+    with open(file_name, encoding='UTF8', newline='') as f:
+        for row in csv.DictReader(f, delimiter=';'):
+            jobs.append(Job(row['algoritmo'],
+                            int(row['linhas']),
+                            int(row['colunas']),
+                            int(row['semente']),
+                            float(row.get('obstaculos') or 0.25),
+                            int(row.get('repeticoes') or 1)))
+    return jobs
+
+
+def print_result(result: JobResult):
+    job = result.job
+    name = (f"[{result.index}] {job.algorithm} {job.n_rows}x{job.n_cols} "
+            f"seed {job.seed}")
+    if result.status == 'ok':
+        mean_time = sum(result.times) / len(result.times)
+        print(f"{name}: cost {result.cost:.2f}, steps {result.path_len}, "
+              f"expanded {result.n_expanded}, time {mean_time:.4f}s",
+              flush=True)
+    else:
+        print(f"{name}: {result.status} {result.error}", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run (maze, algorithm, seed) jobs on a process pool.")
+    parser.add_argument('--jobs', help="';' separated file with the jobs")
+    parser.add_argument('--algorithms', nargs='+',
+                        default=['dfs', 'a_star', 'uniform'],
+                        choices=sorted(ALGORITHMS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[20])
+    parser.add_argument('--seeds', nargs='+', type=int, default=[42])
+    parser.add_argument('--obstacles', type=float, default=0.25)
+    parser.add_argument('--repetitions', type=int, default=1)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="seconds per job")
+    parser.add_argument('--output', default='resultados_batch.csv')
+    args = parser.parse_args()
+    if args.repetitions < 1:
+        parser.error("--repetitions must be at least 1")
+
+    if args.jobs:
+        jobs = read_jobs(args.jobs)
+    else:
+        jobs = [Job(algorithm, size, size, seed, args.obstacles,
+                    args.repetitions)
+                for size in args.sizes
+                for seed in args.seeds
+                for algorithm in args.algorithms]
+
+    print("Wait...")
+
+    results = run_batch(jobs, args.workers, args.timeout,
+                        on_result=print_result)
+
+    header = ['algoritmo', 'linhas', 'colunas', 'semente', 'obstaculos',
+              'repeticoes', 'status', 'custo', 'passos', 'nos_gerados',
+              'nos_expandidos', 'tempo_medio']
+
+    with open(args.output, 'w', encoding='UTF8', newline='') as f:
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(header)
+        for result in results:
+            job = result.job
+            mean_time = sum(result.times) / len(result.times) \
+                if result.times else ''
+            writer.writerow([job.algorithm, job.n_rows, job.n_cols, job.seed,
+                             job.obstacle_ratio, job.repetitions,
+                             result.status, result.cost, result.path_len,
+                             result.n_generated, result.n_expanded,
+                             mean_time])
+
+    print("OK!")
+
+
+if __name__ == "__main__":
+    main()
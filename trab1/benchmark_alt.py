@@ -0,0 +1,91 @@
+# Reports how many expansions of a_star_search each landmark (ALT)
+# strategy saves compared with the euclidean 'e' heuristic.
+# Run from the repository root: python -m trab1.benchmark_alt
+from trab1.src.problems import MazeProblem
+from trab1.src.search import a_star_search
+from trab1.src.landmarks import STRATEGIES, LandmarkHeuristic
+import time
+import csv
+
+
+def main():
+    sizes = [100, 200, 400]
+    obstacle_ratios = [0.25, 0.35]
+    seeds = [1, 2, 3]
+    landmark_counts = [4, 8, 16]
+    bytes_per_cell = [8, 2]
+
+    header = ['tamanho', 'obstaculos', 'estrategia', 'marcos',
+              'bytes_por_celula', 'memoria', 'tempo_construcao',
+              'nos_expandidos_e', 'nos_expandidos_alt', 'economia',
+              'tempo_e', 'tempo_alt']
+    rows = []
+
+    print("Wait...")
+
+    for size in sizes:
+        for ratio in obstacle_ratios:
+            problems = [MazeProblem(size, size, seed, ratio) for seed in seeds]
+
+            # the euclidean baseline, once per maze
+            baseline = []
+            for maze_problem in problems:
+                start_time = time.time()
+                path, cost, n_generated, n_expanded = \
+                    a_star_search(maze_problem, None)
+                baseline.append((cost, n_expanded, time.time() - start_time))
+
+            for strategy in STRATEGIES:
+                for n_landmarks in landmark_counts:
+                    for n_bytes in bytes_per_cell:
+                        results = []
+                        for maze_problem, (cost, _, _) in zip(problems,
+                                                              baseline):
+                            start_time = time.time()
+                            landmarks = LandmarkHeuristic(
+                                maze_problem, n_landmarks, strategy, n_bytes,
+                                seed=0)
+                            # bounds for the goal are part of the build
+                            landmarks.lower_bound(
+                                maze_problem.initial_state(),
+                                maze_problem._goal_state)
+                            build_time = time.time() - start_time
+
+                            maze_problem.set_landmarks(landmarks)
+                            start_time = time.time()
+                            path, alt_cost, n_generated, n_expanded = \
+                                a_star_search(maze_problem, None)
+                            search_time = time.time() - start_time
+                            maze_problem.set_landmarks(None)
+
+                            assert abs(alt_cost - cost) < 1e-6 or \
+                                alt_cost == cost
+                            results.append((landmarks.n_bytes, build_time,
+                                            n_expanded, search_time))
+
+                        n = len(problems)
+                        memory, build_time, alt_expanded, alt_time = \
+                            [sum(r[i] for r in results) / n for i in range(4)]
+                        e_expanded = sum(b[1] for b in baseline) / n
+                        e_time = sum(b[2] for b in baseline) / n
+                        saving = 1 - alt_expanded / max(e_expanded, 1)
+                        rows.append([size, ratio, strategy, n_landmarks,
+                                     n_bytes, memory, build_time, e_expanded,
+                                     alt_expanded, saving, e_time, alt_time])
+
+                        print(f"{size}x{size}, obstacles {ratio:.2f}, "
+                              f"{strategy} x{n_landmarks} ({n_bytes} B): "
+                              f"{saving:.1%} fewer expansions, search "
+                              f"{alt_time:.3f}s vs {e_time:.3f}s, build "
+                              f"{build_time:.3f}s")
+
+    with open('benchmark_alt.csv', 'w', encoding='UTF8', newline='') as f:
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(header)
+        writer.writerows(rows)
+
+    print("OK!")
+
+
+if __name__ == "__main__":
+    main()
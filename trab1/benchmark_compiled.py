@@ -0,0 +1,64 @@
+# Compares a_star_search on MazeProblem with compiled_a_star_search on
+# the precompiled CSR neighbor table and heuristic array.
+# Run from the repository root: python -m trab1.benchmark_compiled
+from trab1.src.problems import MazeProblem
+from trab1.src.search import a_star_search
+from trab1.src.compiled import CompiledMaze, compiled_a_star_search
+import time
+import csv
+
+
+def main():
+    sizes = [100, 200, 400, 800]
+    obstacle_ratio = 0.25
+    seeds = [1, 2, 3]
+
+    header = ['tamanho', 'tempo_a_star', 'tempo_construcao',
+              'tempo_compilado', 'aceleracao', 'aceleracao_com_construcao']
+    rows = []
+
+    print("Wait...")
+
+    for size in sizes:
+        a_star_times, build_times, compiled_times = [], [], []
+        for seed in seeds:
+            maze_problem = MazeProblem(size, size, seed, obstacle_ratio)
+
+            start_time = time.time()
+            path, cost, n_generated, n_expanded = a_star_search(maze_problem,
+                                                                None)
+            a_star_times.append(time.time() - start_time)
+
+            start_time = time.time()
+            compiled = CompiledMaze(maze_problem)
+            build_times.append(time.time() - start_time)
+
+            start_time = time.time()
+            compiled_path, compiled_cost, n_generated, n_expanded = \
+                compiled_a_star_search(maze_problem, None, compiled)
+            compiled_times.append(time.time() - start_time)
+
+            assert abs(compiled_cost - cost) < 1e-6 or compiled_cost == cost
+
+        a_star_time = sum(a_star_times) / len(seeds)
+        build_time = sum(build_times) / len(seeds)
+        compiled_time = sum(compiled_times) / len(seeds)
+        rows.append([size, a_star_time, build_time, compiled_time,
+                     a_star_time / compiled_time,
+                     a_star_time / (build_time + compiled_time)])
+
+        print(f"{size}x{size}: a_star {a_star_time:.3f}s, build "
+              f"{build_time:.3f}s, compiled search {compiled_time:.3f}s "
+              f"({rows[-1][4]:.1f}x, {rows[-1][5]:.1f}x with the build)")
+
+    with open('benchmark_compiled.csv', 'w', encoding='UTF8',
+              newline='') as f:
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(header)
+        writer.writerows(rows)
+
+    print("OK!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# Reports build time, query latency and optimality gap of HPA*
+# (HierarchicalMaze) against exact distances from the wavefront engine.
+# Run from the repository root: python -m trab1.benchmark_hpa
+from trab1.src.problems import MazeProblem
+from trab1.src.hierarchical import HierarchicalMaze
+from trab1.src.wavefront import distance_field
+from math import inf
+import random
+import time
+import csv
+
+
+def main():
+    sizes = [100, 200, 400]
+    cluster_sizes = [8, 16, 32]
+    obstacle_ratio = 0.25
+    seeds = [1, 2, 3]
+    n_queries = 20
+
+    header = ['tamanho', 'cluster', 'tempo_construcao', 'nos_abstratos',
+              'arestas_abstratas', 'tempo_consulta', 'tempo_exato',
+              'gap_medio', 'gap_maximo']
+    rows = []
+
+    print("Wait...")
+
+    for size in sizes:
+        for cluster_size in cluster_sizes:
+            build_times, n_nodes, n_edges = [], [], []
+            query_times, exact_times, gaps = [], [], []
+            for seed in seeds:
+                maze_problem = MazeProblem(size, size, seed, obstacle_ratio)
+                hierarchy = HierarchicalMaze(maze_problem, cluster_size)
+                build_times.append(hierarchy.stats['build_time'])
+                n_nodes.append(hierarchy.stats['n_abstract_nodes'])
+                n_edges.append(hierarchy.stats['n_abstract_edges'])
+
+                # random pairs of free cells; a separate generator, since
+                # the maze was drawn from the global one with this seed
+                rng = random.Random(seed + 1000)
+                free = [(row, col) for row in range(size)
+                        for col in range(size)
+                        if maze_problem._maze[row][col] == 0]
+                for _ in range(n_queries):
+                    start, goal = rng.sample(free, 2)
+
+                    start_time = time.time()
+                    dist, _ = distance_field(maze_problem, start)
+                    exact_times.append(time.time() - start_time)
+
+                    start_time = time.time()
+                    path, cost, n_generated, n_expanded = \
+                        hierarchy.search(None, start, goal)
+                    query_times.append(time.time() - start_time)
+
+                    if dist[goal] < inf and dist[goal] > 0:
+                        gaps.append(cost / dist[goal] - 1)
+
+            rows.append([size, cluster_size,
+                         sum(build_times) / len(build_times),
+                         sum(n_nodes) / len(n_nodes),
+                         sum(n_edges) / len(n_edges),
+                         sum(query_times) / len(query_times),
+                         sum(exact_times) / len(exact_times),
+                         sum(gaps) / max(len(gaps), 1),
+                         max(gaps, default=0)])
+
+            row = rows[-1]
+            print(f"{size}x{size}, clusters {cluster_size}: "
+                  f"build {row[2]:.2f}s, query {row[5] * 1000:.1f}ms "
+                  f"(exact {row[6] * 1000:.1f}ms), "
+                  f"gap {row[7]:.1%} avg / {row[8]:.1%} max")
+
+    with open('benchmark_hpa.csv', 'w', encoding='UTF8', newline='') as f:
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(header)
+        writer.writerows(rows)
+
+    print("OK!")
+
+
+if __name__ == "__main__":
+    main()
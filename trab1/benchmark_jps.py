@@ -0,0 +1,56 @@
+# Compares jump_point_search with a_star_search on random mazes.
+# Run from the repository root: python -m trab1.benchmark_jps
+from trab1.src.problems import MazeProblem
+from trab1.src.search import a_star_search
+from trab1.src.jps import jump_point_search
+import time
+import csv
+
+
+def main():
+    sizes = [50, 100, 200, 400]
+    obstacle_ratios = [0.0, 0.1, 0.25, 0.35]
+    seeds = [1, 2, 3]
+    algorithms = {'a_star': a_star_search, 'jps': jump_point_search}
+
+    header = ['algoritmo', 'tamanho', 'obstaculos', 'custo_medio',
+              'nos_gerados', 'nos_expandidos', 'tempo_medio']
+    rows = []
+
+    print("Wait...")
+
+    for size in sizes:
+        for ratio in obstacle_ratios:
+            results = {name: [] for name in algorithms}
+            for seed in seeds:
+                maze_problem = MazeProblem(size, size, seed, ratio)
+                for name, search in algorithms.items():
+                    start_time = time.time()
+                    path, cost, n_generated, n_expanded = search(maze_problem,
+                                                                 None)
+                    execution_time = time.time() - start_time
+                    results[name].append((cost, n_generated, n_expanded,
+                                          execution_time))
+
+            for name in algorithms:
+                n = len(results[name])
+                averages = [sum(r[i] for r in results[name]) / n
+                            for i in range(4)]
+                rows.append([name, size, ratio] + averages)
+
+            a_star = rows[-2]
+            jps = rows[-1]
+            print(f"{size}x{size}, obstacles {ratio:.2f}: "
+                  f"JPS expanded {jps[5] / max(a_star[5], 1):.1%} of A* "
+                  f"nodes in {jps[6] / max(a_star[6], 1e-9):.1%} of the time")
+
+    with open('benchmark_jps.csv', 'w', encoding='UTF8', newline='') as f:
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(header)
+        writer.writerows(rows)
+
+    print("OK!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Reproducible benchmark of the searches over maze size, obstacle
+# density, seeds and algorithms, with a regression check against a
+# stored baseline. Run from the repository root:
+#   python -m trab1.benchmark_suite                      # run and compare
+#   python -m trab1.benchmark_suite --update-baseline    # store a baseline
+# Exits with status 1 when a case regressed more than --threshold.
+from trab1.src.batch import ALGORITHMS
+from trab1.src.benchmark import compare_with_baseline, load_results_json, \
+    run_suite, write_results_csv, write_results_json
+import argparse
+import os
+import sys
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the searches and compare with a baseline.")
+    parser.add_argument('--algorithms', nargs='+',
+                        default=['dfs', 'a_star', 'uniform'],
+                        choices=sorted(ALGORITHMS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[50, 100, 200])
+    parser.add_argument('--obstacles', nargs='+', type=float,
+                        default=[0.1, 0.25])
+    parser.add_argument('--seeds', nargs='+', type=int, default=[1, 2, 3])
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repetitions', type=int, default=5)
+    parser.add_argument('--output', default='benchmark',
+                        help="results go to OUTPUT.json and OUTPUT.csv")
+    parser.add_argument('--baseline', default='benchmark_baseline.json')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="allowed slowdown, as a fraction")
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args()
+
+    print("Wait...")
+
+    def print_result(result):
+        print(f"{result['algorithm']} {result['size']}x{result['size']}, "
+              f"obstacles {result['obstacle_ratio']:.2f}: median "
+              f"{result['time_median']:.4f}s, p95 {result['time_p95']:.4f}s, "
+              f"expanded {result['expanded_median']}", flush=True)
+
+    results = run_suite(args.algorithms, args.sizes, args.obstacles,
+                        args.seeds, args.warmup, args.repetitions,
+                        on_result=print_result)
+
+    write_results_json(results, args.output + '.json')
+    write_results_csv(results, args.output + '.csv')
+
+    if args.update_baseline:
+        write_results_json(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        regressions = compare_with_baseline(
+            results, load_results_json(args.baseline), args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['algorithm']} {r['size']}x{r['size']}, "
+                  f"obstacles {r['obstacle_ratio']:.2f}: {r['metric']} "
+                  f"{r['baseline']:.4g} -> {r['current']:.4g} "
+                  f"({r['change']:+.1%})")
+        if regressions:
+            sys.exit(1)
+        print("No regressions.")
+    else:
+        print(f"No baseline at {args.baseline}; run with --update-baseline")
+
+    print("OK!")
+
+
+if __name__ == "__main__":
+    main()
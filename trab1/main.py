@@ -2,73 +2,50 @@
 from src.problems import MazeProblem
 from src.viewer import MazeViewer
 from src.search import *
-import time
-import csv
+from src.benchmark import run_suite, write_results_csv, \
+    write_results_json
+from src.profiling import profile_search, write_collapsed_stacks, \
+    write_profile_report
+import sys
 
 
 def main():
-    maze_problem = MazeProblem(20, 20, 42)
-    viewer = MazeViewer(maze_problem, step_time_miliseconds=20, zoom=20)
-    executions_number = 10
-    dic_alg = {'dfs':[], 'a_star':[],
-                                             'uniform':[]}
     print("Wait...")
 
-    # for i in range(executions_number):
-    #     start_time = time.time()
-    #     path, cost, n_generated, n_expanded = depth_first_search(maze_problem,
-    #                                                           None)
-    #     end_time = time.time()
-    #     execution_time = end_time - start_time
-    #     dic_alg['dfs'].append({'path_len': len(path)-1, 'cost': cost,
-    #                            'generated': n_generated, 'expanded': n_expanded,'time':
-    #         execution_time})
-    #
-    #     start_time = time.time()
-    #     path, cost, n_generated, n_expanded = a_star_search(maze_problem, None)
-    #     end_time = time.time()
-    #     execution_time = end_time - start_time
-    #     dic_alg['a_star'].append({'path_len': len(path)-1, 'cost': cost,
-    #                            'generated': n_generated, 'expanded': n_expanded,'time':
-    #         execution_time})
-    #
-    #     start_time = time.time()
-    #     path, cost, n_generated, n_expanded = uniform_search(maze_problem, None)
-    #     end_time = time.time()
-    #     execution_time = end_time - start_time
-    #     dic_alg['uniform'].append({'path_len': len(path)-1, 'cost': cost,
-    #                            'generated': n_generated, 'expanded': n_expanded,'time':
-    #         execution_time})
-    #
-    #
-    # header =['algoritmo', 'custo_medio', 'passos','nos_gerados',
-    #          'nos_expandidos','tempo_medio']
-    #
-    # with open('resultados.csv', 'w', encoding='UTF8', newline='') as f:
-    #     writer = csv.writer(f, delimiter=';')
-    #     writer.writerow(header)
-    #     for metodo in dic_alg:
-    #         custo_medio = 0
-    #         passos = 0
-    #         nos_gerados = 0
-    #         nos_expandidos = 0
-    #         tempo_medio = 0
-    #         for resultado in dic_alg[metodo]:
-    #             custo_medio += resultado['cost']
-    #             passos += resultado['path_len']
-    #             nos_gerados += resultado['generated']
-    #             nos_expandidos += resultado['expanded']
-    #             tempo_medio += resultado['time']
-    #
-    #         custo_medio = custo_medio/executions_number
-    #         passos = passos/executions_number
-    #         nos_gerados = nos_gerados/executions_number
-    #         nos_expandidos = nos_expandidos/executions_number
-    #         tempo_medio = tempo_medio/executions_number
-    #         writer.writerow([metodo, custo_medio, passos, nos_gerados,
-    #                          nos_expandidos, tempo_medio])
+    # python main.py --benchmark: time dfs, A* and uniform on the 20x20
+    # maze and write benchmark.csv and benchmark.json (the full sweep
+    # with baseline comparison is benchmark_suite.py); resultados.csv
+    # keeps the report of the original runs.
+    if '--benchmark' in sys.argv[1:]:
+        results = run_suite(['dfs', 'a_star', 'uniform'], [20], [0.25], [42],
+                            warmup=1, repetitions=10)
+        write_results_csv(results, 'benchmark.csv')
+        write_results_json(results, 'benchmark.json')
+        print("OK!")
+        return
+
+    maze_problem = MazeProblem(20, 20, 42)
+    viewer = MazeViewer(maze_problem, step_time_miliseconds=20, zoom=20)
+    # python main.py --profile (cProfile and tracemalloc) or
+    # --profile=sample (sampling only, much lighter): write the hotspots
+    # of the search to perfil.txt and its stacks to perfil.folded
+    # (flamegraph.pl perfil.folded > perfil.svg)
+    profile_mode = None
+    for arg in sys.argv[1:]:
+        if arg == '--profile':
+            profile_mode = 'cprofile'
+        elif arg.startswith('--profile='):
+            profile_mode = arg.split('=', 1)[1]
 
-    path, cost, n_generated, n_expanded = depth_first_search(maze_problem, viewer)
+    if profile_mode is not None:
+        (path, cost, n_generated, n_expanded), report = profile_search(
+            depth_first_search, maze_problem, viewer, mode=profile_mode,
+            trace_memory=profile_mode == 'cprofile')
+        write_profile_report(report, 'perfil.txt')
+        write_collapsed_stacks(report, 'perfil.folded')
+    else:
+        path, cost, n_generated, n_expanded = depth_first_search(maze_problem,
+                                                                 viewer)
 
     if len(path) == 0:
         print("Goal is unreachable for this maze.")
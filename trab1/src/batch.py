@@ -0,0 +1,151 @@
+import importlib
+import os
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from math import inf
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, \
+    Optional, Tuple
+
+from trab1.src.problems import MazeProblem
+
+# algorithm name -> (module, function). The functions are imported in
+# the worker, so modules with extra dependencies (NumPy) are only
+# loaded when a job uses them.
+ALGORITHMS: Dict[str, Tuple[str, str]] = {
+    'dfs': ('trab1.src.search', 'depth_first_search'),
+    'uniform': ('trab1.src.search', 'uniform_search'),
+    'a_star': ('trab1.src.search', 'a_star_search'),
+    'bidirectional_bfs': ('trab1.src.search',
+                          'bidirectional_breadth_first_search'),
+    'bidirectional_a_star': ('trab1.src.search',
+                             'bidirectional_a_star_search'),
+    'ida_star': ('trab1.src.search', 'ida_star_search'),
+    'greedy': ('trab1.src.search', 'greedy_best_first_search'),
+    'beam': ('trab1.src.search', 'beam_search'),
+    'jps': ('trab1.src.jps', 'jump_point_search'),
+    'wavefront': ('trab1.src.wavefront', 'wavefront_search'),
+}
+
+
+class Job(NamedTuple):
+    """ One batch entry: an algorithm run repetitions times on the maze
+    MazeProblem(n_rows, n_cols, seed, obstacle_ratio). """
+    algorithm: str
+    n_rows: int
+    n_cols: int
+    seed: int
+    obstacle_ratio: float = 0.25
+    repetitions: int = 1
+
+
+class JobResult(NamedTuple):
+    """ Outcome of a Job. status is 'ok', 'timeout' or 'error' (with
+    the message in error). cost, path_len and the counters come from
+    the last repetition; times has one entry per finished repetition. """
+    index: int
+    job: Job
+    status: str
+    cost: float = inf
+    path_len: int = -1
+    n_generated: float = 0
+    n_expanded: float = 0
+    times: Tuple[float, ...] = ()
+    error: str = ''
+
+
+class _JobTimeout(Exception):
+    pass
+
+
+def run_job(index: int, job: Job, timeout: Optional[float] = None) -> JobResult:
+    """ Run a job in the current process.
+
+    The maze is built from the job's seed, so a job gives the same
+    cost and counters wherever and in whatever order it runs. If
+    timeout (seconds, for all the repetitions) expires the search is
+    interrupted with SIGALRM; on platforms without it the timeout is
+    not enforced.
+    """
+    module, name = ALGORITHMS[job.algorithm]
+    search = getattr(importlib.import_module(module), name)
+    problem = MazeProblem(job.n_rows, job.n_cols, job.seed, job.obstacle_ratio)
+
+    use_alarm = timeout is not None and hasattr(signal, 'setitimer')
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    times: List[float] = []
+    result = None
+    status, error = 'ok', ''
+    try:
+        for _ in range(job.repetitions):
+            start_time = time.perf_counter()
+            result = search(problem, None)
+            times.append(time.perf_counter() - start_time)
+    except _JobTimeout:
+        status = 'timeout'
+    except Exception as e:
+        status, error = 'error', f"{type(e).__name__}: {e}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    if status != 'ok' or result is None:
+        return JobResult(index, job, status, times=tuple(times), error=error)
+
+    path, cost, n_generated, n_expanded = result
+    return JobResult(index, job, status, cost, len(path) - 1,
+                     n_generated, n_expanded, tuple(times))
+
+
+def iter_batch(jobs: Iterable[Job], n_workers: Optional[int] = None,
+               timeout: Optional[float] = None) -> Iterator[JobResult]:
+    """ Run jobs in a process pool and yield each result as it finishes.
+
+    Results arrive in completion order; JobResult.index is the position
+    of the job in jobs, so callers that need the input order can sort
+    by it (see run_batch). n_workers defaults to the number of CPUs.
+    Raises ValueError, before any job runs, for an unknown algorithm or
+    fewer than 1 repetition.
+    """
+    jobs = list(jobs)
+    for job in jobs:
+        if job.algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown algorithm: {job.algorithm}")
+        if job.repetitions < 1:
+            raise ValueError(f"repetitions must be at least 1, "
+                             f"got {job.repetitions}")
+
+    n_workers = n_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=min(n_workers, max(len(jobs), 1))) \
+            as executor:
+        pending = {executor.submit(run_job, i, job, timeout)
+                   for i, job in enumerate(jobs)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def run_batch(jobs: Iterable[Job], n_workers: Optional[int] = None,
+              timeout: Optional[float] = None,
+              on_result: Optional[Callable[[JobResult], None]] = None) \
+        -> List[JobResult]:
+    """ Run jobs in a process pool and return the results in job order.
+
+    on_result is called with each result as soon as it finishes.
+    """
+    results = []
+    for result in iter_batch(jobs, n_workers, timeout):
+        if on_result is not None:
+            on_result(result)
+        results.append(result)
+    results.sort(key=lambda r: r.index)
+    return results
+
+
+def _raise_timeout(signum, frame):
+    raise _JobTimeout()
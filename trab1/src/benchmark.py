@@ -0,0 +1,148 @@
+import csv
+import importlib
+import json
+import math
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from trab1.src.batch import ALGORITHMS
+from trab1.src.problems import MazeProblem
+
+# fields of each result, in the order of the CSV columns
+FIELDS = ('algorithm', 'size', 'obstacle_ratio', 'n_runs', 'time_median',
+          'time_p95', 'expanded_median', 'generated_median', 'cost_mean',
+          'n_unsolved')
+
+
+def run_suite(algorithms: Iterable[str], sizes: Iterable[int],
+              obstacle_ratios: Iterable[float], seeds: Iterable[int],
+              warmup: int = 1, repetitions: int = 5,
+              on_result: Optional[Callable[[Dict[str, Any]], None]] = None) \
+        -> List[Dict[str, Any]]:
+    """ Time every algorithm on every (size, obstacle ratio) of the sweep.
+
+    Each seed gives one maze; on it the algorithm runs warmup times
+    untimed (imports, caches, allocator) and then repetitions timed
+    times. The runs of all the seeds of a (size, ratio) are summarized
+    in one result dictionary with the FIELDS keys: median and 95th
+    percentile time, median expanded and generated counters, mean cost
+    of the solved mazes and how many were unsolved. on_result is
+    called with each result as soon as it is ready.
+    """
+    searches = {}
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            raise ValueError(f"unknown algorithm: {name}")
+        module, function = ALGORITHMS[name]
+        searches[name] = getattr(importlib.import_module(module), function)
+
+    seeds = list(seeds)
+    results = []
+    for size in sizes:
+        for ratio in obstacle_ratios:
+            problems = [MazeProblem(size, size, seed, ratio) for seed in seeds]
+            for name, search in searches.items():
+                times, expanded, generated, costs = [], [], [], []
+                n_unsolved = 0
+                for maze_problem in problems:
+                    for _ in range(warmup):
+                        search(maze_problem, None)
+                    for _ in range(repetitions):
+                        start_time = time.perf_counter()
+                        path, cost, n_generated, n_expanded = \
+                            search(maze_problem, None)
+                        times.append(time.perf_counter() - start_time)
+                    # the counters and the cost do not change between
+                    # repetitions
+                    expanded.append(n_expanded)
+                    generated.append(n_generated)
+                    if path:
+                        costs.append(cost)
+                    else:
+                        n_unsolved += 1
+
+                result = {
+                    'algorithm': name,
+                    'size': size,
+                    'obstacle_ratio': ratio,
+                    'n_runs': len(times),
+                    'time_median': statistics.median(times),
+                    'time_p95': _percentile(times, 0.95),
+                    'expanded_median': statistics.median(expanded),
+                    'generated_median': statistics.median(generated),
+                    'cost_mean': sum(costs) / len(costs) if costs else None,
+                    'n_unsolved': n_unsolved,
+                }
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+    return results
+
+
+def compare_with_baseline(results: Iterable[Dict[str, Any]],
+                          baseline: Iterable[Dict[str, Any]],
+                          threshold: float = 0.1) -> List[Dict[str, Any]]:
+    """ Return the regressions of results against a baseline.
+
+    Results are matched to the baseline by algorithm, size and
+    obstacle ratio. A regression is a median time or median expanded
+    count more than threshold (a fraction) above the baseline's; each
+    one is returned as {'algorithm', 'size', 'obstacle_ratio',
+    'metric', 'baseline', 'current', 'change'}. Cases missing from the
+    baseline are not compared.
+    """
+    reference = {_key(r): r for r in baseline}
+    regressions = []
+    for result in results:
+        old = reference.get(_key(result))
+        if old is None:
+            continue
+        for metric in ('time_median', 'expanded_median'):
+            before, now = old[metric], result[metric]
+            if before and now > before * (1 + threshold):
+                regressions.append({
+                    'algorithm': result['algorithm'],
+                    'size': result['size'],
+                    'obstacle_ratio': result['obstacle_ratio'],
+                    'metric': metric,
+                    'baseline': before,
+                    'current': now,
+                    'change': now / before - 1,
+                })
+    return regressions
+
+
+def write_results_json(results: List[Dict[str, Any]],
+                       file_name: str = 'benchmark.json') -> None:
+    # the machine is recorded so baselines from other machines are
+    # recognizable
+    with open(file_name, 'w', encoding='UTF8') as f:
+        json.dump({'machine': platform.platform(),
+                   'python': platform.python_version(),
+                   'results': results}, f, indent=2)
+
+
+def write_results_csv(results: List[Dict[str, Any]],
+                      file_name: str = 'benchmark.csv') -> None:
+    with open(file_name, 'w', encoding='UTF8', newline='') as f:
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(FIELDS)
+        for result in results:
+            writer.writerow([result[field] for field in FIELDS])
+
+
+def load_results_json(file_name: str) -> List[Dict[str, Any]]:
+    with open(file_name, encoding='UTF8') as f:
+        return json.load(f)['results']
+
+
+def _key(result: Dict[str, Any]) -> tuple:
+    return result['algorithm'], result['size'], result['obstacle_ratio']
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    # nearest-rank percentile
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
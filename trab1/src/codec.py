@@ -0,0 +1,72 @@
+from typing import Any, Callable, Iterable, List
+
+from trab1.src.problems import ProblemInterface
+from trab1.src.viewer import ViewerInterface
+
+
+class CodecProblem(ProblemInterface):
+    """ View of a problem with a codec whose states are the packed ints.
+
+    Every call decodes its states, runs on the wrapped problem and
+    encodes the states it returns, so a search running on this view
+    only stores and hashes ints: its closed list, frontier index and
+    node store hold codes, never the original states. Actions are
+    passed through unchanged.
+    """
+
+    def __init__(self, problem: ProblemInterface):
+        self._problem = problem
+        self._encode = problem.encode
+        self._decode = problem.decode
+
+        # frontiers handed out by the problem hold codes just as well
+        # (see frontier.make_frontier)
+        factory = getattr(problem, 'frontier_factory', None)
+        if factory is not None:
+            self.frontier_factory = factory
+
+    def actions(self, code: int) -> List[Any]:
+        return self._problem.actions(self._decode(code))
+
+    def transition(self, code: int, action: Any) -> int:
+        return self._encode(self._problem.transition(self._decode(code),
+                                                     action))
+
+    def step_cost(self, state, action, next_state) -> float:
+        # state and next_state are codes; the names match the keyword
+        # arguments the searches use
+        return self._problem.step_cost(self._decode(state), action,
+                                       self._decode(next_state))
+
+    def heuristic_cost(self, code, *args) -> float:
+        return self._problem.heuristic_cost(self._decode(code), *args)
+
+    def initial_state(self) -> int:
+        return self._encode(self._problem.initial_state())
+
+    def is_goal(self, code) -> bool:
+        return self._problem.is_goal(self._decode(code))
+
+    def reversed(self) -> "CodecProblem":
+        return CodecProblem(self._problem.reversed())
+
+
+class DecodingViewer(ViewerInterface):
+    # shows the decoded states on a viewer of the original problem
+
+    def __init__(self, viewer: ViewerInterface, decode: Callable[[int], Any]):
+        self._viewer = viewer
+        self._decode = decode
+
+    def update(self, state=None, generated=[], expanded=[], path=[]):
+        self._viewer.update(
+            None if state is None else self._decode(state),
+            generated=self._decoded(generated),
+            expanded=self._decoded(expanded),
+            path=self._decoded(path))
+
+    def pause(self) -> None:
+        self._viewer.pause()
+
+    def _decoded(self, codes: Iterable) -> list:
+        return [self._decode(getattr(code, 'state', code)) for code in codes]
@@ -0,0 +1,158 @@
+import heapq
+from math import inf
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from trab1.src.problems import MazeProblem
+from trab1.src.search import Node, _path_cost
+from trab1.src.viewer import ViewerInterface
+from trab1.src.wavefront import _MOVE_COSTS, _MOVES
+
+Cell = Tuple[int, int]
+
+
+class CompiledMaze:
+    """ Neighbor table and heuristic of a MazeProblem, built once.
+
+    Cells are numbered row * n_cols + col. The neighbors of cell i are
+    indices[indptr[i]:indptr[i + 1]] (CSR layout), in the order of
+    MazeProblem.actions, with the step costs at the same positions of
+    costs; h[i] is the euclidean distance from cell i to the goal.
+    Everything is built with whole-array NumPy operations and then
+    kept as Python lists, which are faster than NumPy arrays for the
+    one-element reads of a search loop.
+
+    The table describes the maze when it was built: after set_cell the
+    maze has to be compiled again (see is_current).
+    """
+
+    def __init__(self, problem: MazeProblem):
+        n_rows, n_cols = problem.n_rows, problem.n_cols
+        self.n_cols = n_cols
+        self.goal = problem._goal_state
+        self._version = problem._version
+
+        # padded maze, so the neighbors are at fixed flat offsets
+        width = n_cols + 2
+        free = np.zeros((n_rows + 2, width), dtype=bool)
+        free[1:-1, 1:-1] = np.asarray(problem._maze) == 0
+        free = free.ravel()
+        cells = ((np.arange(n_rows)[:, None] + 1) * width +
+                 np.arange(n_cols)[None, :] + 1).ravel()
+        offsets = np.array([d_row * width + d_col for d_row, d_col in _MOVES])
+
+        # valid[i, k]: move k from cell i ends in a free cell
+        targets = cells[:, None] + offsets
+        valid = free[targets] & free[cells][:, None]
+
+        counts = valid.sum(axis=1)
+        indptr = np.zeros(len(cells) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        # nonzero walks valid row by row, so the neighbors of each cell
+        # are contiguous and in move order
+        cell_of, move_of = np.nonzero(valid)
+        padded = targets[cell_of, move_of]
+        indices = (padded // width - 1) * n_cols + padded % width - 1
+
+        rows, cols = np.divmod(np.arange(n_rows * n_cols), n_cols)
+        h = np.sqrt((rows - self.goal[0]) ** 2 + (cols - self.goal[1]) ** 2)
+
+        self.indptr: List[int] = indptr.tolist()
+        self.indices: List[int] = indices.tolist()
+        self.costs: List[float] = _MOVE_COSTS[move_of].tolist()
+        self.h: List[float] = h.tolist()
+
+    def is_current(self, problem: MazeProblem) -> bool:
+        """ Check that the maze and goal did not change since the build. """
+        return problem._version == self._version and \
+            problem._goal_state == self.goal
+
+    def index(self, cell: Cell) -> int:
+        return cell[0] * self.n_cols + cell[1]
+
+    def cell(self, index: int) -> Cell:
+        return divmod(index, self.n_cols)
+
+
+def compiled_a_star_search(problem: MazeProblem, viewer: ViewerInterface = None,
+                           compiled: Optional[CompiledMaze] = None,
+                           weight: float = 1.0) \
+        -> Tuple[List[Node], float, float, float]:
+    """ A* over the CSR neighbor table of a CompiledMaze.
+
+    Same search as a_star_search, but states are cell indices, the
+    neighbors and step costs are read from the table and the heuristic
+    from the per-cell array, so no tuples are built or hashed and no
+    square roots are taken while searching. compiled is built here
+    when not given (or out of date); pass one to reuse it across
+    queries to the same goal. weight = 0 gives uniform cost search.
+    """
+    if compiled is None or not compiled.is_current(problem):
+        compiled = CompiledMaze(problem)
+    indptr, indices, costs, h = \
+        compiled.indptr, compiled.indices, compiled.costs, compiled.h
+
+    start = compiled.index(problem.initial_state())
+    goal = compiled.index(problem._goal_state)
+
+    n_cells = len(h)
+    g = [inf] * n_cells
+    parent = [-1] * n_cells
+    closed = bytearray(n_cells)
+
+    n_generated = 0
+    n_expanded = 0
+
+    # heap of [f, insertion order, cell]; entries whose cell was reached
+    # again with a lower g are skipped when popped (lazy deletion)
+    g[start] = 0.0
+    heap = [(weight * h[start], 0, start)]
+    counter = 1
+    found = False
+
+    while heap:
+        _, _, current = heapq.heappop(heap)
+        if closed[current]:
+            continue
+        if current == goal:
+            found = True
+            break
+        closed[current] = 1
+        n_expanded += 1
+
+        current_g = g[current]
+        for k in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[k]
+            new_cost = current_g + costs[k]
+            if new_cost < g[neighbor] and not closed[neighbor]:
+                if g[neighbor] == inf:
+                    n_generated += 1
+                g[neighbor] = new_cost
+                parent[neighbor] = current
+                heapq.heappush(heap, (new_cost + weight * h[neighbor],
+                                      counter, neighbor))
+                counter += 1
+
+        if viewer is not None:
+            viewer.update(compiled.cell(current),
+                          generated=[compiled.cell(i) for _, _, i in heap
+                                     if not closed[i]],
+                          expanded=[compiled.cell(i) for i in range(n_cells)
+                                    if closed[i]])
+
+    path = []
+    if found:
+        cells = [goal]
+        while cells[-1] != start:
+            cells.append(parent[cells[-1]])
+        previous_node = None
+        for index in reversed(cells):
+            cell = compiled.cell(index)
+            previous_node = Node(cell, cell if previous_node else None,
+                                 previous_node)
+            path.append(previous_node)
+    cost = _path_cost(problem, path)
+
+    return path, cost, n_generated, n_expanded
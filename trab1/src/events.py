@@ -0,0 +1,176 @@
+import time
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, \
+    Optional, Tuple
+
+from trab1.src.problems import ProblemInterface
+from trab1.src.search import Node, _best_first_steps, _breadth_first_steps, \
+    _depth_first_steps, _run
+from trab1.src.viewer import ViewerInterface
+
+ALGORITHMS = ('bfs', 'dfs', 'uniform', 'a_star')
+
+# event kinds that are always delivered, whatever the throttling
+_FINAL_KINDS = ('goal', 'done')
+
+
+class SearchEvent(NamedTuple):
+    """ One step of a search run by iter_search.
+
+    kind is 'generate' (state entered the frontier, or its g improved,
+    with parent the state it was reached from), 'expand' (state left
+    the frontier and its neighbors are generated next), 'goal' (state
+    is the goal) or 'done' (last event; result holds the usual
+    (path, cost, n_generated, n_expanded) tuple). g is the cost of the
+    path to the state for 'uniform' and 'a_star', 0 for 'bfs' and
+    'dfs'.
+    """
+    kind: str
+    state: Any = None
+    g: float = 0.0
+    parent: Any = None
+    result: Optional[Tuple[List[Node], float, float, float]] = None
+
+
+def iter_search(problem: ProblemInterface, algorithm: str = 'a_star',
+                weight: float = 1.0) -> Iterator[SearchEvent]:
+    """ Run a search as a stream of SearchEvents.
+
+    algorithm is 'bfs', 'dfs', 'uniform' or 'a_star' (g + weight * h).
+    The events come from the loop of breadth_first_search,
+    depth_first_search, uniform_search and a_star_search themselves,
+    so the 'done' result is the one the function returns (with the
+    counters for 'bfs' too). Nothing is rendered or stored for the
+    consumer: it decides what to do with each event, so the search
+    can be paused, decimated or stopped by the consumer at any event.
+    """
+    steps = _steps(problem, algorithm, weight, events=True)
+    while True:
+        try:
+            kind, state, g, parent = next(steps)
+        except StopIteration as stop:
+            yield SearchEvent('done', result=stop.value)
+            return
+        yield SearchEvent(kind, state, g, parent)
+
+
+def _steps(problem: ProblemInterface, algorithm: str, weight: float,
+           events: bool) -> Iterator[Tuple[str, Any, float, Any]]:
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"unknown algorithm: {algorithm}")
+    if algorithm == 'bfs':
+        return _breadth_first_steps(problem, events=events)
+    if algorithm == 'dfs':
+        return _depth_first_steps(problem, events=events)
+    if algorithm == 'uniform':
+        weight = 0.0
+    return _best_first_steps(problem, weight=weight, events=events)
+
+
+class EventStream:
+    """ Runs a search and dispatches its events to subscribers.
+
+        stream = EventStream(maze_problem, 'a_star')
+        stream.subscribe(ViewerSubscriber(viewer, every=50))
+        path, cost, n_generated, n_expanded = stream.run()
+
+    Each subscriber can ask for some event kinds only, every n-th of
+    them, or at most one per min_interval seconds ('goal' and 'done'
+    events always get through). With no subscribers run() runs the same
+    search loop without events, so headless runs do not pay for them
+    and give the same result.
+    """
+
+    def __init__(self, problem: ProblemInterface, algorithm: str = 'a_star'):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown algorithm: {algorithm}")
+        self._problem = problem
+        self._algorithm = algorithm
+        self._subscribers: List[_Subscription] = []
+
+    def subscribe(self, callback: Callable[[SearchEvent], None],
+                  kinds: Optional[Iterable[str]] = None, every: int = 1,
+                  min_interval: float = 0.0) -> Callable[[], None]:
+        """ Call callback(event) for the selected events of the next
+        runs; returns a function that cancels the subscription. """
+        subscription = _Subscription(callback, kinds, every, min_interval)
+        self._subscribers.append(subscription)
+        return lambda: self._subscribers.remove(subscription)
+
+    def run(self) -> Tuple[List[Node], float, float, float]:
+        if not self._subscribers:
+            return _run(_steps(self._problem, self._algorithm, 1.0,
+                               events=False))
+
+        result = None
+        for event in iter_search(self._problem, self._algorithm):
+            for subscription in self._subscribers:
+                subscription.deliver(event)
+            if event.kind == 'done':
+                result = event.result
+        return result
+
+
+class _Subscription:
+    def __init__(self, callback: Callable[[SearchEvent], None],
+                 kinds: Optional[Iterable[str]], every: int,
+                 min_interval: float):
+        self._callback = callback
+        self._kinds = None if kinds is None else frozenset(kinds)
+        self._every = max(1, every)
+        self._min_interval = min_interval
+        self._count = 0
+        self._last_time = -min_interval
+
+    def deliver(self, event: SearchEvent) -> None:
+        if event.kind not in _FINAL_KINDS:
+            if self._kinds is not None and event.kind not in self._kinds:
+                return
+            self._count += 1
+            if self._count % self._every:
+                return
+            if self._min_interval > 0:
+                now = time.perf_counter()
+                if now - self._last_time < self._min_interval:
+                    return
+                self._last_time = now
+        self._callback(event)
+
+
+class ViewerSubscriber:
+    """ Draws a search on a ViewerInterface from its events.
+
+    The generated and expanded states are tracked from every event,
+    but the viewer is only updated on every n-th expansion (and at
+    most once per min_interval seconds), and once more with the path
+    at the end. Subscribe it without throttling, since it needs all
+    the events to keep its sets complete.
+    """
+
+    def __init__(self, viewer: ViewerInterface, every: int = 1,
+                 min_interval: float = 0.0):
+        self._viewer = viewer
+        self._every = max(1, every)
+        self._min_interval = min_interval
+        self._generated = set()
+        self._expanded = set()
+        self._n_expanded = 0
+        self._last_time = -min_interval
+
+    def __call__(self, event: SearchEvent) -> None:
+        if event.kind == 'generate':
+            self._generated.add(event.state)
+        elif event.kind == 'expand':
+            self._generated.discard(event.state)
+            self._expanded.add(event.state)
+            self._n_expanded += 1
+            if self._n_expanded % self._every == 0:
+                now = time.perf_counter()
+                if now - self._last_time >= self._min_interval:
+                    self._last_time = now
+                    self._viewer.update(event.state,
+                                        generated=self._generated,
+                                        expanded=self._expanded)
+        elif event.kind == 'done':
+            self._viewer.update(generated=self._generated,
+                                expanded=self._expanded,
+                                path=event.result[0])
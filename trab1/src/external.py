@@ -0,0 +1,226 @@
+import heapq
+import os
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, \
+    Tuple
+
+import numpy as np
+
+from trab1.src.problems import ProblemInterface
+from trab1.src.search import Node, _action_to, _path_cost
+from trab1.src.viewer import ViewerInterface
+
+# codes read from a run file at a time
+_CHUNK = 1 << 16
+
+
+def external_breadth_first_search(problem: ProblemInterface,
+                                  viewer: ViewerInterface = None,
+                                  work_dir: Optional[str] = None,
+                                  memory_limit: int = 1_000_000,
+                                  stats: Optional[Dict[str, Any]] = None) \
+        -> Tuple[List[Node], float, float, float]:
+    """ Breadth-first search with the layers kept on disk.
+
+    States are packed into ints with the problem's codec (encode and
+    decode, or the dense state_index and index_state of MazeProblem).
+    Each BFS layer and the set of visited states are sorted files of
+    int64 codes, read through np.memmap. The successors of a layer
+    are buffered in memory up to memory_limit codes, then sorted and
+    written as a run file; once the layer is expanded the runs are
+    merged and the codes already visited are dropped by merging with
+    the visited file (delayed duplicate detection). Memory is bounded
+    by memory_limit codes plus one chunk per open file, whatever the
+    size of the state space.
+
+    With a goal the search stops at the layer where it is generated
+    and the path is rebuilt by scanning the previous layers on disk for
+    a predecessor of each state. Without one (or when it is not
+    reachable) the whole reachable space is enumerated. Files go to
+    work_dir (a temporary directory by default, removed at the end).
+    If a stats dictionary is given it is filled with the size of each
+    layer, the number of reachable states found and the peak bytes
+    on disk.
+    """
+    encode, decode = _codec(problem)
+    own_dir = work_dir is None
+    work_dir = tempfile.mkdtemp(prefix='external_bfs_') if own_dir \
+        else work_dir
+    os.makedirs(work_dir, exist_ok=True)
+
+    n_generated = 1
+    n_expanded = 0
+    layer_sizes = [1]
+    peak_disk = 0
+    goal_code = None
+    try:
+        start = problem.initial_state()
+        layers = [_write(os.path.join(work_dir, 'layer_0.bin'),
+                         [encode(start)])]
+        visited = layers[0]
+        if problem.is_goal(start):
+            goal_code = encode(start)
+
+        depth = 0
+        while goal_code is None and layer_sizes[-1] > 0:
+            depth += 1
+            runs = []
+            buffer: List[int] = []
+            for code in _read(layers[-1]):
+                state = decode(code)
+                n_expanded += 1
+                for action in problem.actions(state):
+                    next_state = problem.transition(state, action)
+                    n_generated += 1
+                    next_code = encode(next_state)
+                    if problem.is_goal(next_state):
+                        goal_code = next_code
+                    buffer.append(next_code)
+                    if len(buffer) >= memory_limit:
+                        runs.append(_write_run(work_dir, depth, len(runs),
+                                               buffer))
+                        buffer = []
+                if goal_code is not None:
+                    break
+            if buffer:
+                runs.append(_write_run(work_dir, depth, len(runs), buffer))
+
+            peak_disk = max(peak_disk, _disk_usage(work_dir))
+
+            # new layer: merged runs minus the visited states
+            layer = os.path.join(work_dir, f'layer_{depth}.bin')
+            size = _write_stream(layer, _difference(
+                _unique(heapq.merge(*(_read(run) for run in runs))),
+                _read(visited)))
+            for run in runs:
+                os.remove(run)
+            layers.append(layer)
+            layer_sizes.append(size)
+
+            # visited states: merge of the old file and the new layer
+            merged = os.path.join(work_dir, f'visited_{depth}.bin')
+            _write_stream(merged, heapq.merge(_read(visited), _read(layer)))
+            if visited != layers[0]:
+                os.remove(visited)
+            visited = merged
+
+            if viewer is not None:
+                viewer.update(None,
+                              generated=[decode(c) for c in _read(layer)],
+                              expanded=[])
+
+        path = []
+        if goal_code is not None:
+            path = _rebuild_path(problem, encode, decode, layers, goal_code)
+        cost = _path_cost(problem, path)
+
+        if stats is not None:
+            stats['layer_sizes'] = layer_sizes
+            stats['n_reached'] = sum(layer_sizes)
+            stats['peak_disk_bytes'] = peak_disk
+    finally:
+        if own_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    return path, cost, n_generated, n_expanded
+
+
+def _codec(problem: ProblemInterface) \
+        -> Tuple[Callable[[Any], int], Callable[[int], Any]]:
+    if problem.has_codec():
+        return problem.encode, problem.decode
+    if hasattr(problem, 'state_index') and hasattr(problem, 'index_state'):
+        return problem.state_index, problem.index_state
+    raise ValueError("external_breadth_first_search needs a problem with "
+                     "an integer codec (see ProblemInterface.has_codec)")
+
+
+def _rebuild_path(problem: ProblemInterface, encode: Callable[[Any], int],
+                  decode: Callable[[int], Any], layers: List[str],
+                  goal_code: int) -> List[Node]:
+    # walk back one layer at a time: the predecessor of a state is any
+    # state of the previous layer that has it as a successor. The last
+    # layer file may hold states generated after the goal, so it is
+    # not used.
+    codes = [goal_code]
+    for layer in reversed(layers[:-1]):
+        target = codes[-1]
+        for code in _read(layer):
+            state = decode(code)
+            if any(encode(problem.transition(state, action)) == target
+                   for action in problem.actions(state)):
+                codes.append(code)
+                break
+    codes.reverse()
+
+    path = []
+    previous_node = None
+    for code in codes:
+        state = decode(code)
+        action = None if previous_node is None else \
+            _action_to(problem, previous_node.state, state)
+        previous_node = Node(state, action, previous_node)
+        path.append(previous_node)
+    return path
+
+
+def _write(file_name: str, codes: List[int]) -> str:
+    np.array(codes, dtype=np.int64).tofile(file_name)
+    return file_name
+
+
+def _write_run(work_dir: str, depth: int, index: int, codes: List[int]) -> str:
+    return _write(os.path.join(work_dir, f'run_{depth}_{index}.bin'),
+                  np.unique(np.array(codes, dtype=np.int64)))
+
+
+def _write_stream(file_name: str, codes: Iterable[int]) -> int:
+    # write a stream of codes in chunks; returns how many were written
+    size = 0
+    with open(file_name, 'wb') as f:
+        chunk = []
+        for code in codes:
+            chunk.append(code)
+            if len(chunk) >= _CHUNK:
+                np.array(chunk, dtype=np.int64).tofile(f)
+                size += len(chunk)
+                chunk = []
+        np.array(chunk, dtype=np.int64).tofile(f)
+        size += len(chunk)
+    return size
+
+
+def _read(file_name: str) -> Iterator[int]:
+    # stream the codes of a file through a memory map, a chunk at a time
+    if os.path.getsize(file_name) == 0:
+        return
+    codes = np.memmap(file_name, dtype=np.int64, mode='r')
+    for start in range(0, len(codes), _CHUNK):
+        yield from codes[start:start + _CHUNK].tolist()
+    del codes
+
+
+def _unique(codes: Iterable[int]) -> Iterator[int]:
+    # drop repeated codes of a sorted stream
+    last = None
+    for code in codes:
+        if code != last:
+            yield code
+            last = code
+
+
+def _difference(codes: Iterable[int], removed: Iterable[int]) -> Iterator[int]:
+    # codes of a sorted stream that are not in another sorted stream
+    removed = iter(removed)
+    current = next(removed, None)
+    for code in codes:
+        while current is not None and current < code:
+            current = next(removed, None)
+        if current != code:
+            yield code
+
+
+def _disk_usage(work_dir: str) -> int:
+    return sum(os.path.getsize(os.path.join(work_dir, name))
+               for name in os.listdir(work_dir))
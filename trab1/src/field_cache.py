@@ -0,0 +1,113 @@
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from trab1.src.problems import MazeProblem
+from trab1.src.search import Node, _path_cost
+from trab1.src.viewer import ViewerInterface
+from trab1.src.wavefront import distance_field
+
+Cell = Tuple[int, int]
+
+
+class DistanceFieldCache:
+    """ LRU cache of goal-rooted distance fields of MazeProblem mazes.
+
+    The first query for a goal runs a reverse Dijkstra from the goal
+    over the whole maze (see wavefront.distance_field). Moves are
+    symmetric, so the parent field of that search is the next hop
+    towards the goal from every cell, and later queries for the same
+    maze and goal are answered by following it, in O(path length).
+
+    Fields are keyed by the identity of the maze grid and the goal and
+    are rebuilt when the maze changed since they were built (changes
+    must go through MazeProblem.set_cell, or the caller must call
+    invalidate). At most max_size fields are kept; the least recently
+    used one is dropped first.
+    """
+
+    def __init__(self, max_size: int = 8):
+        self._max_size = max_size
+        self._fields: OrderedDict = OrderedDict()
+
+    def field(self, problem: MazeProblem, goal: Optional[Cell] = None) \
+            -> Tuple[np.ndarray, np.ndarray]:
+        """ Return the (distance, next hop) fields of the goal. """
+        entry, _ = self._entry(problem, goal)
+        return entry[2], entry[3]
+
+    def search(self, problem: MazeProblem, viewer: ViewerInterface = None,
+               start: Optional[Cell] = None, goal: Optional[Cell] = None) \
+            -> Tuple[List[Node], float, float, float]:
+        # start and goal default to the ones of the problem. The
+        # counters are the cells processed to build the field, 0 when
+        # it came from the cache.
+        if start is None:
+            start = problem.initial_state()
+        (_, _, dist, next_hop), n_reached = self._entry(problem, goal)
+
+        path = []
+        if dist[start] < np.inf:
+            flat_next_hop = next_hop.ravel()
+            n_cols = problem.n_cols
+            previous_node = Node(start)
+            path.append(previous_node)
+            index = flat_next_hop[start[0] * n_cols + start[1]]
+            while index >= 0:
+                state = (int(index // n_cols), int(index % n_cols))
+                previous_node = Node(state, state, previous_node)
+                path.append(previous_node)
+                index = flat_next_hop[index]
+        cost = _path_cost(problem, path)
+
+        if viewer is not None:
+            viewer.update(start, path=path)
+
+        return path, cost, n_reached, n_reached
+
+    def invalidate(self, problem: Optional[MazeProblem] = None) -> None:
+        """ Drop the fields of the problem's maze (all fields if None). """
+        if problem is None:
+            self._fields.clear()
+            return
+        for key in [k for k in self._fields if k[0] == id(problem._maze)]:
+            del self._fields[key]
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def _entry(self, problem: MazeProblem, goal: Optional[Cell]) \
+            -> Tuple[Tuple[Any, ...], int]:
+        # return the cache entry and the number of cells processed to
+        # build it (0 on a hit)
+        if goal is None:
+            goal = problem._goal_state
+        key = (id(problem._maze), goal)
+
+        entry = self._fields.get(key)
+        # the maze is kept in the entry, so its id cannot be reused
+        # by another maze while the entry exists.
+        if entry is not None and entry[1] == problem._version:
+            self._fields.move_to_end(key)
+            return entry, 0
+
+        dist, next_hop = distance_field(problem, source=goal)
+        entry = (problem._maze, problem._version, dist, next_hop)
+        self._fields[key] = entry
+        self._fields.move_to_end(key)
+        while len(self._fields) > self._max_size:
+            self._fields.popitem(last=False)
+        return entry, int(np.count_nonzero(dist < np.inf))
+
+
+# cache shared by field_cache_search
+_default_cache = DistanceFieldCache()
+
+
+def field_cache_search(problem: MazeProblem, viewer: ViewerInterface = None,
+                       cache: Optional[DistanceFieldCache] = None) \
+        -> Tuple[List[Node], float, float, float]:
+    if cache is None:
+        cache = _default_cache
+    return cache.search(problem, viewer)
@@ -0,0 +1,116 @@
+import heapq
+from collections import deque
+from itertools import count
+from typing import Any, Dict, Iterator, List
+
+
+class PriorityFrontier:
+    """ Min-priority queue of items with O(log n) push/pop.
+
+    Items are indexed by their hash (a Node hashes by its state), so
+    pushing an item that is already in the frontier works as a
+    decrease-key: the new priority and the new item replace the old
+    ones. The outdated heap entry is not removed, it is skipped when
+    it reaches the top (lazy deletion). Items with the same priority
+    leave the frontier in insertion order.
+    """
+
+    def __init__(self):
+        self._heap: List[list] = []
+        self._index: Dict[Any, list] = {}
+        self._counter = count()
+
+    def push(self, item: Any, priority: float) -> None:
+        entry = [priority, next(self._counter), item]
+        self._index[item] = entry
+        heapq.heappush(self._heap, entry)
+
+    def pop(self) -> Any:
+        """ Remove and return the item with the lowest priority. """
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            item = entry[2]
+            # entries replaced by a later push are stale
+            if self._index.get(item) is entry:
+                del self._index[item]
+                return item
+        raise KeyError("pop from an empty frontier")
+
+    def peek(self) -> Any:
+        """ Return the item with the lowest priority without removing it. """
+        while self._heap:
+            entry = self._heap[0]
+            if self._index.get(entry[2]) is entry:
+                return entry[2]
+            heapq.heappop(self._heap)
+        raise KeyError("peek from an empty frontier")
+
+    def remove(self, item: Any) -> None:
+        """ Remove an item; its heap entry becomes stale. """
+        del self._index[item]
+
+    def priority(self, item: Any) -> float:
+        return self._index[item][0]
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (entry[2] for entry in self._index.values())
+
+
+class IndexedFrontier:
+    """ FIFO (or LIFO) queue of items with O(1) membership checks.
+
+    A deque keeps the insertion order and a dictionary counts how many
+    times each item is currently queued, so `item in frontier` does not
+    scan the queue. Both structures are updated together on every
+    append/pop.
+    """
+
+    def __init__(self, lifo: bool = False):
+        self._queue = deque()
+        self._index: Dict[Any, int] = {}
+        self._lifo = lifo
+
+    def append(self, item: Any) -> None:
+        self._queue.append(item)
+        self._index[item] = self._index.get(item, 0) + 1
+
+    def pop(self) -> Any:
+        """ Remove and return the oldest item (newest when lifo=True). """
+        item = self._queue.pop() if self._lifo else self._queue.popleft()
+        n = self._index[item] - 1
+        if n:
+            self._index[item] = n
+        else:
+            del self._index[item]
+        return item
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._index
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._queue)
+
+
+def make_frontier(problem: Any, priority: bool = True, lifo: bool = False):
+    """ Return an empty frontier for a search of problem.
+
+    A PriorityFrontier, or an IndexedFrontier (LIFO when lifo=True)
+    when priority is False. A problem can hand out its own frontiers
+    by defining frontier_factory(priority, lifo); stats.measure does so
+    to time the frontiers of the search it runs, and only those.
+    """
+    factory = getattr(problem, 'frontier_factory', None)
+    if factory is not None:
+        return factory(priority, lifo)
+    if priority:
+        return PriorityFrontier()
+    return IndexedFrontier(lifo)
@@ -0,0 +1,306 @@
+import heapq
+import time
+from math import inf
+from typing import Dict, List, Optional, Tuple
+
+from trab1.src.frontier import PriorityFrontier
+from trab1.src.problems import MazeProblem
+from trab1.src.search import Node, _path_cost
+from trab1.src.viewer import ViewerInterface
+
+Cell = Tuple[int, int]
+Bounds = Tuple[int, int, int, int]
+
+_MOVES = [(-1, -1), (0, -1), (1, -1), (-1, 0),
+          (1, 0), (1, 1), (0, 1), (-1, 1)]
+
+# entrances of at least this many cells get a transition at each end,
+# shorter ones a single transition in the middle.
+_LONG_ENTRANCE = 6
+
+
+class HierarchicalMaze:
+    """ Hierarchical pathfinding (HPA*) over a MazeProblem.
+
+    The maze is split in square clusters of cluster_size cells. Where
+    two neighboring clusters can be crossed, transition cells are
+    placed on both sides of the border (inter-cluster edges), and the
+    distances between the transition cells of each cluster, moving only
+    inside it, are precomputed (intra-cluster edges). A query connects
+    the start and the goal to the transitions of their clusters,
+    searches the small abstract graph and then refines each abstract
+    edge into cells with a search limited to one cluster.
+
+    Paths are not always optimal, since they must go through the
+    transition cells. The graph is built again by the first search
+    after the maze changed (set_cell); stats keeps the build time and
+    the size of the abstract graph, and benchmark_hpa.py reports query
+    latency and the optimality gap.
+    """
+
+    def __init__(self, problem: MazeProblem, cluster_size: int = 16):
+        self._problem = problem
+        self._maze = problem._maze
+        self._size = cluster_size
+        self._build()
+
+    def _build(self) -> None:
+        # built for the maze as it is now; search() builds again after
+        # set_cell changed it (see MazeProblem._version)
+        self._version = self._problem._version
+
+        # abstract graph: neighbor -> cost, with the bounds of the
+        # cluster to search when refining (None for a single step
+        # across a border)
+        self._graph: Dict[Cell, Dict[Cell, Tuple[float, Optional[Bounds]]]] = {}
+
+        # transition cells of each cluster
+        self._transitions: Dict[Tuple[int, int], List[Cell]] = {}
+
+        start_time = time.perf_counter()
+        self._add_transitions()
+        self._add_intra_edges()
+
+        self.stats = {
+            'build_time': time.perf_counter() - start_time,
+            'n_clusters': len(self._transitions),
+            'n_abstract_nodes': len(self._graph),
+            'n_abstract_edges': sum(len(e) for e in self._graph.values()),
+        }
+
+    def search(self, viewer: ViewerInterface = None, start: Optional[Cell] = None,
+               goal: Optional[Cell] = None) \
+            -> Tuple[List[Node], float, float, float]:
+        # start and goal default to the ones of the problem. The
+        # counters are the generated and expanded abstract nodes.
+        problem = self._problem
+        if self._version != problem._version:
+            self._build()
+        if start is None:
+            start = problem.initial_state()
+        if goal is None:
+            goal = problem._goal_state
+
+        if not self._free(start) or not self._free(goal):
+            return [], inf, 0, 0
+
+        # connect start and goal to the transitions of their clusters
+        # (and to each other when they share a cluster); moves are
+        # symmetric, so the goal edges are used backward.
+        start_edges = self._local_edges(start, goal)
+        goal_edges = self._local_edges(goal, start)
+
+        def neighbors(cell: Cell):
+            edges = self._graph.get(cell, {})
+            if cell == start:
+                edges = {**edges, **start_edges}
+            for n, edge in edges.items():
+                yield n, edge
+            if cell in goal_edges:
+                yield goal, goal_edges[cell]
+
+        # A* on the abstract graph
+        n_generated = 0
+        n_expanded = 0
+        g = {start: 0.0}
+        parent: Dict[Cell, Tuple[Cell, Optional[Bounds]]] = {}
+        frontier = PriorityFrontier()
+        frontier.push(start, problem.heuristic_cost(start))
+        closed = set()
+        found = start == goal
+
+        while frontier and not found:
+            cell = frontier.pop()
+            if cell == goal:
+                found = True
+                break
+            closed.add(cell)
+            n_expanded += 1
+            for n, (cost, bounds) in neighbors(cell):
+                new_cost = g[cell] + cost
+                if n not in closed and new_cost < g.get(n, inf):
+                    if n not in frontier:
+                        n_generated += 1
+                    g[n] = new_cost
+                    parent[n] = (cell, bounds)
+                    frontier.push(n, new_cost + problem._cell_distance(n, goal))
+
+        path = []
+        if found:
+            # abstract path, then each edge refined into cells
+            abstract = [(goal, None)]
+            while abstract[-1][0] != start:
+                abstract.append(parent[abstract[-1][0]])
+            abstract.reverse()
+
+            cells = [start]
+            for i in range(1, len(abstract)):
+                target = abstract[i][0]
+                bounds = abstract[i - 1][1]
+                if bounds is None:
+                    cells.append(target)
+                else:
+                    cells.extend(self._local_path(cells[-1], target, bounds)[1:])
+
+            previous_node = None
+            for cell in cells:
+                previous_node = Node(cell, cell if previous_node else None,
+                                     previous_node)
+                path.append(previous_node)
+
+        cost = _path_cost(problem, path)
+
+        if viewer is not None:
+            viewer.update(start, path=path)
+
+        return path, cost, n_generated, n_expanded
+
+    def _free(self, cell: Cell) -> bool:
+        return 0 <= cell[0] < self._problem.n_rows and \
+            0 <= cell[1] < self._problem.n_cols and \
+            self._maze[cell[0]][cell[1]] == 0
+
+    def _cluster(self, cell: Cell) -> Tuple[int, int]:
+        return cell[0] // self._size, cell[1] // self._size
+
+    def _bounds(self, cluster: Tuple[int, int]) -> Bounds:
+        row, col = cluster[0] * self._size, cluster[1] * self._size
+        return (row, col,
+                min(row + self._size, self._problem.n_rows),
+                min(col + self._size, self._problem.n_cols))
+
+    def _add_transitions(self) -> None:
+        n_rows, n_cols = self._problem.n_rows, self._problem.n_cols
+        for row in range(0, n_rows, self._size):
+            for col in range(0, n_cols, self._size):
+                self._transitions.setdefault(self._cluster((row, col)), [])
+
+        # vertical borders (between a cluster and the one to its right)
+        for col in range(self._size, n_cols, self._size):
+            for row in range(0, n_rows, self._size):
+                border = [((r, col - 1), (r, col))
+                          for r in range(row, min(row + self._size, n_rows))]
+                self._add_entrances(border, (1, 0))
+
+        # horizontal borders (between a cluster and the one below it)
+        for row in range(self._size, n_rows, self._size):
+            for col in range(0, n_cols, self._size):
+                border = [((row - 1, c), (row, c))
+                          for c in range(col, min(col + self._size, n_cols))]
+                self._add_entrances(border, (0, 1))
+
+    def _add_entrances(self, border: List[Tuple[Cell, Cell]],
+                       along: Tuple[int, int]) -> None:
+        # Each run of contiguous positions that can be crossed straight
+        # is an entrance: its inside cells are connected to each other
+        # in one cluster and its outside cells in the other, so any of
+        # its crossings stands for all of them.
+        run_of: Dict[Cell, int] = {}
+        run: List[Tuple[Cell, Cell]] = []
+        n_runs = 0
+        for inside, outside in border + [(None, None)]:
+            if inside is not None and self._free(inside) and \
+                    self._free(outside):
+                run.append((inside, outside))
+                continue
+            if run:
+                if len(run) >= _LONG_ENTRANCE:
+                    chosen = [run[0], run[-1]]
+                else:
+                    chosen = [run[len(run) // 2]]
+                for a, b in chosen:
+                    self._add_crossing(a, b)
+                for a, b in run:
+                    run_of[a] = run_of[b] = n_runs
+                n_runs += 1
+            run = []
+
+        # Diagonal crossings (including the ones across a cluster
+        # corner) that do not join two cells of the same straight
+        # entrance are inter-cluster edges of their own.
+        for inside, outside in border:
+            if not self._free(inside):
+                continue
+            for k in (-1, 1):
+                other = (outside[0] + k * along[0], outside[1] + k * along[1])
+                if not self._free(other) or \
+                        self._cluster(other) == self._cluster(inside):
+                    continue
+                run_id = run_of.get(inside)
+                if run_id is None or run_id != run_of.get(other):
+                    self._add_crossing(inside, other)
+
+    def _add_crossing(self, a: Cell, b: Cell) -> None:
+        # a single step between two clusters; both cells become
+        # transitions of their clusters
+        cost = self._problem._cell_distance(a, b)
+        self._connect(a, b, cost, None)
+        self._connect(b, a, cost, None)
+        for cell in (a, b):
+            transitions = self._transitions[self._cluster(cell)]
+            if cell not in transitions:
+                transitions.append(cell)
+
+    def _add_intra_edges(self) -> None:
+        for cluster, transitions in self._transitions.items():
+            bounds = self._bounds(cluster)
+            for cell in transitions:
+                dist, _ = _cluster_dijkstra(self._maze, cell, bounds)
+                for other in transitions:
+                    if other != cell and other in dist:
+                        self._connect(cell, other, dist[other], bounds)
+
+    def _connect(self, cell: Cell, other: Cell, cost: float,
+                 bounds: Optional[Bounds]) -> None:
+        edges = self._graph.setdefault(cell, {})
+        if cost < edges.get(other, (inf, None))[0]:
+            edges[other] = (cost, bounds)
+
+    def _local_edges(self, cell: Cell, other: Cell) \
+            -> Dict[Cell, Tuple[float, Bounds]]:
+        # edges from cell to the transitions of its cluster, and to
+        # other when it is reachable inside the same cluster
+        bounds = self._bounds(self._cluster(cell))
+        dist, _ = _cluster_dijkstra(self._maze, cell, bounds)
+        edges = {t: (dist[t], bounds)
+                 for t in self._transitions[self._cluster(cell)] if t in dist}
+        if other in dist:
+            edges[other] = (dist[other], bounds)
+        return edges
+
+    def _local_path(self, source: Cell, target: Cell, bounds: Bounds) -> List[Cell]:
+        _, parent = _cluster_dijkstra(self._maze, source, bounds, target)
+        cells = [target]
+        while cells[-1] != source:
+            cells.append(parent[cells[-1]])
+        cells.reverse()
+        return cells
+
+
+def _cluster_dijkstra(maze: List[List[int]], source: Cell, bounds: Bounds,
+                      target: Optional[Cell] = None) \
+        -> Tuple[Dict[Cell, float], Dict[Cell, Cell]]:
+    # Dijkstra from source moving only inside bounds (first row, first
+    # column, end row, end column); stops early at target if given.
+    row_0, col_0, row_1, col_1 = bounds
+    dist = {source: 0.0}
+    parent: Dict[Cell, Cell] = {}
+    heap = [(0.0, source)]
+    done = set()
+    while heap:
+        d, cell = heapq.heappop(heap)
+        if cell in done:
+            continue
+        done.add(cell)
+        if cell == target:
+            break
+        for d_row, d_col in _MOVES:
+            row, col = cell[0] + d_row, cell[1] + d_col
+            if row_0 <= row < row_1 and col_0 <= col < col_1 and \
+                    maze[row][col] == 0:
+                new = d + (d_row * d_row + d_col * d_col) ** 0.5
+                if new < dist.get((row, col), inf):
+                    dist[(row, col)] = new
+                    parent[(row, col)] = cell
+                    heapq.heappush(heap, (new, (row, col)))
+    return dist, parent
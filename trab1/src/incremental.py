@@ -0,0 +1,182 @@
+from math import inf
+from typing import Dict, Iterable, List, Tuple
+
+from trab1.src.frontier import PriorityFrontier
+from trab1.src.problems import MazeProblem
+from trab1.src.search import Node, _path_cost
+
+Cell = Tuple[int, int]
+
+# Keys are sums of floating point distances added in different
+# orders, so equal keys can differ in the last bits. They are rounded
+# before going into the queue and compared with this tolerance.
+_EPSILON = 1e-9
+
+_DIRECTIONS = [(-1, -1), (0, -1), (1, -1), (-1, 0),
+               (1, 0), (1, 1), (0, 1), (-1, 1)]
+
+
+class DStarLite:
+    """ Incremental planner for a MazeProblem (D* Lite).
+
+    The search runs backward from the goal and its state (g, rhs and
+    the priority queue) is kept between calls to plan(). After cells
+    are toggled or the start moves, only the states whose distance to
+    the goal is affected are expanded again, instead of searching the
+    whole maze from scratch.
+
+    Typical loop:
+        planner = DStarLite(maze_problem)
+        path, cost, n_generated, n_expanded = planner.plan()
+        planner.toggle_cells([(3, 4)])
+        planner.move_start(path[1].state)
+        path, cost, n_generated, n_expanded = planner.plan()
+
+    The counters returned by plan() cover the work done since the
+    previous call.
+    """
+
+    def __init__(self, problem: MazeProblem):
+        self._problem = problem
+        self._maze = problem._maze
+        self._goal = problem._goal_state
+        self._start = problem.initial_state()
+
+        # start used for the keys in the queue, and the key modifier
+        # that keeps them valid after the start moves.
+        self._last_start = self._start
+        self._km = 0.0
+
+        self._g: Dict[Cell, float] = {}
+        self._rhs: Dict[Cell, float] = {self._goal: 0.0}
+        self._queue = PriorityFrontier()
+        self._queue.push(self._goal, self._key(self._goal))
+
+        self._n_generated = 1
+        self._n_expanded = 0
+
+    def plan(self) -> Tuple[List[Node], float, float, float]:
+        """ Repair the search and return the path from the current start. """
+        self._compute_shortest_path()
+
+        path = self._extract_path()
+        cost = _path_cost(self._problem, path)
+
+        n_generated, n_expanded = self._n_generated, self._n_expanded
+        self._n_generated = 0
+        self._n_expanded = 0
+
+        return path, cost, n_generated, n_expanded
+
+    def move_start(self, start: Cell) -> None:
+        """ Plan from a new start (usually the next cell of the path). """
+        self._start = start
+        self._km += self._problem._cell_distance(self._last_start, start)
+        self._last_start = start
+
+    def toggle_cells(self, cells: Iterable[Cell]) -> None:
+        """ Flip each cell between free and obstacle in the maze. """
+        changed = set()
+        for row, col in cells:
+            self._problem.set_cell((row, col), 1 - self._maze[row][col])
+            changed.add((row, col))
+            changed.update(self._neighbors((row, col)))
+
+        # every edge touching a toggled cell changed its cost, so the
+        # rhs of the cell and of its neighbors is recomputed.
+        for cell in changed:
+            if cell != self._goal:
+                self._rhs[cell] = self._best_rhs(cell)
+            self._update_vertex(cell)
+
+    def _key(self, cell: Cell) -> Tuple[float, float]:
+        best = min(self._g.get(cell, inf), self._rhs.get(cell, inf))
+        return (round(best + self._problem._cell_distance(self._start, cell)
+                      + self._km, 9), round(best, 9))
+
+    def _neighbors(self, cell: Cell) -> List[Cell]:
+        # all cells inside the maze around cell, free or not
+        row, col = cell
+        n_rows = self._problem.n_rows
+        n_cols = self._problem.n_cols
+        return [(row + d_row, col + d_col) for d_row, d_col in _DIRECTIONS
+                if 0 <= row + d_row < n_rows and 0 <= col + d_col < n_cols]
+
+    def _cost(self, cell_1: Cell, cell_2: Cell) -> float:
+        if self._maze[cell_1[0]][cell_1[1]] or self._maze[cell_2[0]][cell_2[1]]:
+            return inf
+        return self._problem._cell_distance(cell_1, cell_2)
+
+    def _best_rhs(self, cell: Cell) -> float:
+        return min((self._cost(cell, n) + self._g.get(n, inf)
+                    for n in self._neighbors(cell)), default=inf)
+
+    def _update_vertex(self, cell: Cell) -> None:
+        consistent = self._g.get(cell, inf) == self._rhs.get(cell, inf)
+        if not consistent:
+            if cell not in self._queue:
+                self._n_generated += 1
+            self._queue.push(cell, self._key(cell))
+        elif cell in self._queue:
+            self._queue.remove(cell)
+
+    def _compute_shortest_path(self) -> None:
+        g = self._g
+        rhs = self._rhs
+        queue = self._queue
+        start = self._start
+
+        while queue:
+            cell = queue.peek()
+            old_key = queue.priority(cell)
+            # stop once every key ahead of the start's key (including
+            # ties of the first component) was processed and the start
+            # is consistent.
+            if old_key[0] > self._key(start)[0] + _EPSILON and \
+                    rhs.get(start, inf) <= g.get(start, inf):
+                break
+
+            new_key = self._key(cell)
+            if old_key < new_key:
+                # the key is outdated because the start moved
+                queue.push(cell, new_key)
+                continue
+
+            self._n_expanded += 1
+            cell_g = g.get(cell, inf)
+            cell_rhs = rhs.get(cell, inf)
+
+            if cell_g > cell_rhs:
+                # overconsistent: the distance improved
+                g[cell] = cell_rhs
+                queue.pop()
+                for n in self._neighbors(cell):
+                    if n != self._goal:
+                        rhs[n] = min(rhs.get(n, inf),
+                                     self._cost(n, cell) + cell_rhs)
+                    self._update_vertex(n)
+            else:
+                # underconsistent: the distance got worse
+                g[cell] = inf
+                for n in self._neighbors(cell) + [cell]:
+                    if n != self._goal and (n == cell or rhs.get(n, inf) ==
+                                            self._cost(n, cell) + cell_g):
+                        rhs[n] = self._best_rhs(n)
+                    self._update_vertex(n)
+
+    def _extract_path(self) -> List[Node]:
+        path = []
+        if self._rhs.get(self._start, inf) == inf:
+            return path
+
+        # follow the cheapest successor from the start to the goal
+        cell = self._start
+        previous_node = Node(cell)
+        path.append(previous_node)
+        while cell != self._goal:
+            cell = min(self._neighbors(cell),
+                       key=lambda n: self._cost(cell, n) + self._g.get(n, inf))
+            previous_node = Node(cell, cell, previous_node)
+            path.append(previous_node)
+        return path
+
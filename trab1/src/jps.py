@@ -0,0 +1,181 @@
+from typing import Dict, List, Optional, Tuple
+
+from trab1.src.frontier import make_frontier
+from trab1.src.node_store import NO_PARENT, NodeStore
+from trab1.src.problems import MazeProblem
+from trab1.src.search import Node, _path_cost
+from trab1.src.viewer import ViewerInterface
+
+Cell = Tuple[int, int]
+
+
+def jump_point_search(problem: MazeProblem, viewer: ViewerInterface = None) \
+        -> Tuple[List[Node], float, float, float]:
+    """ A* over jump points of the 8-connected MazeProblem grid.
+
+    Straight and diagonal runs through free cells are skipped by
+    jumping until a cell with a forced neighbor (or the goal) is
+    found, so only those jump points enter the frontier. Diagonal
+    moves are allowed next to obstacles, as in MazeProblem.actions,
+    and the cost of a jump is the euclidean length of the run, so
+    the returned cost is the same optimal cost found by a_star_search.
+    The path is returned cell by cell, like the other searches.
+    """
+    maze = problem._maze
+    n_rows = problem.n_rows
+    n_cols = problem.n_cols
+    goal = problem._goal_state
+
+    def free(row: int, col: int) -> bool:
+        return 0 <= row < n_rows and 0 <= col < n_cols and \
+            maze[row][col] == 0
+
+    def jump(row: int, col: int, d_row: int, d_col: int) -> Optional[Cell]:
+        # walk from (row, col) in the given direction and return the
+        # first jump point, or None if the run hits an obstacle.
+        while True:
+            row += d_row
+            col += d_col
+            if not free(row, col):
+                return None
+            if (row, col) == goal:
+                return row, col
+
+            if d_row != 0 and d_col != 0:
+                if (free(row - d_row, col + d_col) and
+                        not free(row - d_row, col)) or \
+                        (free(row + d_row, col - d_col) and
+                         not free(row, col - d_col)):
+                    return row, col
+                # a diagonal cell is a jump point when one of the
+                # straight runs leaving it finds a jump point.
+                if jump(row, col, d_row, 0) is not None or \
+                        jump(row, col, 0, d_col) is not None:
+                    return row, col
+            elif d_row != 0:
+                if (free(row + d_row, col + 1) and not free(row, col + 1)) or \
+                        (free(row + d_row, col - 1) and not free(row, col - 1)):
+                    return row, col
+            else:
+                if (free(row + 1, col + d_col) and not free(row + 1, col)) or \
+                        (free(row - 1, col + d_col) and not free(row - 1, col)):
+                    return row, col
+
+    def directions(cell: Cell, parent: Optional[Cell]) -> List[Cell]:
+        # pruned set of directions to jump from cell, given the
+        # direction it was reached from.
+        row, col = cell
+        if parent is None:
+            return [(d_row, d_col)
+                    for d_row in (-1, 0, 1) for d_col in (-1, 0, 1)
+                    if (d_row, d_col) != (0, 0)]
+
+        d_row = _sign(row - parent[0])
+        d_col = _sign(col - parent[1])
+        dirs = []
+        if d_row != 0 and d_col != 0:
+            dirs.append((d_row, 0))
+            dirs.append((0, d_col))
+            dirs.append((d_row, d_col))
+            if not free(row - d_row, col):
+                dirs.append((-d_row, d_col))
+            if not free(row, col - d_col):
+                dirs.append((d_row, -d_col))
+        elif d_row != 0:
+            dirs.append((d_row, 0))
+            if not free(row, col + 1):
+                dirs.append((d_row, 1))
+            if not free(row, col - 1):
+                dirs.append((d_row, -1))
+        else:
+            dirs.append((0, d_col))
+            if not free(row + 1, col):
+                dirs.append((1, d_col))
+            if not free(row - 1, col):
+                dirs.append((-1, d_col))
+        return dirs
+
+    store = NodeStore()
+    frontier = make_frontier(problem)
+
+    n_generated = 0
+    n_expanded = 0
+
+    # jump points whose successors were already generated
+    visiteds = set()
+
+    # id of the node holding the best known g of each jump point
+    node_of: Dict[Cell, int] = {}
+
+    start = problem.initial_state()
+    node_of[start] = store.add(start, g=0)
+    frontier.push(start, problem.heuristic_cost(start))
+    goal_node = None
+
+    while frontier:
+        current = frontier.pop()
+        current_id = node_of[current]
+
+        if current == goal:
+            goal_node = current_id
+            break
+
+        visiteds.add(current)
+        n_expanded += 1
+
+        parent_id = store.parent(current_id)
+        parent = store.state(parent_id) if parent_id != NO_PARENT else None
+
+        for d_row, d_col in directions(current, parent):
+            point = jump(current[0], current[1], d_row, d_col)
+            if point is None:
+                continue
+
+            new_cost = store.g(current_id) + problem.step_cost(
+                state=current,
+                action=None,
+                next_state=point)
+
+            point_id = node_of.get(point)
+            if point_id is None or new_cost < store.g(point_id):
+                node_of[point] = store.add(point, current_id, point, new_cost)
+
+                if point not in frontier:
+                    n_generated += 1
+                frontier.push(point, new_cost + problem.heuristic_cost(point))
+
+        if viewer is not None:
+            viewer.update(current,
+                          generated=frontier,
+                          expanded=visiteds)
+
+    path = _extract_cell_path(store, goal_node)
+    cost = _path_cost(problem, path)
+
+    return path, cost, n_generated, n_expanded
+
+
+def _extract_cell_path(store: NodeStore, goal: Optional[int]) -> List[Node]:
+    # fill in the cells between consecutive jump points, which are
+    # always on a straight or diagonal line.
+    path = []
+    if goal is None:
+        return path
+    previous_node = None
+    for node_id in store.path(goal):
+        row, col = store.state(node_id)
+        if previous_node is not None:
+            d_row = _sign(row - previous_node.state[0])
+            d_col = _sign(col - previous_node.state[1])
+            cell = previous_node.state
+            while (cell[0] + d_row, cell[1] + d_col) != (row, col):
+                cell = (cell[0] + d_row, cell[1] + d_col)
+                previous_node = Node(cell, cell, previous_node)
+                path.append(previous_node)
+        previous_node = Node((row, col), store.action(node_id), previous_node)
+        path.append(previous_node)
+    return path
+
+
+def _sign(x: int) -> int:
+    return (x > 0) - (x < 0)
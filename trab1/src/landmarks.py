@@ -0,0 +1,183 @@
+import random
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from trab1.src.problems import MazeProblem
+from trab1.src.wavefront import distance_field
+
+Cell = Tuple[int, int]
+
+STRATEGIES = ('farthest', 'random', 'border')
+
+# bytes per cell of a stored distance -> its dtype; 8 keeps exact
+# distances, 4 and 2 keep them quantized.
+_DTYPES = {8: np.float64, 4: np.uint32, 2: np.uint16}
+
+
+class LandmarkHeuristic:
+    """ ALT (A*, landmarks, triangle inequality) lower bounds for a maze.
+
+    Exact distances from n_landmarks landmark cells to every cell are
+    precomputed (wavefront.distance_field). Moves are symmetric, so for
+    any landmark L, d(n, goal) >= |d(L, goal) - d(L, n)|, and the
+    heuristic is the largest of those bounds and the euclidean
+    distance. It is admissible and consistent, and much tighter than
+    the euclidean distance alone when walls force detours.
+
+    strategy picks the landmarks: 'farthest' adds, one at a time, the
+    reachable cell farthest from the landmarks chosen so far (from a
+    random first one), and stops early when every reachable cell is a
+    landmark; 'random' draws free cells; 'border' takes the
+    free cells closest to points spread along the maze border.
+
+    bytes_per_cell sets the memory of each landmark: 8 stores float64
+    distances, 4 and 2 store them as uint32/uint16 multiples of a step
+    (rounded down, and the bound gives up one step, so it stays
+    admissible but is slightly weaker).
+
+    Use it through MazeProblem.set_landmarks, which makes it the
+    default heuristic_cost. The bounds for a goal are computed for the
+    whole maze at once, the first time that goal is used, and the
+    landmarks are recomputed if the maze changed (set_cell).
+    """
+
+    def __init__(self, problem: MazeProblem, n_landmarks: int = 8,
+                 strategy: str = 'farthest', bytes_per_cell: int = 8,
+                 seed: Optional[int] = None):
+        if n_landmarks < 1:
+            raise ValueError("n_landmarks must be at least 1")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy: {strategy}")
+        if bytes_per_cell not in _DTYPES:
+            raise ValueError(f"bytes_per_cell must be one of {sorted(_DTYPES)}")
+        self._problem = problem
+        self._n_landmarks = n_landmarks
+        self._strategy = strategy
+        self._dtype = _DTYPES[bytes_per_cell]
+        self._seed = seed
+
+        self.landmarks: List[Cell] = []
+        self._build()
+
+    @property
+    def n_bytes(self) -> int:
+        """ Memory used by the stored distances. """
+        return self._distances.nbytes
+
+    def lower_bound(self, cell: Cell, goal: Cell) -> float:
+        """ Lower bound on the distance from cell to goal. """
+        bounds = self._bounds.get(goal)
+        if bounds is None or self._version != self._problem._version:
+            bounds = self._goal_bounds(goal)
+        return bounds[cell[0] * self._n_cols + cell[1]]
+
+    def _build(self) -> None:
+        problem = self._problem
+        self._version = problem._version
+        self._n_cols = problem.n_cols
+        self._bounds: Dict[Cell, array] = {}
+
+        rng = random.Random(self._seed)
+        free = np.argwhere(np.asarray(problem._maze) == 0)
+        fields = []
+        if self._strategy == 'farthest':
+            # distance to the nearest landmark chosen so far
+            nearest = None
+            candidate = tuple(free[rng.randrange(len(free))])
+            for _ in range(self._n_landmarks):
+                dist, _ = distance_field(problem, candidate)
+                self.landmarks.append(candidate)
+                fields.append(dist)
+                nearest = dist if nearest is None else np.minimum(nearest, dist)
+                reachable = np.where(np.isfinite(nearest), nearest, -1)
+                # every reachable cell is already a landmark
+                if reachable.max() <= 0:
+                    break
+                candidate = np.unravel_index(np.argmax(reachable),
+                                             reachable.shape)
+                candidate = (int(candidate[0]), int(candidate[1]))
+        else:
+            if self._strategy == 'random':
+                picks = rng.sample(range(len(free)),
+                                   min(self._n_landmarks, len(free)))
+                self.landmarks = [tuple(free[i]) for i in picks]
+            else:
+                self.landmarks = _border_cells(problem, free,
+                                               self._n_landmarks)
+            self.landmarks = [(int(r), int(c)) for r, c in self.landmarks]
+            fields = [distance_field(problem, cell)[0]
+                      for cell in self.landmarks]
+
+        distances = np.stack([f.ravel() for f in fields])
+        if self._dtype is np.float64:
+            self._step = 0.0
+            self._distances = distances
+        else:
+            # the largest value of the dtype marks unreachable cells
+            top = np.iinfo(self._dtype).max
+            finite = distances[np.isfinite(distances)]
+            self._step = max(finite.max(), 1.0) / (top - 1)
+            quantized = np.full(distances.shape, top, dtype=self._dtype)
+            reachable = np.isfinite(distances)
+            quantized[reachable] = np.floor(distances[reachable] / self._step)
+            self._distances = quantized
+
+    def _goal_bounds(self, goal: Cell) -> array:
+        if self._version != self._problem._version:
+            self.landmarks = []
+            self._build()
+
+        problem = self._problem
+        rows, cols = np.divmod(np.arange(problem.n_rows * problem.n_cols),
+                               problem.n_cols)
+        bounds = np.sqrt((rows - goal[0]) ** 2 + (cols - goal[1]) ** 2)
+
+        goal_index = goal[0] * self._n_cols + goal[1]
+        for distances in self._distances:
+            to_goal = distances[goal_index]
+            if self._dtype is np.float64:
+                if not np.isfinite(to_goal):
+                    continue
+                reachable = np.isfinite(distances)
+                bound = np.abs(distances - to_goal)
+            else:
+                top = np.iinfo(self._dtype).max
+                if to_goal == top:
+                    continue
+                reachable = distances != top
+                # both values were rounded down, so the difference can
+                # be one step larger than the true one
+                bound = (np.abs(distances.astype(np.int64) - int(to_goal))
+                         - 1).clip(0) * self._step
+            bounds = np.where(reachable, np.maximum(bounds, bound), bounds)
+
+        # plain floats read faster one at a time than a NumPy array
+        bounds = array('d', bounds.tobytes())
+        self._bounds[goal] = bounds
+        return bounds
+
+
+def _border_cells(problem: MazeProblem, free: np.ndarray,
+                  n_landmarks: int) -> List[Cell]:
+    # free cells closest to n_landmarks points evenly spaced along the
+    # border of the maze
+    n_rows, n_cols = problem.n_rows, problem.n_cols
+    perimeter = 2 * (n_rows + n_cols - 2)
+    cells = []
+    for i in range(n_landmarks):
+        position = i * perimeter // n_landmarks
+        if position < n_cols:
+            point = (0, position)
+        elif position < n_cols + n_rows - 1:
+            point = (position - n_cols + 1, n_cols - 1)
+        elif position < 2 * n_cols + n_rows - 2:
+            point = (n_rows - 1, 2 * n_cols + n_rows - 3 - position)
+        else:
+            point = (perimeter - position, 0)
+        nearest = np.argmin(np.abs(free - point).sum(axis=1))
+        cell = tuple(free[nearest])
+        if cell not in cells:
+            cells.append(cell)
+    return cells
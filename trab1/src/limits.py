@@ -0,0 +1,61 @@
+import time
+from math import inf
+from typing import Optional
+
+
+class CancellationToken:
+    """ Flag another thread (or a callback) sets to stop a search. """
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class SearchLimits:
+    """ When a search has to give up: time, expansions or cancellation.
+
+    Passed as limits= to breadth_first_search, depth_first_search,
+    uniform_search, a_star_search, ida_star_search and sma_star_search
+    (also through a_star_search with max_nodes), which call start()
+    once and stop(n_expanded) before each expansion. When stop() returns True
+    the search returns at once with an empty path, cost inf and the
+    counters so far, and reason says why: 'time', 'expansions' or
+    'cancelled' (None when the search finished on its own).
+
+    time_limit is in seconds from the start of the search. The clock
+    is read only every check_every expansions, so the deadline can be
+    passed by that many expansions; the budget and the token are
+    checked on every call.
+    """
+
+    def __init__(self, time_limit: Optional[float] = None,
+                 max_expansions: Optional[int] = None,
+                 token: Optional[CancellationToken] = None,
+                 check_every: int = 64):
+        self.time_limit = time_limit
+        self.max_expansions = inf if max_expansions is None else max_expansions
+        self.token = token
+        self.reason: Optional[str] = None
+        self._check_every = max(1, check_every)
+        self._deadline = inf
+        self._calls = 0
+
+    def start(self) -> None:
+        self.reason = None
+        self._calls = 0
+        self._deadline = inf if self.time_limit is None \
+            else time.perf_counter() + self.time_limit
+
+    def stop(self, n_expanded: int) -> bool:
+        if n_expanded >= self.max_expansions:
+            self.reason = 'expansions'
+        elif self.token is not None and self.token.cancelled:
+            self.reason = 'cancelled'
+        else:
+            self._calls += 1
+            if self._calls % self._check_every == 0 and \
+                    time.perf_counter() > self._deadline:
+                self.reason = 'time'
+        return self.reason is not None
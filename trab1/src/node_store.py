@@ -0,0 +1,86 @@
+from array import array
+from typing import Any, List
+
+# parent id of the root node
+NO_PARENT = -1
+
+
+class NodeStore:
+    """ Compact storage for search nodes.
+
+    Instead of one Node object per generated state, a node is an
+    integer id and its fields live in parallel arrays: the parent id
+    and the g-cost in typed arrays, the state and the action in plain
+    lists (they can be any object the problem uses). The arrays are
+    preallocated and doubled when they fill up, so a search of any
+    ProblemInterface can keep millions of nodes without allocating one
+    Python object per node. Freed ids are reused by later nodes, so
+    searches that forget nodes keep the storage bounded.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        capacity = max(1, capacity)
+        self._parent = array('q', [NO_PARENT]) * capacity
+        self._g = array('d', [0.0]) * capacity
+        self._states: List[Any] = [None] * capacity
+        self._actions: List[Any] = [None] * capacity
+        self._size = 0
+        self._free: List[int] = []
+
+    def add(self, state: Any, parent: int = NO_PARENT, action: Any = None,
+            g: float = 0.0) -> int:
+        """ Store a new node and return its id. """
+        if self._free:
+            node_id = self._free.pop()
+        else:
+            node_id = self._size
+            if node_id == len(self._parent):
+                self._grow()
+            self._size += 1
+        self._parent[node_id] = parent
+        self._g[node_id] = g
+        self._states[node_id] = state
+        self._actions[node_id] = action
+        return node_id
+
+    def free(self, node_id: int) -> None:
+        """ Release a node; its id is reused by a later add().
+
+        The caller must not free a node that is still the parent of a
+        stored node.
+        """
+        self._states[node_id] = None
+        self._actions[node_id] = None
+        self._free.append(node_id)
+
+    def state(self, node_id: int) -> Any:
+        return self._states[node_id]
+
+    def action(self, node_id: int) -> Any:
+        return self._actions[node_id]
+
+    def parent(self, node_id: int) -> int:
+        return self._parent[node_id]
+
+    def g(self, node_id: int) -> float:
+        return self._g[node_id]
+
+    def path(self, node_id: int) -> List[int]:
+        """ Return the node ids from the root to the given node. """
+        ids = []
+        while node_id != NO_PARENT:
+            ids.append(node_id)
+            node_id = self._parent[node_id]
+        ids.reverse()
+        return ids
+
+    def __len__(self) -> int:
+        # number of stored (not freed) nodes
+        return self._size - len(self._free)
+
+    def _grow(self):
+        n = len(self._parent)
+        self._parent.extend(array('q', [NO_PARENT]) * n)
+        self._g.extend(array('d', [0.0]) * n)
+        self._states.extend([None] * n)
+        self._actions.extend([None] * n)
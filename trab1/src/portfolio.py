@@ -0,0 +1,176 @@
+import importlib
+import multiprocessing
+import queue
+import time
+from math import inf
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from trab1.src.batch import ALGORITHMS
+from trab1.src.problems import MazeProblem
+from trab1.src.search import Node
+from trab1.src.viewer import ViewerInterface
+
+Cell = Tuple[int, int]
+
+# seconds between checks for workers that died without a result
+_POLL_INTERVAL = 0.1
+
+
+def portfolio_search(problem: MazeProblem, viewer: ViewerInterface = None,
+                     algorithms: Iterable[str] = ('dfs', 'a_star',
+                                                  'bidirectional_a_star'),
+                     time_budget: Optional[float] = None,
+                     wait_for_best: bool = False,
+                     stats: Optional[Dict[str, Any]] = None) \
+        -> Tuple[List[Node], float, float, float]:
+    """ Race several searches on the same maze, one process each.
+
+    algorithms are names of batch.ALGORITHMS. By default the first
+    search that finds a path wins and the others are terminated; with
+    wait_for_best=True the cheapest path found until every search
+    finished (or time_budget seconds passed) is returned. Searches
+    still running when time_budget expires are terminated too. The
+    counters are those of the winning search.
+
+    The maze grid is written once to a shared memory block that every
+    worker reads, so it is not pickled once per process. Only the grid
+    and the start and goal cells are shared (landmarks set with
+    set_landmarks are not).
+
+    A search that raises, or whose process dies, counts as finished
+    without a path, so the race never waits for it.
+
+    If a stats dictionary is given it is filled with the winning
+    algorithm ('winner', None if no path was found), per algorithm,
+    its (cost, seconds) or None if it was terminated or failed
+    ('results'), and the error of each failed search ('errors').
+    """
+    algorithms = list(algorithms)
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            raise ValueError(f"unknown algorithm: {name}")
+
+    n_rows, n_cols = problem.n_rows, problem.n_cols
+    shared = SharedMemory(create=True, size=max(1, n_rows * n_cols))
+    workers = []
+    results: Dict[str, Optional[tuple]] = {name: None for name in algorithms}
+    errors: Dict[str, str] = {}
+    best = None
+    try:
+        for row in range(n_rows):
+            shared.buf[row * n_cols:(row + 1) * n_cols] = \
+                bytes(problem._maze[row])
+
+        results_queue = multiprocessing.Queue()
+        for name in algorithms:
+            worker = multiprocessing.Process(
+                target=_solve,
+                args=(name, shared.name, n_rows, n_cols,
+                      problem.initial_state(), problem._goal_state,
+                      results_queue),
+                daemon=True)
+            worker.start()
+            workers.append(worker)
+
+        deadline = inf if time_budget is None \
+            else time.perf_counter() + time_budget
+        running = dict(zip(algorithms, workers))
+        while running:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                received = [results_queue.get(
+                    timeout=min(timeout, _POLL_INTERVAL))]
+            except queue.Empty:
+                # A worker posts its result before it exits, so the
+                # results of the workers that exited are in the queue
+                # by now; the ones that are not died without one.
+                dead = [name for name, worker in running.items()
+                        if worker.exitcode is not None]
+                if not dead:
+                    continue
+                received = []
+                while True:
+                    try:
+                        received.append(results_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                posted = {result[0] for result in received}
+                for name in dead:
+                    if name not in posted:
+                        errors[name] = f"worker exited with code " \
+                                       f"{running.pop(name).exitcode}"
+
+            for result in received:
+                name, steps, cost, n_generated, n_expanded, seconds, \
+                    error = result
+                del running[name]
+                if error:
+                    errors[name] = error
+                    continue
+                results[name] = (cost, seconds)
+                if steps and (best is None or cost < best[2]):
+                    best = result
+            if best is not None and not wait_for_best:
+                break
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+        shared.close()
+        shared.unlink()
+
+    if stats is not None:
+        stats['winner'] = best[0] if best is not None else None
+        stats['results'] = results
+        stats['errors'] = errors
+
+    if best is None:
+        return [], inf, 0, 0
+
+    _, steps, cost, n_generated, n_expanded, _, _ = best
+    path = []
+    previous_node = None
+    for state, action in steps:
+        previous_node = Node(state, action, previous_node)
+        path.append(previous_node)
+
+    if viewer is not None:
+        viewer.update(path=path)
+
+    return path, cost, n_generated, n_expanded
+
+
+def _solve(name: str, shared_name: str, n_rows: int, n_cols: int,
+           start: Cell, goal: Cell, results_queue) -> None:
+    # worker: rebuild the maze from the shared grid, run one search
+    # and send back the path as (state, action) pairs (a chain of
+    # Nodes would be pickled recursively), or the error it raised
+    try:
+        shared = SharedMemory(name=shared_name)
+        try:
+            maze = [list(shared.buf[row * n_cols:(row + 1) * n_cols])
+                    for row in range(n_rows)]
+        finally:
+            shared.close()
+        problem = MazeProblem(n_rows, n_cols, maze=maze)
+        problem._initial_state = start
+        problem._goal_state = goal
+
+        module, function = ALGORITHMS[name]
+        search = getattr(importlib.import_module(module), function)
+
+        start_time = time.perf_counter()
+        path, cost, n_generated, n_expanded = search(problem, None)
+    except Exception as e:
+        results_queue.put((name, [], inf, 0, 0, 0.0,
+                           f"{type(e).__name__}: {e}"))
+        return
+    seconds = time.perf_counter() - start_time
+
+    steps = [(node.state, node.action) for node in path]
+    results_queue.put((name, steps, cost, n_generated, n_expanded, seconds,
+                       ''))
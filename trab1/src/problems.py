@@ -1,4 +1,5 @@
 
+import copy
 import random
 from typing import Any, List, Tuple, Optional
 from abc import ABC, abstractmethod
@@ -29,9 +30,30 @@ class ProblemInterface(ABC):
     def is_goal(self, state) -> bool:
         """ Check if a state is a goal state. """
 
+    # Optional state codec. Problems whose states are slow to hash, or
+    # not hashable at all, can pack them into ints: override encode and
+    # decode and return True from has_codec, and the searches of
+    # search.py will key their closed lists and frontiers by the ints.
+
+    def has_codec(self) -> bool:
+        """ Check if encode and decode are implemented. """
+        return False
+
+    def encode(self, state) -> int:
+        """ Return a distinct int for the state. """
+        raise NotImplementedError
+
+    def decode(self, code: int):
+        """ Return the state packed by encode. """
+        raise NotImplementedError
+
 
 class MazeProblem(ProblemInterface):
-    def __init__(self, n_rows: int, n_cols: int, seed: Optional[int] = None):
+    def __init__(self, n_rows: int, n_cols: int, seed: Optional[int] = None,
+                 obstacle_ratio: float = 0.25,
+                 maze: Optional[List[List[int]]] = None):
+        # maze, if given, is used as the grid (rows of 0 for free and 1
+        # for obstacle cells) instead of drawing a random one.
         if seed is not None:
             random.seed(seed)
 
@@ -41,12 +63,25 @@ class MazeProblem(ProblemInterface):
         self._initial_state = (0, 0)
         self._goal_state = (n_rows - 1, n_cols - 1)
 
-        self._maze = self._random_maze(
-            n_rows,
-            n_cols,
-            self.initial_state(),
-            self._goal_state
-        )
+        if maze is not None:
+            self._maze = maze
+        else:
+            self._maze = self._random_maze(
+                n_rows,
+                n_cols,
+                self.initial_state(),
+                self._goal_state,
+                obstacle_ratio
+            )
+
+        # incremented by set_cell, so caches built from the maze can
+        # tell when it changed (see _version). It is kept in a list so
+        # the copies made by reversed(), which share the grid, share it
+        # too.
+        self._maze_version = [0]
+
+        # LandmarkHeuristic used by heuristic_cost (see set_landmarks)
+        self._landmarks = None
 
     def actions(self, state: Tuple[int, int]) -> List[Tuple[int, int]]:
         """ Return the 4-neighbors (see pixel conectivity) that are free. """
@@ -80,7 +115,13 @@ class MazeProblem(ProblemInterface):
                   ) -> float:
         return self._cell_distance(state, next_state)
 
-    def heuristic_cost(self, state: Tuple[int, int], h = 'e') -> float:
+    def heuristic_cost(self, state: Tuple[int, int], h = None) -> float:
+        # h is 'e' (euclidean), 'alt' (landmarks) or 'm' (manhattan);
+        # the default is 'alt' when landmarks were set, 'e' otherwise.
+        if h is None:
+            h = 'e' if self._landmarks is None else 'alt'
+        if h == 'alt':
+            return self._landmarks.lower_bound(state, self._goal_state)
         if h == 'e':
             return self._cell_distance(state, self._goal_state)
         return self.manhattan(state, self._goal_state)
@@ -91,12 +132,50 @@ class MazeProblem(ProblemInterface):
     def is_goal(self, state: Tuple[int, int]) -> bool:
         return (state == self._goal_state)
 
-    def _random_maze(self, n_rows, n_cols, start, goal):
+    def n_states(self) -> int:
+        """ Number of cells; state_index numbers them from 0. """
+        return self.n_rows * self.n_cols
+
+    def state_index(self, state: Tuple[int, int]) -> int:
+        return state[0] * self.n_cols + state[1]
+
+    def index_state(self, index: int) -> Tuple[int, int]:
+        return divmod(index, self.n_cols)
+
+    def set_cell(self, cell: Tuple[int, int], value: int) -> None:
+        """ Set a cell to free (0) or obstacle (1). """
+        self._maze[cell[0]][cell[1]] = value
+        self._maze_version[0] += 1
+
+    @property
+    def _version(self) -> int:
+        # number of set_cell calls on the grid, through any problem
+        # sharing it
+        return self._maze_version[0]
+
+    def set_landmarks(self, landmarks) -> None:
+        """ Use a landmarks.LandmarkHeuristic built for this maze as the
+        default heuristic, or go back to the euclidean one with None. """
+        self._landmarks = landmarks
+
+    def reversed(self) -> "MazeProblem":
+        """ Return the same maze with the initial and goal states swapped.
+
+        Moves and step costs are symmetric, so searching the reversed
+        problem is searching the original one backward from the goal.
+        The maze grid is shared, not copied.
+        """
+        problem = copy.copy(self)
+        problem._initial_state = self._goal_state
+        problem._goal_state = self._initial_state
+        return problem
+
+    def _random_maze(self, n_rows, n_cols, start, goal, obstacle_ratio=0.25):
         # build an empty maze
         maze = [[0] * n_cols for _ in range(n_rows)]
 
         # add random obstacles
-        n_obstacles = int(0.25 * n_rows * n_cols)
+        n_obstacles = int(obstacle_ratio * n_rows * n_cols)
         for _ in range(n_obstacles):
             row = random.randint(0, n_rows-1)
             col = random.randint(0, n_cols-1)
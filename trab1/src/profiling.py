@@ -0,0 +1,225 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from trab1.src.problems import ProblemInterface
+
+
+class ProfileReport:
+    """ Where one search run spent its time, filled by profile_search().
+
+        hotspots    (function, self seconds, total seconds, calls) sorted
+                    by self time; calls is None for sampled hotspots
+        stacks      collapsed call stacks ('f;g;h') -> number of samples
+        n_samples   stack samples taken during the search
+        time_total  wall time of the search in seconds
+        peak_memory tracemalloc peak in bytes above the memory traced
+                    before the search (None when not traced, or when
+                    the caller's trace already had a higher peak)
+        allocations the source lines that allocated the most memory
+                    still alive at the end, as text
+    """
+
+    def __init__(self, algorithm: str = '', mode: str = 'cprofile'):
+        self.algorithm = algorithm
+        self.mode = mode
+        self.hotspots: List[Tuple[str, float, float, Optional[int]]] = []
+        self.stacks: Counter = Counter()
+        self.n_samples = 0
+        self.time_total = 0.0
+        self.peak_memory: Optional[int] = None
+        self.allocations: List[str] = []
+
+    def __repr__(self):
+        return (f"ProfileReport(algorithm={self.algorithm!r}, "
+                f"mode={self.mode!r}, time_total={self.time_total}, "
+                f"n_samples={self.n_samples})")
+
+
+def profile_search(search: Callable, problem: ProblemInterface, *args,
+                   mode: str = 'cprofile', interval: float = 0.001,
+                   trace_memory: bool = False, **kwargs) \
+        -> Tuple[Tuple[Any, ...], ProfileReport]:
+    """ Run search(problem, *args, **kwargs) under a profiler.
+
+    Returns the result of the search unchanged and a ProfileReport.
+    With mode='cprofile' the hotspots come from cProfile (exact call
+    counts, but every Python call pays for it); with mode='sample' a
+    thread records the stack of the search every interval seconds and
+    the hotspots are estimated from the samples, which barely slows the
+    search down. The sampler runs in both modes, since the collapsed
+    stacks for flame graphs come from it. trace_memory adds the
+    tracemalloc peak and the top allocation sites, at a large cost in
+    time; a caller that is already tracing memory is left tracing.
+    """
+    if mode not in ('cprofile', 'sample'):
+        raise ValueError(f"unknown profiling mode: {mode}")
+
+    report = ProfileReport(getattr(search, '__name__', str(search)), mode)
+    profiler = cProfile.Profile() if mode == 'cprofile' else None
+    sampler = _Sampler(threading.get_ident(), interval)
+
+    # the sampler only runs when the search releases the GIL, which
+    # happens every switch interval (5 ms by default)
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval))
+    # a caller that is already tracing keeps its trace running
+    was_tracing = tracemalloc.is_tracing()
+    if trace_memory:
+        if not was_tracing:
+            tracemalloc.start()
+        traced_before, peak_before = tracemalloc.get_traced_memory()
+    sampler.start()
+    start_time = time.perf_counter()
+    try:
+        result = _profiled_call(profiler, search, problem, args, kwargs)
+    finally:
+        report.time_total = time.perf_counter() - start_time
+        sampler.stop()
+        sys.setswitchinterval(switch_interval)
+        if trace_memory:
+            # as in stats.measure, the peak is only known to belong to
+            # the search when it was reached during the search
+            peak = tracemalloc.get_traced_memory()[1]
+            if not was_tracing or peak > peak_before:
+                report.peak_memory = peak - traced_before
+            # the sampler's own allocations are left out
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, __file__)])
+            if not was_tracing:
+                tracemalloc.stop()
+            report.allocations = [str(s) for s in
+                                  snapshot.statistics('lineno')[:10]]
+
+    report.stacks = sampler.stacks
+    report.n_samples = sum(sampler.stacks.values())
+    if profiler is not None:
+        report.hotspots = _cprofile_hotspots(profiler)
+    else:
+        # samples are not exactly interval apart, so each one is worth
+        # an equal share of the measured time
+        report.hotspots = _sampled_hotspots(
+            sampler.stacks, report.time_total / max(report.n_samples, 1))
+    return result, report
+
+
+def write_profile_report(report: ProfileReport, file_name: str = 'perfil.txt',
+                         top: int = 30) -> None:
+    """ Write the top hotspots of report, sorted by self time. """
+    with open(file_name, 'w', encoding='UTF8') as f:
+        f.write(f"algorithm: {report.algorithm}\n")
+        f.write(f"mode: {report.mode}\n")
+        f.write(f"total time: {report.time_total:.4f}s\n")
+        f.write(f"samples: {report.n_samples}\n")
+        if report.peak_memory is not None:
+            f.write(f"peak memory: {report.peak_memory} bytes\n")
+        f.write("\n")
+        f.write(f"{'self (s)':>10} {'total (s)':>10} {'calls':>10}  "
+                f"function\n")
+        for name, self_time, total_time, calls in report.hotspots[:top]:
+            calls = '-' if calls is None else calls
+            f.write(f"{self_time:10.4f} {total_time:10.4f} {calls:>10}  "
+                    f"{name}\n")
+        if report.allocations:
+            f.write("\nlargest allocations:\n")
+            for line in report.allocations:
+                f.write(f"  {line}\n")
+
+
+def write_collapsed_stacks(report: ProfileReport,
+                           file_name: str = 'perfil.folded') -> None:
+    """ Write the sampled stacks in the collapsed format ('f;g;h count'
+    per line) read by flamegraph.pl and speedscope. """
+    with open(file_name, 'w', encoding='UTF8') as f:
+        for stack, count in sorted(report.stacks.items()):
+            f.write(f"{stack} {count}\n")
+
+
+def _profiled_call(profiler: Optional[cProfile.Profile], search: Callable,
+                   problem: ProblemInterface, args: tuple,
+                   kwargs: Dict[str, Any]) -> Any:
+    # the sampler drops this frame and everything above it, so the
+    # stacks start at the search
+    if profiler is None:
+        return search(problem, *args, **kwargs)
+    profiler.enable()
+    try:
+        return search(problem, *args, **kwargs)
+    finally:
+        profiler.disable()
+
+
+class _Sampler(threading.Thread):
+    # Samples the stack of another thread at a fixed interval and
+    # counts the collapsed stacks.
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(daemon=True)
+        self.stacks: Counter = Counter()
+        self._thread_id = thread_id
+        self._interval = interval
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            names = []
+            while frame is not None and \
+                    frame.f_code is not _profiled_call.__code__:
+                names.append(_frame_name(frame.f_code))
+                frame = frame.f_back
+            # samples taken before or after the search are dropped
+            if frame is not None and names:
+                self.stacks[';'.join(reversed(names))] += 1
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+def _frame_name(code) -> str:
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:" \
+           f"{code.co_firstlineno})"
+
+
+def _cprofile_hotspots(profiler: cProfile.Profile) \
+        -> List[Tuple[str, float, float, Optional[int]]]:
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    hotspots = []
+    for (file_name, line, name), (_, n_calls, self_time, total_time, _) \
+            in stats.stats.items():
+        if file_name == '~':
+            # built-in functions
+            label = name
+        else:
+            label = f"{name} ({os.path.basename(file_name)}:{line})"
+        hotspots.append((label, self_time, total_time, n_calls))
+    hotspots.sort(key=lambda h: h[1], reverse=True)
+    return hotspots
+
+
+def _sampled_hotspots(stacks: Counter, seconds_per_sample: float) \
+        -> List[Tuple[str, float, float, Optional[int]]]:
+    # self time: samples where the function is on top of the stack;
+    # total time: samples where it is anywhere in the stack (counted
+    # once per sample, for recursive functions)
+    self_counts: Counter = Counter()
+    total_counts: Counter = Counter()
+    for stack, count in stacks.items():
+        names = stack.split(';')
+        self_counts[names[-1]] += count
+        for name in set(names):
+            total_counts[name] += count
+    hotspots = [(name, self_counts[name] * seconds_per_sample,
+                 total * seconds_per_sample, None)
+                for name, total in total_counts.items()]
+    hotspots.sort(key=lambda h: (h[1], h[2]), reverse=True)
+    return hotspots
@@ -1,17 +1,24 @@
-from collections import deque
+import functools
+import time
 from math import inf
-from typing import Any, List, Union, Tuple, Dict, Optional
-
-from numpy import Infinity
+from typing import Any, Callable, Iterator, List, Tuple, Dict, Optional
 
+from trab1.src.codec import CodecProblem, DecodingViewer
+from trab1.src.frontier import PriorityFrontier, make_frontier
+from trab1.src.limits import SearchLimits
+from trab1.src.node_store import NO_PARENT, NodeStore
 from trab1.src.problems import ProblemInterface
+from trab1.src.visited import make_visited
 from trab1.src.viewer import ViewerInterface
 
 
 class Node:
     # The output path is generated backwards starting from
     # the goal node, hence the need to store the parent in
-    # the node.
+    # the node. The searches keep their nodes in a NodeStore
+    # and only build Node objects for the returned path.
+    __slots__ = ('state', 'action', 'previous_node')
+
     def __init__(self, state: Any, action=None, \
                  previous_node=None):
         self.state = state
@@ -31,18 +38,87 @@ class Node:
         return hash(self.state)
 
 
-def breadth_first_search(problem: ProblemInterface, viewer: ViewerInterface) -> \
+def _uses_codec(search: Callable) -> Callable:
+    # Searches decorated with this run on the packed ints of problems
+    # that have a codec (see ProblemInterface.has_codec): they get a
+    # CodecProblem and a viewer that decodes what it is shown, and the
+    # path they return is decoded back. Other problems are searched as
+    # they are.
+    @functools.wraps(search)
+    def wrapper(problem: ProblemInterface, viewer: ViewerInterface = None,
+                *args, **kwargs):
+        if not problem.has_codec():
+            return search(problem, viewer, *args, **kwargs)
+        if viewer is not None:
+            viewer = DecodingViewer(viewer, problem.decode)
+        result = search(CodecProblem(problem), viewer, *args, **kwargs)
+
+        path = []
+        previous_node = None
+        for node in result[0]:
+            previous_node = Node(problem.decode(node.state), node.action,
+                                 previous_node)
+            path.append(previous_node)
+        return (path,) + tuple(result[1:])
+    return wrapper
+
+
+@_uses_codec
+def breadth_first_search(problem: ProblemInterface, viewer: ViewerInterface,
+                         limits: Optional[SearchLimits] = None) -> \
         Tuple[List[Any], float]:
-    # generated nodes that were not expanded yet
-    to_explore = deque()
+    path, cost, _, _ = _run(_breadth_first_steps(problem, viewer, limits))
+    return path, cost
+
 
-    # nodes whose neighbors were already generated
-    expanded = set()
+# The classic searches are written as generators (_breadth_first_steps,
+# _depth_first_steps and _best_first_steps) that return their (path,
+# cost, n_generated, n_expanded) result. With events=True they also
+# yield a (kind, state, g, parent) tuple for every step (see
+# events.iter_search); without events nothing is yielded, and the
+# plain functions run the very same loop through _run.
+
+def _run(steps: Iterator) -> Any:
+    # drive the steps of a search to the result it returns; without
+    # events the generator runs to the end on its first resume.
+    try:
+        while True:
+            next(steps)
+    except StopIteration as stop:
+        return stop.value
+
+
+def _breadth_first_steps(problem: ProblemInterface,
+                         viewer: ViewerInterface = None,
+                         limits: Optional[SearchLimits] = None,
+                         events: bool = False) -> \
+        Iterator[Tuple[str, Any, float, Any]]:
+    store = NodeStore()
+    if limits is not None:
+        limits.start()
+
+    # ids of the generated nodes that were not expanded yet
+    to_explore = make_frontier(problem, priority=False)
+
+    # every state generated so far. A state is generated (and stored)
+    # only once, so this one lookup stands for the closed list and the
+    # frontier membership check. A plain set and not make_visited: the
+    # store keeps the states anyway, and the bitset lookup is slower.
+    generated = set()
+
+    # states whose neighbors were already generated, for the viewer
+    expanded = make_visited(problem) if viewer is not None else None
+
+    n_generated = 0
+    n_expanded = 0
 
     # add the starting node to the list of nodes
     # yet to be expanded.
-    state_node = Node(problem.initial_state())
-    to_explore.append(state_node)
+    state = problem.initial_state()
+    generated.add(state)
+    to_explore.append(store.add(state))
+    if events:
+        yield 'generate', state, 0.0, None
 
     # variable to store the goal node when it is found.
     goal_found = None
@@ -52,28 +128,43 @@ def breadth_first_search(problem: ProblemInterface, viewer: ViewerInterface) ->
     # to expand in breadth-first search, the goal is
     # unreachable.
     while (len(to_explore) > 0) and (goal_found is None):
-        # select next node or expansion
-        state_node = to_explore.popleft()
-
-        neighbors = _generate_neighbors(state_node, problem)
+        if limits is not None and limits.stop(n_expanded):
+            break
 
-        for n in neighbors:
-            if (n not in expanded) and (n not in to_explore):
-                if problem.is_goal(n.state):
-                    goal_found = n
+        # select next node or expansion
+        state_id = to_explore.pop()
+        state = store.state(state_id)
+        if events:
+            yield 'expand', state, 0.0, None
+
+        neighbors = _generate_neighbors(state, problem)
+
+        for action, n in neighbors:
+            if n not in generated:
+                generated.add(n)
+                n_id = store.add(n, state_id, action)
+                n_generated += 1
+                if events:
+                    yield 'generate', n, 0.0, state
+                if problem.is_goal(n):
+                    goal_found = n_id
+                    if events:
+                        yield 'goal', n, 0.0, None
                     break
-                to_explore.append(n)
+                to_explore.append(n_id)
 
-        expanded.add(state_node)
+        n_expanded += 1
 
-        viewer.update(state_node.state,
-                      generated=to_explore,
-                      expanded=expanded)
+        if viewer is not None:
+            expanded.add(state)
+            viewer.update(state,
+                          generated=[store.state(i) for i in to_explore],
+                          expanded=expanded)
 
-    path = _extract_path(goal_found)
+    path = _extract_path(store, goal_found)
     cost = _path_cost(problem, path)
 
-    return path, cost
+    return path, cost, n_generated, n_expanded
 
 
 def _path_cost(problem: ProblemInterface, path: List[Node]) -> float:
@@ -87,202 +178,1050 @@ def _path_cost(problem: ProblemInterface, path: List[Node]) -> float:
     return cost
 
 
-def _extract_path(goal: Union[Node, None]) -> List[Node]:
+def _extract_path(store: NodeStore, goal: Optional[int]) -> List[Node]:
+    # follow the parent ids back to the root and build
+    # Node objects only for the states in the path.
     path = []
-    state_node = goal
-    while state_node is not None:
-        path.append(state_node)
-        state_node = state_node.previous_node
-    path.reverse()
+    if goal is None:
+        return path
+    previous_node = None
+    for node_id in store.path(goal):
+        previous_node = Node(store.state(node_id), store.action(node_id),
+                             previous_node)
+        path.append(previous_node)
     return path
 
 
-def _generate_neighbors(state_node: Node, problem: ProblemInterface) -> List[
-    Node]:
-    # generate neighbors of the current state
+def _generate_neighbors(state: Any, problem: ProblemInterface) -> List[
+    Tuple[Any, Any]]:
+    # generate (action, next state) pairs of the current state
     neighbors = []
-    state = state_node.state
     available_actions = problem.actions(state)
     for action in available_actions:
         next_state = problem.transition(state, action)
-        neighbors.append(Node(next_state, action, state_node))
+        neighbors.append((action, next_state))
     return neighbors
 
 
-def depth_first_search(problem: ProblemInterface, viewer: ViewerInterface = None
+@_uses_codec
+def depth_first_search(problem: ProblemInterface, viewer: ViewerInterface = None,
+                       limits: Optional[SearchLimits] = None
                        ) -> Tuple[List[Any], float, float, float]:
-    # generated nodes that were not expanded yet
-    to_explore = deque()
+    return _run(_depth_first_steps(problem, viewer, limits))
+
+
+def _depth_first_steps(problem: ProblemInterface,
+                       viewer: ViewerInterface = None,
+                       limits: Optional[SearchLimits] = None,
+                       events: bool = False) -> \
+        Iterator[Tuple[str, Any, float, Any]]:
+    store = NodeStore()
+    if limits is not None:
+        limits.start()
+
+    # ids of the generated nodes that were not expanded yet
+    to_explore = make_frontier(problem, priority=False)
+
+    # every state generated so far; each state is pushed only once
+    # (see _breadth_first_steps)
+    generated = set()
+
+    # states whose neighbors were already generated, for the viewer
+    expanded = make_visited(problem) if viewer is not None else None
 
     n_generated = 0
     n_expanded = 0
 
     # add the starting node to the list of nodes
     # yet to be expanded.
-    state_node = Node(problem.initial_state())
-    to_explore.append(state_node)
-
-    # nodes whose neighbors were already generated
-    visiteds = set()
+    state = problem.initial_state()
+    generated.add(state)
+    to_explore.append(store.add(state))
+    if events:
+        yield 'generate', state, 0.0, None
 
     # variable to store the goal node when it is found.
     goal_found = None
 
-    while to_explore and not goal_found:
+    while to_explore and goal_found is None:
         # select next node or expansion
-        state_node = to_explore.popleft()
+        state_id = to_explore.pop()
+        state = store.state(state_id)
 
-        if state_node in visiteds or state_node in to_explore:
-            continue
+        if problem.is_goal(state):
+            goal_found = state_id
+            if events:
+                yield 'goal', state, 0.0, None
 
-        if problem.is_goal(state_node.state):
-            goal_found = state_node
+            break
 
+        if limits is not None and limits.stop(n_expanded):
             break
 
-        neighbors = _generate_neighbors(state_node, problem)
-        for neighbor in neighbors:
-            if neighbor not in visiteds and neighbor not in to_explore:
-                visiteds.add(state_node)
-                to_explore.append(neighbor)
+        n_expanded += 1
+        if events:
+            yield 'expand', state, 0.0, None
+        neighbors = _generate_neighbors(state, problem)
+        for action, neighbor in neighbors:
+            if neighbor not in generated:
+                generated.add(neighbor)
+                to_explore.append(store.add(neighbor, state_id, action))
                 n_generated+=1
+                if events:
+                    yield 'generate', neighbor, 0.0, state
 
         if viewer is not None:
-            viewer.update(state_node.state,
-                          generated=to_explore,
-                          expanded=visiteds)
+            expanded.add(state)
+            viewer.update(state,
+                          generated=[store.state(i) for i in to_explore],
+                          expanded=expanded)
 
-    path = _extract_path(goal_found)
+    path = _extract_path(store, goal_found)
     cost = _path_cost(problem, path)
-    n_expanded = len(visiteds)
 
     return path, cost, n_generated, n_expanded
 
 
-def a_star_search(problem: ProblemInterface, viewer: ViewerInterface = None) \
+@_uses_codec
+def a_star_search(problem: ProblemInterface, viewer: ViewerInterface = None,
+                  max_nodes: Optional[int] = None, weight: float = 1.0,
+                  limits: Optional[SearchLimits] = None) \
         -> \
         Tuple[List[Node], float, float, float]:
-    start_node = Node(problem.initial_state())
-    frontier = set()
-    frontier.add(start_node)
+    # weight > 1 inflates the heuristic (weighted A*): the path is found
+    # faster and costs at most weight times the optimal cost. limits
+    # (see limits.SearchLimits) can stop the search early.
+
+    # with a node budget, run the memory-bounded variant
+    if max_nodes is not None:
+        return sma_star_search(problem, viewer, max_nodes, limits)
+
+    return _run(_best_first_steps(problem, viewer, weight, limits))
+
+
+@_uses_codec
+def uniform_search(problem: ProblemInterface, viewer: ViewerInterface = None,
+                   limits: Optional[SearchLimits] = None) \
+        -> \
+        Tuple[List[Node], float, float, float]:
+    return _run(_best_first_steps(problem, viewer, 0.0, limits))
+
+
+def _best_first_steps(problem: ProblemInterface,
+                      viewer: ViewerInterface = None, weight: float = 1.0,
+                      limits: Optional[SearchLimits] = None,
+                      events: bool = False) -> \
+        Iterator[Tuple[str, Any, float, Any]]:
+    # A* on g + weight * h; with weight 0 it is the uniform cost search
+    # and the heuristic is not called at all.
+    store = NodeStore()
+    frontier = make_frontier(problem)
+    if limits is not None:
+        limits.start()
 
     n_generated = 0
     n_expanded = 0
 
-    # nodes whose neighbors were already generated
-    visiteds = set()
-
-    cost_g: Dict[Node, float] = {}
-    cost_f: Dict[Node, float] = {}
+    # states whose neighbors were already generated, for the viewer
+    visiteds = make_visited(problem) if viewer is not None else None
 
+    # id of the node holding the best known g of each state
+    node_of: Dict[Any, int] = {}
 
-    cost_g[start_node] = 0
-    cost_f[start_node] = problem.heuristic_cost(
-        start_node.state)
+    start = problem.initial_state()
+    node_of[start] = store.add(start, g=0)
+    frontier.push(start,
+                  weight * problem.heuristic_cost(start) if weight else 0)
+    if events:
+        yield 'generate', start, 0.0, None
     goal_node = None
 
     while frontier:
-        current_node: Node = min(frontier, key=lambda x: cost_f[x])
+        current = frontier.peek()
+        current_id = node_of[current]
 
-        if problem.is_goal(current_node.state):
-            goal_node = current_node
+        if problem.is_goal(current):
+            goal_node = current_id
+            if events:
+                yield 'goal', current, store.g(current_id), None
             break
 
-        frontier.remove(current_node)
+        if limits is not None and limits.stop(n_expanded):
+            break
 
-        neighbors = _generate_neighbors(current_node, problem)
+        frontier.pop()
+        n_expanded += 1
+        if events:
+            yield 'expand', current, store.g(current_id), None
 
-        for neighbor in neighbors:
-            if neighbor not in cost_f:
-                cost_f[neighbor] = Infinity
-                cost_g[neighbor] = Infinity
+        neighbors = _generate_neighbors(current, problem)
 
-            new_cost = cost_g[current_node] + problem.step_cost(
-                state=current_node.state,
+        for action, neighbor in neighbors:
+            new_cost = store.g(current_id) + problem.step_cost(
+                state=current,
                 action=None,
-                next_state=neighbor.state)
-
-            if neighbor not in visiteds or new_cost < cost_g[
-                neighbor]:
+                next_state=neighbor)
 
-                cost_g[neighbor] = new_cost
-                cost_f[neighbor] = new_cost + problem.heuristic_cost(
-                    neighbor.state)
+            neighbor_id = node_of.get(neighbor)
+            if neighbor_id is None or new_cost < store.g(neighbor_id):
 
-                visiteds.add(current_node)
-                n_expanded+=1
+                node_of[neighbor] = store.add(neighbor, current_id, action,
+                                              new_cost)
 
                 if neighbor not in frontier:
-                    frontier.add(neighbor)
                     n_generated+=1
+                # decrease-key when the neighbor is already in the
+                # frontier; the new node carries the new parent.
+                if weight:
+                    frontier.push(neighbor, new_cost + weight *
+                                  problem.heuristic_cost(neighbor))
+                else:
+                    frontier.push(neighbor, new_cost)
+                if events:
+                    yield 'generate', neighbor, new_cost, current
         if viewer is not None:
-            viewer.update(current_node.state,
+            visiteds.add(current)
+            viewer.update(current,
                           generated=frontier,
                           expanded=visiteds)
 
-    path = _extract_path(goal_node)
+    path = _extract_path(store, goal_node)
     cost = _path_cost(problem, path)
 
     return path, cost, n_generated, n_expanded
 
 
-def uniform_search(problem: ProblemInterface, viewer: ViewerInterface = None) \
-        -> \
-        Tuple[List[Node], float, float, float]:
-    start_node = Node(problem.initial_state())
-    frontier = set()
-    frontier.add(start_node)
+@_uses_codec
+def bidirectional_breadth_first_search(problem: ProblemInterface,
+                                       viewer: ViewerInterface = None) \
+        -> Tuple[List[Node], float, float, float]:
+    # the problem must provide reversed(), the same problem searched
+    # from the goal (see MazeProblem.reversed).
+    problems = (problem, problem.reversed())
+    stores = (NodeStore(), NodeStore())
+
+    # id of the node holding each state seen by each side
+    node_of: Tuple[Dict[Any, int], Dict[Any, int]] = ({}, {})
+
+    # states of the deepest layer of each side, not expanded yet
+    layers: List[List[Any]] = [[], []]
+
+    # states whose neighbors were already generated, for the viewer
+    expanded = make_visited(problem) if viewer is not None else None
 
     n_generated = 0
     n_expanded = 0
 
-    # nodes whose neighbors were already generated
-    visiteds = set()
+    for side in (0, 1):
+        state = problems[side].initial_state()
+        node_of[side][state] = stores[side].add(state)
+        layers[side].append(state)
+
+    meeting = None
+    if problem.is_goal(problem.initial_state()):
+        meeting = problem.initial_state()
+
+    # Expand whole layers, always on the side with the smaller
+    # layer. Before a layer is expanded the two seen sets are
+    # disjoint, so the first state generated by one side that the
+    # other side has already seen closes a path with the fewest steps.
+    while meeting is None and layers[0] and layers[1]:
+        side = 0 if len(layers[0]) <= len(layers[1]) else 1
+        other = 1 - side
+        next_layer = []
+
+        for state in layers[side]:
+            state_id = node_of[side][state]
+
+            for action, n in _generate_neighbors(state, problems[side]):
+                if n in node_of[side]:
+                    continue
+                node_of[side][n] = stores[side].add(n, state_id, action)
+                n_generated += 1
+                if n in node_of[other]:
+                    meeting = n
+                    break
+                next_layer.append(n)
 
-    cost_g: Dict[Node, float] = {}
+            n_expanded += 1
 
+            if viewer is not None:
+                expanded.add(state)
+                viewer.update(state,
+                              generated=next_layer + layers[other],
+                              expanded=expanded)
 
-    cost_g[start_node] = 0
+            if meeting is not None:
+                break
 
-    goal_node = None
+        layers[side] = next_layer
 
-    while frontier:
-        current_node: Node = min(frontier, key=lambda x: cost_g[x])
+    path = []
+    if meeting is not None:
+        path = _join_paths(problem,
+                           stores[0], node_of[0][meeting],
+                           stores[1], node_of[1][meeting])
+    cost = _path_cost(problem, path)
+
+    return path, cost, n_generated, n_expanded
 
-        if problem.is_goal(current_node.state):
-            goal_node = current_node
-            break
 
-        frontier.remove(current_node)
+@_uses_codec
+def bidirectional_a_star_search(problem: ProblemInterface,
+                                viewer: ViewerInterface = None) \
+        -> Tuple[List[Node], float, float, float]:
+    # the problem must provide reversed(), the same problem searched
+    # from the goal; its heuristic_cost then estimates the cost to
+    # the initial state.
+    problems = (problem, problem.reversed())
+    stores = (NodeStore(), NodeStore())
+    frontiers = (make_frontier(problem), make_frontier(problem))
 
-        neighbors = _generate_neighbors(current_node, problem)
+    # id of the node holding the best known g of each state, per side
+    node_of: Tuple[Dict[Any, int], Dict[Any, int]] = ({}, {})
 
-        for neighbor in neighbors:
-            if neighbor not in cost_g:
-                cost_g[neighbor] = Infinity
+    # states whose neighbors were already generated, for the viewer
+    visiteds = make_visited(problem) if viewer is not None else None
 
-            new_cost = cost_g[current_node] + problem.step_cost(
-                state=current_node.state,
+    n_generated = 0
+    n_expanded = 0
+
+    def potential(side: int, state: Any) -> float:
+        # average of the two heuristics; the forward and backward
+        # potentials add up to zero, so both searches are Dijkstra on
+        # the same graph with consistent reduced costs.
+        return (problems[side].heuristic_cost(state)
+                - problems[1 - side].heuristic_cost(state)) / 2
+
+    for side in (0, 1):
+        state = problems[side].initial_state()
+        node_of[side][state] = stores[side].add(state, g=0)
+        frontiers[side].push(state, potential(side, state))
+
+    # cheapest path found so far and the state where both sides meet
+    best_cost = inf
+    meeting = None
+    if problem.is_goal(problem.initial_state()):
+        best_cost = 0
+        meeting = problem.initial_state()
+
+    while frontiers[0] and frontiers[1]:
+        # Stopping rule of bidirectional Dijkstra on the reduced
+        # costs: with potentials that add up to zero, the sum of the
+        # two lowest keys is a lower bound on any path not found yet.
+        if (frontiers[0].priority(frontiers[0].peek())
+                + frontiers[1].priority(frontiers[1].peek())) >= best_cost:
+            break
+
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        other = 1 - side
+        store = stores[side]
+
+        current = frontiers[side].pop()
+        current_id = node_of[side][current]
+        n_expanded += 1
+
+        for action, neighbor in _generate_neighbors(current,
+                                                    problems[side]):
+            new_cost = store.g(current_id) + problem.step_cost(
+                state=current,
                 action=None,
-                next_state=neighbor.state)
+                next_state=neighbor)
 
-            if neighbor not in visiteds or new_cost < cost_g[
-                neighbor]:
+            neighbor_id = node_of[side].get(neighbor)
+            if neighbor_id is None or new_cost < store.g(neighbor_id):
 
-                cost_g[neighbor] = new_cost
-                visiteds.add(current_node)
-                n_expanded+=1
+                node_of[side][neighbor] = store.add(neighbor, current_id,
+                                                    action, new_cost)
 
-                if neighbor not in frontier:
-                    frontier.add(neighbor)
+                if neighbor not in frontiers[side]:
                     n_generated+=1
+                frontiers[side].push(neighbor,
+                                     new_cost + potential(side, neighbor))
+
+                # the other side already reached this state: both
+                # halves form a complete path.
+                other_id = node_of[other].get(neighbor)
+                if other_id is not None:
+                    path_cost = new_cost + stores[other].g(other_id)
+                    if path_cost < best_cost:
+                        best_cost = path_cost
+                        meeting = neighbor
+
+        if viewer is not None:
+            visiteds.add(current)
+            viewer.update(current,
+                          generated=list(frontiers[0]) + list(frontiers[1]),
+                          expanded=visiteds)
+
+    path = []
+    if meeting is not None:
+        path = _join_paths(problem,
+                           stores[0], node_of[0][meeting],
+                           stores[1], node_of[1][meeting])
+    cost = _path_cost(problem, path)
+
+    return path, cost, n_generated, n_expanded
+
+
+def _join_paths(problem: ProblemInterface,
+                forward_store: NodeStore, forward_id: int,
+                backward_store: NodeStore, backward_id: int) -> List[Node]:
+    # forward half: from the initial state to the meeting state
+    path = _extract_path(forward_store, forward_id)
+
+    # backward half: follow the backward parents from the meeting
+    # state to the goal, recovering the forward action of each step.
+    previous_node = path[-1]
+    node_id = backward_store.parent(backward_id)
+    while node_id != NO_PARENT:
+        state = backward_store.state(node_id)
+        previous_node = Node(state,
+                             _action_to(problem, previous_node.state, state),
+                             previous_node)
+        path.append(previous_node)
+        node_id = backward_store.parent(node_id)
+    return path
+
+
+def _action_to(problem: ProblemInterface, state: Any, next_state: Any) -> Any:
+    for action in problem.actions(state):
+        if problem.transition(state, action) == next_state:
+            return action
+    return None
+
+
+@_uses_codec
+def ida_star_search(problem: ProblemInterface, viewer: ViewerInterface = None,
+                    table_size: int = 0,
+                    stats: Optional[Dict[str, float]] = None,
+                    limits: Optional[SearchLimits] = None) \
+        -> Tuple[List[Node], float, float, float]:
+    """ Iterative-deepening A*.
+
+    Runs depth-first searches bounded by f = g + h, raising the bound to
+    the smallest f that exceeded it until the goal is reached. Only the
+    current path (and the actions left to try at each of its states) is
+    kept, so memory grows linearly with the solution depth. States
+    already on the path are skipped to avoid cycles. With table_size > 0
+    a transposition table of at most that many states remembers the
+    lowest g each state was reached with in the current iteration and
+    prunes costlier revisits.
+
+    When the goal cannot be reached the search only ends once the bound
+    is above the f of every reachable state, and with real step costs
+    every iteration raises it by very little, so on unsolvable problems
+    it can run for a very long time; limits (see limits.SearchLimits)
+    can stop it early.
+
+    If a stats dictionary is given it is filled with the number of
+    iterations, expanded and generated states and the peak number of
+    states held in memory (path plus table).
+    """
+    if limits is not None:
+        limits.start()
+
+    start = problem.initial_state()
+    bound = problem.heuristic_cost(start)
+
+    n_generated = 0
+    n_expanded = 0
+    iterations = 0
+    peak_depth = 0
+    peak_table_size = 0
+    peak_stored_states = 0
+
+    # states, actions and costs of the current path
+    states: List[Any] = [start]
+    actions: List[Any] = [None]
+    costs: List[float] = [0]
+    goal_found = problem.is_goal(start)
+
+    while not goal_found and bound < inf:
+        iterations += 1
+        next_bound = inf
+
+        # lowest g of each state reached in this iteration
+        table: Dict[Any, float] = {}
+
+        states = [start]
+        actions = [None]
+        costs = [0]
+        on_path = {start}
+
+        if limits is not None and limits.stop(n_expanded):
+            break
+
+        # neighbors still to be tried at each state of the path
+        branches = [iter(_generate_neighbors(start, problem))]
+        n_expanded += 1
+
+        while branches:
+            step = next(branches[-1], None)
+
+            # every neighbor was tried: backtrack
+            if step is None:
+                branches.pop()
+                on_path.discard(states.pop())
+                actions.pop()
+                costs.pop()
+                continue
+
+            action, state = step
+            if state in on_path:
+                continue
+
+            n_generated += 1
+            g = costs[-1] + problem.step_cost(states[-1], action, state)
+            f = g + problem.heuristic_cost(state)
+            if f > bound:
+                next_bound = min(next_bound, f)
+                continue
+
+            if table_size > 0:
+                best = table.get(state)
+                if best is not None and best <= g:
+                    continue
+                if best is not None or len(table) < table_size:
+                    table[state] = g
+
+            states.append(state)
+            actions.append(action)
+            costs.append(g)
+            on_path.add(state)
+
+            peak_depth = max(peak_depth, len(states))
+            peak_table_size = max(peak_table_size, len(table))
+            peak_stored_states = max(peak_stored_states,
+                                     len(states) + len(table))
+
+            if problem.is_goal(state):
+                goal_found = True
+                break
+
+            if limits is not None and limits.stop(n_expanded):
+                next_bound = inf
+                break
+
+            branches.append(iter(_generate_neighbors(state, problem)))
+            n_expanded += 1
+
+            if viewer is not None:
+                viewer.update(state,
+                              generated=states,
+                              expanded=table)
+
+        bound = next_bound
+
+    path = []
+    if goal_found:
+        previous_node = None
+        for state, action in zip(states, actions):
+            previous_node = Node(state, action, previous_node)
+            path.append(previous_node)
+    cost = _path_cost(problem, path)
+
+    if stats is not None:
+        stats['iterations'] = iterations
+        stats['expanded'] = n_expanded
+        stats['generated'] = n_generated
+        stats['peak_depth'] = peak_depth
+        stats['peak_table_size'] = peak_table_size
+        stats['peak_stored_states'] = peak_stored_states
+
+    return path, cost, n_generated, n_expanded
+
+
+@_uses_codec
+def sma_star_search(problem: ProblemInterface, viewer: ViewerInterface = None,
+                    max_nodes: int = 100000,
+                    limits: Optional[SearchLimits] = None) \
+        -> Tuple[List[Node], float, float, float]:
+    """ Simplified memory-bounded A* (SMA*).
+
+    Works like A* on the search tree but keeps at most max_nodes nodes
+    in memory (one expansion may go over it by a few successors until
+    the next one is selected). When the budget is exceeded the leaf
+    with the highest f (the shallowest among equal f) is forgotten and
+    its f is backed up into its parent, which is selected again when
+    that value becomes the lowest, regenerating the forgotten
+    successors. Paths that cannot fit in the budget get f = inf, so the
+    result is the cheapest solution that fits in memory, or an empty
+    path when none does.
+
+    For each state seen, the lowest g it was generated with, the state
+    it was generated from and the f its node had when it was forgotten
+    are remembered (a few floats per state, much less than a node).
+    Only that path to the state is generated again, and with that f,
+    so the search tree is finite and what was learned below a
+    forgotten node is not lost: on an unsolvable problem every f ends
+    up inf and the search returns an empty path, instead of walking
+    the exponentially many paths of the maze. limits (see
+    limits.SearchLimits) can stop the search early.
+    """
+    store = NodeStore(min(max_nodes, 1024))
+    if limits is not None:
+        limits.start()
+
+    # nodes that can be selected: leaves by their f and nodes with
+    # forgotten successors by the lowest forgotten f. The deepest
+    # node is selected among equal values.
+    open_nodes = make_frontier(problem)
+
+    # leaves that can be forgotten: highest f, shallowest first
+    leaves = PriorityFrontier()
+
+    f: Dict[int, float] = {}
+    depth: Dict[int, int] = {}
+    children: Dict[int, List[int]] = {}
+    forgotten: Dict[int, float] = {}
+
+    # lowest g each state was generated with and the state it was
+    # generated from; costlier duplicates, and duplicates as cheap
+    # reached from another state, are not generated.
+    best_g: Dict[Any, Tuple[float, Any]] = {}
+
+    # f of the node of best_g of each state when it was forgotten, so
+    # the node is generated again with what was learned below it. With
+    # f = inf nothing below it fits in memory, and it is not generated
+    # again at all.
+    backed_up: Dict[Any, float] = {}
+
+    n_generated = 0
+    n_expanded = 0
+
+    start = problem.initial_state()
+    root = store.add(start, g=0)
+    f[root] = problem.heuristic_cost(start)
+    depth[root] = 0
+    children[root] = []
+    forgotten[root] = inf
+    best_g[start] = (0, None)
+    open_nodes.push(root, (f[root], 0))
+    goal_node = None
+
+    def backup(node: int) -> None:
+        # a node's f is the lowest f among its successors, in memory
+        # or forgotten; propagate changes up to the root.
+        while node != NO_PARENT and children[node]:
+            value = min(forgotten[node], min(f[c] for c in children[node]))
+            if value == f[node]:
+                break
+            f[node] = value
+            node = store.parent(node)
+
+    while open_nodes:
+        node = open_nodes.peek()
+        bound = open_nodes.priority(node)[0]
+
+        # nothing left that fits in memory, or the problem has no
+        # solution
+        if bound == inf:
+            break
+
+        if limits is not None and limits.stop(n_expanded):
+            break
+
+        state = store.state(node)
+        if not children[node] and problem.is_goal(state):
+            goal_node = node
+            break
+
+        open_nodes.pop()
+        if node in leaves:
+            leaves.remove(node)
+
+        # skip states on the path (cycles) and successors still in memory
+        skip = {store.state(c) for c in children[node]}
+        ancestor = node
+        while ancestor != NO_PARENT:
+            skip.add(store.state(ancestor))
+            ancestor = store.parent(ancestor)
+
+        g = store.g(node)
+        for action, next_state in _generate_neighbors(state, problem):
+            if next_state in skip:
+                continue
+
+            child_g = g + problem.step_cost(state, action, next_state)
+            best = best_g.get(next_state)
+            if best is None or child_g < best[0]:
+                best_g[next_state] = (child_g, state)
+                backed_up.pop(next_state, None)
+            elif best != (child_g, state) or \
+                    backed_up.get(next_state) == inf:
+                continue
+            child_f = backed_up.get(next_state, 0)
+
+            child = store.add(next_state, node, action, child_g)
+            n_generated += 1
+            depth[child] = depth[node] + 1
+            children[child] = []
+            forgotten[child] = inf
+            if depth[child] >= max_nodes - 1 and \
+                    not problem.is_goal(next_state):
+                # this path cannot be extended within the budget
+                f[child] = inf
+            else:
+                f[child] = max(bound, child_f, child_g +
+                               problem.heuristic_cost(next_state))
+            children[node].append(child)
+            open_nodes.push(child, (f[child], -depth[child]))
+            leaves.push(child, (-f[child], depth[child]))
+
+        n_expanded += 1
+        forgotten[node] = inf
+
+        if children[node]:
+            backup(node)
+        else:
+            # dead end: keep it as a leaf that is forgotten first
+            f[node] = inf
+            open_nodes.push(node, (inf, -depth[node]))
+            if node != root:
+                leaves.push(node, (-inf, depth[node]))
+            backup(store.parent(node))
+
+        # forget the worst leaves until the tree fits in the budget,
+        # but never the node that will be selected next.
+        while len(store) > max_nodes and leaves:
+            worst = leaves.peek()
+            if worst == open_nodes.peek():
+                break
+            leaves.pop()
+            open_nodes.remove(worst)
+
+            parent = store.parent(worst)
+            children[parent].remove(worst)
+            forgotten[parent] = min(forgotten[parent], f[worst])
+
+            worst_state = store.state(worst)
+            if best_g[worst_state] == (store.g(worst), store.state(parent)):
+                backed_up[worst_state] = f[worst]
+
+            del f[worst], depth[worst], children[worst], forgotten[worst]
+            store.free(worst)
+
+            if children[parent]:
+                open_nodes.push(parent, (forgotten[parent], -depth[parent]))
+            else:
+                # every successor was forgotten: the parent is a leaf again
+                f[parent] = forgotten[parent]
+                forgotten[parent] = inf
+                open_nodes.push(parent, (f[parent], -depth[parent]))
+                if parent != root:
+                    leaves.push(parent, (-f[parent], depth[parent]))
 
         if viewer is not None:
-            viewer.update(current_node.state,
+            viewer.update(state,
+                          generated=[store.state(n) for n in open_nodes],
+                          expanded=[store.state(n) for n in children
+                                    if children[n]])
+
+    path = _extract_path(store, goal_node)
+    cost = _path_cost(problem, path)
+
+    return path, cost, n_generated, n_expanded
+
+
+def iter_anytime_a_star_search(problem: ProblemInterface,
+                               viewer: ViewerInterface = None,
+                               time_budget: Optional[float] = None,
+                               initial_weight: float = 3.0,
+                               weight_step: float = 0.5) \
+        -> Iterator[Tuple[List[Node], float, float, float, float]]:
+    """ Anytime repairing A* (ARA*).
+
+    Starts as weighted A* with initial_weight and, after each solution,
+    lowers the weight by weight_step and repairs the previous search
+    instead of starting over: only the states whose g improved since
+    they were expanded are queued again. Yields (path, cost, bound,
+    n_generated, n_expanded) whenever the solution gets cheaper or its
+    bound gets tighter, where bound
+    is the proven suboptimality factor (cost <= bound * optimal cost).
+    Stops after a solution with bound 1 (optimal), when a pass neither
+    improves the solution nor has anything left to expand, or when
+    time_budget seconds have passed; a search interrupted by the
+    deadline yields nothing more. weight_step must be positive, or the
+    weight would never reach 1.
+    """
+    # checked here, not in the generator, so the error is raised by the
+    # call and not by the first next()
+    if weight_step <= 0:
+        raise ValueError("weight_step must be positive")
+    return _anytime_a_star_steps(problem, viewer, time_budget,
+                                 initial_weight, weight_step)
+
+
+def _anytime_a_star_steps(problem: ProblemInterface, viewer: ViewerInterface,
+                          time_budget: Optional[float], initial_weight: float,
+                          weight_step: float) \
+        -> Iterator[Tuple[List[Node], float, float, float, float]]:
+    deadline = inf if time_budget is None else time.perf_counter() + time_budget
+
+    store = NodeStore()
+    weight = max(1.0, initial_weight)
+
+    n_generated = 0
+    n_expanded = 0
+
+    # id of the node holding the best known g of each state
+    node_of: Dict[Any, int] = {}
+
+    # states expanded with the current weight and states whose g
+    # improved after they were expanded (to be queued again); node_of
+    # keeps the states anyway, so closed is a plain set
+    closed = set()
+    inconsistent = set()
+
+    def priority(state: Any) -> float:
+        return store.g(node_of[state]) + weight * problem.heuristic_cost(state)
+
+    start = problem.initial_state()
+    node_of[start] = store.add(start, g=0)
+    frontier = make_frontier(problem)
+    frontier.push(start, priority(start))
+
+    # best goal reached so far
+    goal = start if problem.is_goal(start) else None
+    goal_cost = 0 if goal is not None else inf
+
+    # last solution yielded, and the solution of the previous pass
+    last_cost = inf
+    last_bound = inf
+    previous = None
+
+    while True:
+        if time.perf_counter() > deadline:
+            return
+
+        # expand until no state in the frontier can improve the goal
+        while frontier and frontier.priority(frontier.peek()) < goal_cost:
+            if time.perf_counter() > deadline:
+                return
+
+            current = frontier.pop()
+            current_id = node_of[current]
+            closed.add(current)
+            n_expanded += 1
+
+            for action, neighbor in _generate_neighbors(current, problem):
+                new_cost = store.g(current_id) + problem.step_cost(
+                    state=current,
+                    action=None,
+                    next_state=neighbor)
+
+                neighbor_id = node_of.get(neighbor)
+                if neighbor_id is None or new_cost < store.g(neighbor_id):
+                    node_of[neighbor] = store.add(neighbor, current_id,
+                                                  action, new_cost)
+
+                    if problem.is_goal(neighbor) and new_cost < goal_cost:
+                        goal = neighbor
+                        goal_cost = new_cost
+
+                    if neighbor in closed:
+                        inconsistent.add(neighbor)
+                    else:
+                        if neighbor not in frontier:
+                            n_generated += 1
+                        frontier.push(neighbor, priority(neighbor))
+
+            if viewer is not None:
+                viewer.update(current,
+                              generated=frontier,
+                              expanded=closed)
+
+        if goal is None:
+            # the goal is unreachable
+            return
+
+        # the lowest unweighted f of the states left to expand is a lower
+        # bound on the optimal cost
+        lower_bound = min(
+            (store.g(node_of[s]) + problem.heuristic_cost(s)
+             for s in (list(frontier) + list(inconsistent))),
+            default=goal_cost)
+        bound = 1.0
+        if goal_cost > 0 and lower_bound < goal_cost:
+            bound = min(weight, goal_cost / lower_bound)
+
+        # report only solutions that are cheaper or have a tighter bound
+        if goal_cost < last_cost or bound < last_bound:
+            last_cost, last_bound = goal_cost, bound
+            path = _extract_path(store, node_of[goal])
+            yield path, _path_cost(problem, path), bound, n_generated, \
+                n_expanded
+
+        if bound <= 1.0:
+            return
+        if previous == (goal_cost, bound) and not frontier \
+                and not inconsistent:
+            return
+        previous = goal_cost, bound
+
+        # lower the weight and requeue the inconsistent states
+        weight = max(1.0, weight - weight_step)
+        states = list(frontier) + list(inconsistent)
+        frontier = make_frontier(problem)
+        for state in states:
+            frontier.push(state, priority(state))
+        inconsistent = set()
+        closed = set()
+
+
+def anytime_a_star_search(problem: ProblemInterface,
+                          viewer: ViewerInterface = None,
+                          time_budget: Optional[float] = None,
+                          initial_weight: float = 3.0,
+                          weight_step: float = 0.5,
+                          on_solution: Optional[
+                              Callable[[List[Node], float, float], None]] = None) \
+        -> Tuple[List[Node], float, float, float]:
+    # Run ARA* (see iter_anytime_a_star_search) and return the best
+    # solution found within the time budget. on_solution(path, cost,
+    # bound) is called for every intermediate solution.
+    path, cost, n_generated, n_expanded = [], inf, 0, 0
+    for path, cost, bound, n_generated, n_expanded in \
+            iter_anytime_a_star_search(problem, viewer, time_budget,
+                                       initial_weight, weight_step):
+        if on_solution is not None:
+            on_solution(path, cost, bound)
+    return path, cost, n_generated, n_expanded
+
+
+@_uses_codec
+def greedy_best_first_search(problem: ProblemInterface,
+                             viewer: ViewerInterface = None,
+                             limits: Optional[SearchLimits] = None) \
+        -> Tuple[List[Node], float, float, float]:
+    # Best first on the heuristic alone: always expands the generated
+    # state that looks closest to the goal. Each state is generated
+    # once, so the search is fast on open mazes, but the path is not
+    # guaranteed to be the cheapest.
+    store = NodeStore()
+    frontier = make_frontier(problem)
+    if limits is not None:
+        limits.start()
+
+    n_generated = 0
+    n_expanded = 0
+
+    # states whose neighbors were already generated, for the viewer
+    visiteds = make_visited(problem) if viewer is not None else None
+
+    # id of the node of each generated state
+    node_of: Dict[Any, int] = {}
+
+    start = problem.initial_state()
+    node_of[start] = store.add(start)
+    frontier.push(start, problem.heuristic_cost(start))
+    goal_node = node_of[start] if problem.is_goal(start) else None
+
+    while frontier and goal_node is None:
+        if limits is not None and limits.stop(n_expanded):
+            break
+
+        current = frontier.pop()
+        current_id = node_of[current]
+        n_expanded += 1
+
+        for action, neighbor in _generate_neighbors(current, problem):
+            if neighbor in node_of:
+                continue
+            node_of[neighbor] = store.add(neighbor, current_id, action)
+            n_generated += 1
+            # goal test on generation: the goal would be the next
+            # state expanded anyway, since its heuristic is 0
+            if problem.is_goal(neighbor):
+                goal_node = node_of[neighbor]
+                break
+            frontier.push(neighbor, problem.heuristic_cost(neighbor))
+
+        if viewer is not None:
+            visiteds.add(current)
+            viewer.update(current,
                           generated=frontier,
                           expanded=visiteds)
 
-    path = _extract_path(goal_node)
+    path = _extract_path(store, goal_node)
+    cost = _path_cost(problem, path)
+
+    return path, cost, n_generated, n_expanded
+
+
+@_uses_codec
+def beam_search(problem: ProblemInterface, viewer: ViewerInterface = None,
+                beam_width: int = 100,
+                limits: Optional[SearchLimits] = None) \
+        -> Tuple[List[Node], float, float, float]:
+    """ Breadth-first search that keeps only the best beam_width states
+    of each layer.
+
+    The successors of the current layer that were not seen before are
+    ranked by g + h and only the beam_width best become the next
+    layer, so the frontier never holds more than beam_width states
+    and the work per layer is bounded. The search gives up
+    completeness and optimality: it fails (empty path) when every
+    state of a layer is a dead end, even if a path exists. Only the
+    nodes of the layers (at most beam_width per layer) are stored for
+    the path.
+    """
+    store = NodeStore()
+    if limits is not None:
+        limits.start()
+
+    n_generated = 0
+    n_expanded = 0
+
+    # states seen in any layer, so the beam does not walk back
+    visiteds = make_visited(problem)
+
+    start = problem.initial_state()
+    layer = [store.add(start, g=0)]
+    visiteds.add(start)
+    goal_node = layer[0] if problem.is_goal(start) else None
+
+    while layer and goal_node is None:
+        # (g + h, insertion order, state, parent id, action, g)
+        candidates = []
+        for node_id in layer:
+            if limits is not None and limits.stop(n_expanded):
+                layer = []
+                break
+
+            state = store.state(node_id)
+            n_expanded += 1
+            for action, neighbor in _generate_neighbors(state, problem):
+                if neighbor in visiteds:
+                    continue
+                visiteds.add(neighbor)
+                n_generated += 1
+                g = store.g(node_id) + problem.step_cost(state, action,
+                                                         neighbor)
+                if problem.is_goal(neighbor):
+                    goal_node = store.add(neighbor, node_id, action, g)
+                    break
+                candidates.append((g + problem.heuristic_cost(neighbor),
+                                   len(candidates), neighbor, node_id,
+                                   action, g))
+            if goal_node is not None:
+                break
+
+        if goal_node is not None or not layer:
+            break
+
+        candidates.sort()
+        layer = [store.add(neighbor, parent_id, action, g)
+                 for _, _, neighbor, parent_id, action, g
+                 in candidates[:beam_width]]
+
+        if viewer is not None:
+            viewer.update(store.state(layer[0]) if layer else None,
+                          generated=[store.state(n) for n in layer],
+                          expanded=visiteds)
+
+    path = _extract_path(store, goal_node)
     cost = _path_cost(problem, path)
 
     return path, cost, n_generated, n_expanded
@@ -0,0 +1,264 @@
+import csv
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from trab1.src.frontier import IndexedFrontier, PriorityFrontier
+from trab1.src.problems import ProblemInterface
+
+
+class SearchStats:
+    """ Counters and timers of one search run, filled by measure().
+
+    Everything is counted at the ProblemInterface, so the numbers mean
+    the same for every search that expands states through
+    problem.actions():
+        expanded        calls to actions() (one per expansion)
+        reopened        expansions of a state that was expanded before
+        generated       calls to transition() (one per successor)
+        duplicates      successors that had already been generated
+        heuristic_calls calls to heuristic_cost()
+        peak_frontier   largest frontier size after a push/append
+        peak_closed     distinct expanded states (the closed list of a
+                        graph search never shrinks)
+    and the seconds spent in actions() plus transition(), in
+    heuristic_cost() and in frontier operations, the total time and
+    the tracemalloc peak in bytes above the memory traced when the
+    search started (None when memory was not traced). Searches that do
+    not use actions() (jump_point_search, the NumPy wavefront) only get
+    the timers and the memory peak, and only the frontiers created
+    with frontier.make_frontier are timed.
+    """
+
+    FIELDS = ('algorithm', 'cost', 'path_len', 'generated', 'expanded',
+              'reopened', 'duplicates', 'heuristic_calls', 'peak_frontier',
+              'peak_closed', 'time_actions', 'time_heuristic',
+              'time_frontier', 'time_total', 'peak_memory')
+
+    def __init__(self, algorithm: str = ''):
+        self.algorithm = algorithm
+        self.cost = float('inf')
+        self.path_len = -1
+        self.generated = 0
+        self.expanded = 0
+        self.reopened = 0
+        self.duplicates = 0
+        self.heuristic_calls = 0
+        self.peak_frontier = 0
+        self.peak_closed = 0
+        self.time_actions = 0.0
+        self.time_heuristic = 0.0
+        self.time_frontier = 0.0
+        self.time_total = 0.0
+        self.peak_memory: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        return f"SearchStats({self.to_dict()})"
+
+
+def measure(search: Callable, problem: ProblemInterface, *args,
+            trace_memory: bool = True, **kwargs) \
+        -> Tuple[Tuple[Any, ...], SearchStats]:
+    """ Run search(problem, *args, **kwargs) and collect its SearchStats.
+
+    Returns the result of the search unchanged and the stats. The
+    problem is wrapped in a counting proxy, which also hands the
+    search timed frontiers (see frontier.make_frontier), so the search
+    code itself is not changed and other searches running at the same
+    time are not measured. Tracing memory slows the run down; pass
+    trace_memory=False when the timers matter more than the memory
+    peak. If the caller is already tracing memory it is left tracing,
+    and the peak is only known when the search went over the peak the
+    caller had reached (None otherwise).
+    """
+    stats = SearchStats(getattr(search, '__name__', str(search)))
+    closed_sets: List[set] = []
+    counting = _CountingProblem(problem, stats, closed_sets)
+
+    was_tracing = tracemalloc.is_tracing()
+    if trace_memory:
+        if not was_tracing:
+            tracemalloc.start()
+        traced_before, peak_before = tracemalloc.get_traced_memory()
+    start_time = time.perf_counter()
+    try:
+        result = search(counting, *args, **kwargs)
+    finally:
+        stats.time_total = time.perf_counter() - start_time
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            if not was_tracing or peak > peak_before:
+                stats.peak_memory = peak - traced_before
+            if not was_tracing:
+                tracemalloc.stop()
+
+    path, cost = result[0], result[1]
+    stats.cost = cost
+    stats.path_len = len(path) - 1
+    stats.peak_closed = sum(len(closed) for closed in closed_sets)
+    return result, stats
+
+
+def write_stats_json(stats: Iterable[SearchStats],
+                     file_name: str = 'estatisticas.json') -> None:
+    with open(file_name, 'w', encoding='UTF8') as f:
+        json.dump([s.to_dict() for s in stats], f, indent=2)
+
+
+def write_stats_csv(stats: Iterable[SearchStats],
+                    file_name: str = 'estatisticas.csv') -> None:
+    # same format as resultados.csv
+    with open(file_name, 'w', encoding='UTF8', newline='') as f:
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(SearchStats.FIELDS)
+        for s in stats:
+            writer.writerow([getattr(s, field) for field in SearchStats.FIELDS])
+
+
+class _CountingProblem(ProblemInterface):
+    # Forwards every call to the wrapped problem, counting and timing
+    # the ones the stats need; other attributes (_maze, n_rows, ...)
+    # are read from the wrapped problem.
+
+    def __init__(self, problem: ProblemInterface, stats: SearchStats,
+                 closed_sets: List[set]):
+        self._problem = problem
+        self._stats = stats
+        self._closed_sets = closed_sets
+        self._expanded_states = set()
+        self._generated_states = set()
+        closed_sets.append(self._expanded_states)
+
+        # the sets keep the codes of problems with a codec, whose
+        # states may not be hashable
+        self._key = problem.encode if problem.has_codec() else None
+
+    def actions(self, state: Any) -> List[Any]:
+        stats = self._stats
+        start_time = time.perf_counter()
+        actions = self._problem.actions(state)
+        stats.time_actions += time.perf_counter() - start_time
+        stats.expanded += 1
+        key = state if self._key is None else self._key(state)
+        if key in self._expanded_states:
+            stats.reopened += 1
+        else:
+            self._expanded_states.add(key)
+        return actions
+
+    def transition(self, state: Any, action: Any) -> Any:
+        stats = self._stats
+        start_time = time.perf_counter()
+        next_state = self._problem.transition(state, action)
+        stats.time_actions += time.perf_counter() - start_time
+        stats.generated += 1
+        key = next_state if self._key is None else self._key(next_state)
+        if key in self._generated_states:
+            stats.duplicates += 1
+        else:
+            self._generated_states.add(key)
+        return next_state
+
+    def step_cost(self, state, action, next_state) -> float:
+        return self._problem.step_cost(state, action, next_state)
+
+    def heuristic_cost(self, state, *args) -> float:
+        stats = self._stats
+        start_time = time.perf_counter()
+        h = self._problem.heuristic_cost(state, *args)
+        stats.time_heuristic += time.perf_counter() - start_time
+        stats.heuristic_calls += 1
+        return h
+
+    def initial_state(self):
+        state = self._problem.initial_state()
+        self._generated_states.add(state if self._key is None
+                                   else self._key(state))
+        return state
+
+    def is_goal(self, state) -> bool:
+        return self._problem.is_goal(state)
+
+    def has_codec(self) -> bool:
+        return self._problem.has_codec()
+
+    def encode(self, state) -> int:
+        return self._problem.encode(state)
+
+    def decode(self, code: int):
+        return self._problem.decode(code)
+
+    def frontier_factory(self, priority: bool, lifo: bool):
+        # frontiers of this search only, timed into its stats
+        if priority:
+            return _TimedPriorityFrontier(self._stats)
+        return _TimedIndexedFrontier(self._stats, lifo)
+
+    def reversed(self) -> "_CountingProblem":
+        # the backward half of a bidirectional search is counted too,
+        # with its own closed list
+        return _CountingProblem(self._problem.reversed(), self._stats,
+                                self._closed_sets)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._problem, name)
+
+
+class _TimedPriorityFrontier(PriorityFrontier):
+    # a PriorityFrontier whose operations are timed into stats
+
+    def __init__(self, stats: SearchStats):
+        super().__init__()
+        self._stats = stats
+
+    def push(self, item: Any, priority: float) -> None:
+        start_time = time.perf_counter()
+        super().push(item, priority)
+        self._stats.time_frontier += time.perf_counter() - start_time
+        if len(self) > self._stats.peak_frontier:
+            self._stats.peak_frontier = len(self)
+
+    def pop(self) -> Any:
+        start_time = time.perf_counter()
+        try:
+            return super().pop()
+        finally:
+            self._stats.time_frontier += time.perf_counter() - start_time
+
+    def peek(self) -> Any:
+        start_time = time.perf_counter()
+        try:
+            return super().peek()
+        finally:
+            self._stats.time_frontier += time.perf_counter() - start_time
+
+    def remove(self, item: Any) -> None:
+        start_time = time.perf_counter()
+        super().remove(item)
+        self._stats.time_frontier += time.perf_counter() - start_time
+
+
+class _TimedIndexedFrontier(IndexedFrontier):
+    # an IndexedFrontier whose operations are timed into stats
+
+    def __init__(self, stats: SearchStats, lifo: bool = False):
+        super().__init__(lifo)
+        self._stats = stats
+
+    def append(self, item: Any) -> None:
+        start_time = time.perf_counter()
+        super().append(item)
+        self._stats.time_frontier += time.perf_counter() - start_time
+        if len(self) > self._stats.peak_frontier:
+            self._stats.peak_frontier = len(self)
+
+    def pop(self) -> Any:
+        start_time = time.perf_counter()
+        try:
+            return super().pop()
+        finally:
+            self._stats.time_frontier += time.perf_counter() - start_time
@@ -0,0 +1,63 @@
+from typing import Any, Callable, Iterator
+
+
+class BitsetVisited:
+    """ Set of states stored as one bit per state.
+
+    For problems whose states are numbered densely from 0 (see
+    make_visited), membership is a bit of a bytearray indexed by the
+    state number: no state is hashed or kept alive by the set, and a
+    1000x1000 maze needs 125 kB instead of tens of MB for a set of
+    tuples. Supports the part of the set interface the searches use
+    (add, in, len and iteration, which decodes the states back).
+
+    Each operation numbers the state in Python, so it is slower than a
+    set lookup, and it only saves memory when nothing else holds the
+    states: beam_search, which keeps the nodes of its layers only,
+    uses it to remember every state seen. Searches that store a node
+    per state check a plain set instead, and fill a visited store only
+    to show it to a viewer.
+    """
+
+    def __init__(self, n_states: int, state_index: Callable[[Any], int],
+                 index_state: Callable[[int], Any]):
+        self._bits = bytearray((n_states + 7) >> 3)
+        self._state_index = state_index
+        self._index_state = index_state
+        self._size = 0
+
+    def add(self, state: Any) -> None:
+        index = self._state_index(state)
+        bit = 1 << (index & 7)
+        byte = index >> 3
+        if not self._bits[byte] & bit:
+            self._bits[byte] |= bit
+            self._size += 1
+
+    def __contains__(self, state: Any) -> bool:
+        index = self._state_index(state)
+        return bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        for byte_index, byte in enumerate(self._bits):
+            if byte:
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        yield self._index_state(byte_index * 8 + bit)
+
+
+def make_visited(problem: Any):
+    """ Return an empty visited store for the states of problem.
+
+    Problems that number their states densely (n_states(),
+    state_index(state) and index_state(index), as MazeProblem) get a
+    BitsetVisited; any other problem gets a plain set.
+    """
+    if hasattr(problem, 'state_index') and hasattr(problem, 'index_state') \
+            and hasattr(problem, 'n_states'):
+        return BitsetVisited(problem.n_states(), problem.state_index,
+                             problem.index_state)
+    return set()
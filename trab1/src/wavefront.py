@@ -0,0 +1,164 @@
+from math import inf
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from trab1.src.problems import MazeProblem
+from trab1.src.search import Node, _path_cost
+from trab1.src.viewer import ViewerInterface
+
+Cell = Tuple[int, int]
+
+# the 8 moves of MazeProblem.actions and their euclidean step costs
+_MOVES = [(-1, -1), (0, -1), (1, -1), (-1, 0),
+          (1, 0), (1, 1), (0, 1), (-1, 1)]
+_MOVE_COSTS = np.array([(d_row ** 2 + d_col ** 2) ** 0.5
+                        for d_row, d_col in _MOVES])
+
+
+def distance_field(problem: MazeProblem, source: Optional[Cell] = None,
+                   method: str = 'dijkstra') -> Tuple[np.ndarray, np.ndarray]:
+    """ Distance and parent of every cell of the maze from source.
+
+    The maze is processed as a NumPy array, a whole wavefront at a
+    time: method='bfs' expands one BFS layer per step (distance in
+    number of moves) and method='dijkstra' settles one bucket of
+    euclidean distances per step. Since no move costs less than 1,
+    every frontier cell closer than the nearest one plus 1 is final,
+    so each bucket is settled at once.
+
+    Returns two (n_rows, n_cols) arrays: the distance (inf where
+    unreachable) and the parent as a flat index row * n_cols + col
+    (-1 for the source and unreachable cells). source defaults to the
+    initial state.
+    """
+    if source is None:
+        source = problem.initial_state()
+    n_rows, n_cols = problem.n_rows, problem.n_cols
+
+    # pad the maze with a border of obstacles, so the neighbors of
+    # every cell are at fixed flat offsets and need no bounds checks.
+    width = n_cols + 2
+    free = np.zeros((n_rows + 2, width), dtype=bool)
+    free[1:-1, 1:-1] = np.asarray(problem._maze) == 0
+    free = free.ravel()
+    offsets = np.array([d_row * width + d_col for d_row, d_col in _MOVES])
+
+    dist = np.full(free.size, inf)
+    parent = np.full(free.size, -1, dtype=np.int64)
+    start = (source[0] + 1) * width + source[1] + 1
+    dist[start] = 0
+
+    if method == 'bfs':
+        _bfs_layers(free, offsets, dist, parent, start)
+    elif method == 'dijkstra':
+        _dijkstra_buckets(free, offsets, dist, parent, start)
+    else:
+        raise ValueError(f"unknown method: {method}")
+
+    # back to the unpadded grid and flat indices
+    dist = dist.reshape(n_rows + 2, width)[1:-1, 1:-1]
+    parent = parent.reshape(n_rows + 2, width)[1:-1, 1:-1]
+    parent = np.where(parent >= 0,
+                      (parent // width - 1) * n_cols + parent % width - 1, -1)
+    return dist, parent
+
+
+def wavefront_search(problem: MazeProblem, viewer: ViewerInterface = None,
+                     method: str = 'dijkstra') \
+        -> Tuple[List[Node], float, float, float]:
+    # method='bfs' gives the path with the fewest moves, as
+    # breadth_first_search; method='dijkstra' gives the cheapest path,
+    # as uniform_search. The whole maze is processed, so the counters
+    # are the reachable cells (generated) and the settled cells
+    # (expanded).
+    dist, parent = distance_field(problem, method=method)
+    goal = problem._goal_state
+
+    path = path_from_field(parent, problem.n_cols, goal) \
+        if dist[goal] < inf else []
+    cost = _path_cost(problem, path)
+
+    n_reached = int(np.count_nonzero(dist < inf))
+
+    if viewer is not None:
+        viewer.update(goal, path=path)
+
+    return path, cost, n_reached, n_reached
+
+
+def path_from_field(parent: np.ndarray, n_cols: int, cell: Cell) -> List[Node]:
+    """ Follow a parent field from cell back to the root of the field. """
+    cells = []
+    index = cell[0] * n_cols + cell[1]
+    flat_parent = parent.ravel()
+    while index >= 0:
+        cells.append((int(index // n_cols), int(index % n_cols)))
+        index = flat_parent[index]
+    cells.reverse()
+
+    path = []
+    previous_node = None
+    for state in cells:
+        previous_node = Node(state, state if previous_node else None,
+                             previous_node)
+        path.append(previous_node)
+    return path
+
+
+def _bfs_layers(free: np.ndarray, offsets: np.ndarray, dist: np.ndarray,
+                parent: np.ndarray, start: int) -> None:
+    visited = ~free
+    visited[start] = True
+    layer = np.array([start])
+    depth = 0
+    while layer.size:
+        depth += 1
+        # neighbors of the whole layer, in the same order as actions
+        candidates = (layer[:, None] + offsets).ravel()
+        new = ~visited[candidates]
+        candidates = candidates[new]
+        sources = np.repeat(layer, len(offsets))[new]
+
+        # a cell reached by several cells of the layer keeps the first
+        candidates, first = np.unique(candidates, return_index=True)
+        visited[candidates] = True
+        dist[candidates] = depth
+        parent[candidates] = sources[first]
+        layer = candidates
+
+
+def _dijkstra_buckets(free: np.ndarray, offsets: np.ndarray, dist: np.ndarray,
+                      parent: np.ndarray, start: int) -> None:
+    settled = ~free
+    in_frontier = np.zeros(free.size, dtype=bool)
+    in_frontier[start] = True
+    frontier = np.array([start])
+    while frontier.size:
+        # settle every frontier cell closer than the nearest one plus
+        # the cheapest move
+        frontier_dist = dist[frontier]
+        in_bucket = frontier_dist < frontier_dist.min() + _MOVE_COSTS.min()
+        bucket = frontier[in_bucket]
+        frontier = frontier[~in_bucket]
+        settled[bucket] = True
+        in_frontier[bucket] = False
+
+        # relax the neighbors of the bucket
+        candidates = (bucket[:, None] + offsets).ravel()
+        costs = (dist[bucket][:, None] + _MOVE_COSTS).ravel()
+        sources = np.repeat(bucket, len(offsets))
+        keep = ~settled[candidates]
+        candidates, costs, sources = \
+            candidates[keep], costs[keep], sources[keep]
+
+        # lowest cost of each cell; among candidates with that cost
+        # the parent is the last one written.
+        np.minimum.at(dist, candidates, costs)
+        improved = costs == dist[candidates]
+        parent[candidates[improved]] = sources[improved]
+
+        # cells reached for the first time join the frontier
+        new = np.unique(candidates[improved & ~in_frontier[candidates]])
+        in_frontier[new] = True
+        frontier = np.concatenate((frontier, new))
@@ -0,0 +1,39 @@
+# Run from the repository root: python -m pytest trab1/tests
+#
+# Helpers and mazes shared by the test files; pytest hands them to the
+# tests that name them as arguments.
+import pytest
+
+from trab1.src.problems import MazeProblem
+
+
+def _is_valid_path(problem, path):
+    cells = [node.state for node in path]
+    return cells[0] == problem.initial_state() and problem.is_goal(cells[-1]) \
+        and all(b in problem.actions(a) for a, b in zip(cells, cells[1:]))
+
+
+def _summary(result):
+    # the path as (state, action) pairs and the other values as they are,
+    # to compare two runs
+    return ([(node.state, node.action) for node in result[0]],) + \
+        tuple(result[1:])
+
+
+@pytest.fixture
+def is_valid_path():
+    """ is_valid_path(problem, path): the path goes from the initial
+    state to a goal, one legal move at a time. """
+    return _is_valid_path
+
+
+@pytest.fixture
+def summary():
+    """ summary(result) of a search, comparable with ==. """
+    return _summary
+
+
+@pytest.fixture
+def walled_goal():
+    # 3x3 maze whose goal, the bottom right corner, is walled off
+    return MazeProblem(3, 3, maze=[[0, 0, 0], [0, 1, 1], [0, 1, 0]])
@@ -0,0 +1,56 @@
+# Run from the repository root: python -m pytest trab1/tests
+from math import inf, isclose
+
+import pytest
+
+from trab1.src.batch import ALGORITHMS, Job, run_batch, run_job
+from trab1.src.problems import MazeProblem
+from trab1.src.search import uniform_search
+
+# IDA* takes very long to give up on this unsolvable maze, so it times out
+_ENDLESS = Job('ida_star', 9, 20, 3, 0.25)
+
+
+def test_run_job_matches_the_search():
+    for seed in range(5):
+        result = run_job(seed, Job('a_star', 20, 20, seed, 0.3, repetitions=3))
+        path, cost, n_generated, n_expanded = \
+            uniform_search(MazeProblem(20, 20, seed, 0.3))
+        assert result.index == seed and len(result.times) == 3
+        if cost == inf:
+            assert result.cost == inf and result.path_len == -1
+        else:
+            assert result.status == 'ok' and isclose(result.cost, cost)
+
+
+def test_run_job_errors_and_timeouts(monkeypatch):
+    monkeypatch.setitem(ALGORITHMS, 'broken', ('math', 'sqrt'))
+    result = run_job(0, Job('broken', 5, 5, 0))
+    assert result.status == 'error' and result.error.startswith('TypeError')
+    assert result.cost == inf
+
+    result = run_job(1, _ENDLESS, timeout=0.2)
+    assert result.status == 'timeout' and result.times == ()
+
+
+def test_run_batch_returns_the_results_in_job_order():
+    jobs = [Job(name, 15, 15, seed, 0.3)
+            for seed in range(3) for name in ('uniform', 'jps', 'wavefront')]
+    jobs.append(_ENDLESS)
+    finished = []
+    results = run_batch(jobs, n_workers=2, timeout=0.5,
+                        on_result=lambda r: finished.append(r.index))
+    assert [r.index for r in results] == list(range(len(jobs)))
+    assert sorted(finished) == list(range(len(jobs)))
+    assert results[-1].status == 'timeout'
+    for result in results[:-1]:
+        expected = run_job(result.index, result.job)
+        assert result.status == 'ok'
+        assert result.cost == expected.cost or \
+            isclose(result.cost, expected.cost)
+        assert result.n_expanded == expected.n_expanded
+
+    with pytest.raises(ValueError):
+        run_batch([Job('unknown', 5, 5, 0)])
+    with pytest.raises(ValueError):
+        run_batch([Job('uniform', 5, 5, 0, repetitions=0)])
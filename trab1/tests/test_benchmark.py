@@ -0,0 +1,66 @@
+# Run from the repository root: python -m pytest trab1/tests
+import csv
+from math import inf, isclose
+
+import pytest
+
+from trab1.src.benchmark import FIELDS, compare_with_baseline, \
+    load_results_json, run_suite, write_results_csv, write_results_json
+from trab1.src.problems import MazeProblem
+from trab1.src.search import uniform_search
+
+
+def test_run_suite_summarizes_every_case():
+    seeds = range(6)
+    seen = []
+    results = run_suite(['uniform', 'a_star'], [12], [0.3], seeds,
+                        warmup=0, repetitions=2, on_result=seen.append)
+    assert seen == results and len(results) == 2
+    costs = [uniform_search(MazeProblem(12, 12, seed, 0.3))[1]
+             for seed in seeds]
+    solved = [cost for cost in costs if cost < inf]
+    for result in results:
+        assert set(result) == set(FIELDS)
+        assert result['n_runs'] == 12
+        assert result['time_p95'] >= result['time_median'] > 0
+        assert result['n_unsolved'] == len(costs) - len(solved)
+        assert isclose(result['cost_mean'], sum(solved) / len(solved))
+
+    with pytest.raises(ValueError):
+        run_suite(['unknown'], [12], [0.3], seeds)
+
+
+def test_unsolvable_cases_have_no_cost():
+    # MazeProblem(9, 9, seed, 0.6) walls the goal off for these seeds
+    seeds = [seed for seed in range(20)
+             if uniform_search(MazeProblem(9, 9, seed, 0.6))[1] == inf][:3]
+    assert seeds
+    result, = run_suite(['a_star'], [9], [0.6], seeds, warmup=0,
+                        repetitions=1)
+    assert result['cost_mean'] is None and result['n_unsolved'] == len(seeds)
+
+
+def test_compare_with_baseline(tmp_path):
+    baseline = [{'algorithm': 'a_star', 'size': 10, 'obstacle_ratio': 0.3,
+                 'time_median': 1.0, 'expanded_median': 100},
+                {'algorithm': 'dfs', 'size': 10, 'obstacle_ratio': 0.3,
+                 'time_median': 0.0, 'expanded_median': 50}]
+    results = [dict(baseline[0], time_median=1.05, expanded_median=150),
+               dict(baseline[1], time_median=9.0),
+               dict(baseline[0], size=20, time_median=99.0)]
+    regressions = compare_with_baseline(results, baseline, threshold=0.1)
+    # a time within the threshold, a zero baseline and a case missing
+    # from the baseline are not regressions
+    assert [(r['algorithm'], r['metric']) for r in regressions] == \
+        [('a_star', 'expanded_median')]
+    assert isclose(regressions[0]['change'], 0.5)
+    assert compare_with_baseline(baseline, baseline) == []
+
+    results = run_suite(['uniform'], [8], [0.2], [0], warmup=0,
+                        repetitions=1)
+    write_results_json(results, tmp_path / 'benchmark.json')
+    assert load_results_json(tmp_path / 'benchmark.json') == results
+    write_results_csv(results, tmp_path / 'benchmark.csv')
+    with open(tmp_path / 'benchmark.csv', encoding='UTF8') as f:
+        rows = list(csv.reader(f, delimiter=';'))
+    assert rows[0] == list(FIELDS) and len(rows) == 2
@@ -0,0 +1,63 @@
+# Run from the repository root: python -m pytest trab1/tests
+from functools import partial
+
+import pytest
+
+from trab1.src.problems import MazeProblem
+from trab1.src.search import a_star_search, beam_search, \
+    bidirectional_a_star_search, bidirectional_breadth_first_search, \
+    breadth_first_search, depth_first_search, greedy_best_first_search, \
+    ida_star_search, sma_star_search, uniform_search
+
+SEARCHES = {
+    'bfs': partial(breadth_first_search, viewer=None),
+    'dfs': depth_first_search,
+    'uniform': uniform_search,
+    'a_star': a_star_search,
+    'bidirectional_bfs': bidirectional_breadth_first_search,
+    'bidirectional_a_star': bidirectional_a_star_search,
+    'ida_star': partial(ida_star_search, table_size=1000),
+    'sma_star': partial(sma_star_search, max_nodes=1000),
+    'greedy': greedy_best_first_search,
+    'beam': beam_search,
+}
+
+
+class _PackedMaze(MazeProblem):
+    # a maze searched through its cell numbers
+
+    def has_codec(self):
+        return True
+
+    def encode(self, state):
+        return self.state_index(state)
+
+    def decode(self, code):
+        return self.index_state(code)
+
+
+class _StateViewer:
+    def __init__(self):
+        self.states = []
+
+    def update(self, state=None, generated=[], expanded=[], path=[]):
+        self.states.extend(generated)
+        self.states.extend(expanded)
+        self.states.extend(node.state for node in path)
+
+
+@pytest.mark.parametrize('name', sorted(SEARCHES))
+def test_codec_gives_the_same_search(name, summary, walled_goal):
+    search = SEARCHES[name]
+    # the last maze has its goal walled off
+    for plain in [MazeProblem(20, 20, seed, 0.3) for seed in (0, 3, 42)] + \
+            [walled_goal]:
+        packed = _PackedMaze(plain.n_rows, plain.n_cols, maze=plain._maze)
+        assert summary(search(packed)) == summary(search(plain))
+
+
+def test_viewer_sees_the_decoded_states():
+    viewer = _StateViewer()
+    path = a_star_search(_PackedMaze(15, 15, 1, 0.2), viewer)[0]
+    assert path and viewer.states
+    assert all(isinstance(state, tuple) for state in viewer.states)
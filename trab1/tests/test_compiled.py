@@ -0,0 +1,34 @@
+# Run from the repository root: python -m pytest trab1/tests
+from math import inf
+
+import pytest
+
+from trab1.src.compiled import CompiledMaze, compiled_a_star_search
+from trab1.src.problems import MazeProblem
+from trab1.src.search import a_star_search, uniform_search
+
+
+@pytest.mark.parametrize('shape', [(20, 20), (15, 40), (1, 10)])
+def test_same_search_as_a_star(shape, summary):
+    for seed in range(20):
+        problem = MazeProblem(*shape, seed, 0.3)
+        # same expansion order, so the same path and counters
+        assert summary(compiled_a_star_search(problem)) == \
+            summary(a_star_search(problem))
+        assert compiled_a_star_search(problem, weight=0)[1] == \
+            uniform_search(problem)[1]
+
+
+def test_compiled_maze_is_rebuilt_after_set_cell():
+    problem = MazeProblem(10, 10, 0, 0.0)
+    compiled = CompiledMaze(problem)
+    assert compiled.is_current(problem)
+    assert compiled.cell(compiled.index((3, 7))) == (3, 7)
+
+    # wall off the goal: the stale table would still reach it
+    for cell in ((8, 8), (8, 9), (9, 8)):
+        problem.set_cell(cell, 1)
+    assert not compiled.is_current(problem)
+    assert compiled_a_star_search(problem, compiled=compiled)[:2] == ([], inf)
+    # nor is it current for another goal
+    assert not CompiledMaze(problem).is_current(problem.reversed())
@@ -0,0 +1,61 @@
+# Run from the repository root: python -m pytest trab1/tests
+from functools import partial
+from math import inf
+
+import pytest
+
+from trab1.src.compiled import compiled_a_star_search
+from trab1.src.external import external_breadth_first_search
+from trab1.src.field_cache import DistanceFieldCache
+from trab1.src.hierarchical import HierarchicalMaze
+from trab1.src.incremental import DStarLite
+from trab1.src.jps import jump_point_search
+from trab1.src.problems import MazeProblem
+from trab1.src.search import a_star_search, anytime_a_star_search, \
+    beam_search, bidirectional_a_star_search, \
+    bidirectional_breadth_first_search, breadth_first_search, \
+    depth_first_search, greedy_best_first_search, ida_star_search, \
+    sma_star_search, uniform_search
+from trab1.src.wavefront import wavefront_search
+
+# every search, as search(problem) -> (path, cost, ...)
+SEARCHES = {
+    'bfs': partial(breadth_first_search, viewer=None),
+    'dfs': depth_first_search,
+    'uniform': uniform_search,
+    'a_star': a_star_search,
+    'bidirectional_bfs': bidirectional_breadth_first_search,
+    'bidirectional_a_star': bidirectional_a_star_search,
+    'ida_star': ida_star_search,
+    'sma_star': partial(sma_star_search, max_nodes=3),
+    'anytime_a_star': anytime_a_star_search,
+    'greedy': greedy_best_first_search,
+    'beam': beam_search,
+    'jps': jump_point_search,
+    'wavefront': wavefront_search,
+    'field_cache': lambda problem: DistanceFieldCache().search(problem),
+    'hierarchical': lambda problem: HierarchicalMaze(problem, 2).search(),
+    'compiled_a_star': compiled_a_star_search,
+    'external_bfs': external_breadth_first_search,
+    'd_star_lite': lambda problem: DStarLite(problem).plan(),
+}
+
+
+# breadth_first_search only tests the states it generates, so it does
+# not find a goal that is the initial state
+@pytest.mark.parametrize('name', sorted(set(SEARCHES) - {'bfs'}))
+def test_start_is_the_goal(name):
+    path, cost = SEARCHES[name](MazeProblem(1, 1, 0, 0.0))[:2]
+    assert [node.state for node in path] == [(0, 0)] and cost == 0
+
+
+@pytest.mark.parametrize('name', sorted(SEARCHES))
+def test_goal_walled_off(name, walled_goal):
+    assert SEARCHES[name](walled_goal)[:2] == ([], inf)
+
+
+# 140 reachable cells and no path to the goal; ida_star_search does not
+# end on it without limits (see test_search)
+@pytest.mark.parametrize('name', sorted(set(SEARCHES) - {'ida_star'}))
+def test_unsolvable_maze(name):
+    assert SEARCHES[name](MazeProblem(9, 20, 3, 0.25))[:2] == ([], inf)
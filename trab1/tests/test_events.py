@@ -0,0 +1,83 @@
+# Run from the repository root: python -m pytest trab1/tests
+import pytest
+
+from trab1.src.events import EventStream, ViewerSubscriber, iter_search
+from trab1.src.problems import MazeProblem
+from trab1.src.search import a_star_search, breadth_first_search, \
+    depth_first_search, uniform_search
+
+PLAIN = {'dfs': depth_first_search,
+         'uniform': uniform_search,
+         'a_star': a_star_search}
+
+
+@pytest.mark.parametrize('algorithm', sorted(PLAIN))
+def test_events_do_not_change_the_result(algorithm, summary):
+    for seed in (42, 1, 2, 3):
+        problem = MazeProblem(20, 20, seed)
+        expected = summary(PLAIN[algorithm](problem))
+
+        stream = EventStream(problem, algorithm)
+        assert summary(stream.run()) == expected
+        kinds = []
+        stream.subscribe(lambda event: kinds.append(event.kind), every=7)
+        assert summary(stream.run()) == expected
+        assert kinds[-1] == 'done'
+
+        events = list(iter_search(problem, algorithm))
+        assert summary(events[-1].result) == expected
+        n_expanded = sum(event.kind == 'expand' for event in events)
+        assert n_expanded == expected[3]
+
+
+def test_bfs_events():
+    problem = MazeProblem(20, 20, 42)
+    path, cost = breadth_first_search(problem, None)
+    events = list(iter_search(problem, 'bfs'))
+    assert [event.kind for event in events[-2:]] == ['goal', 'done']
+    assert events[-1].result[:2] == (path, cost)
+
+
+def test_unsolvable_maze():
+    problem = MazeProblem(9, 20, 3, 0.25)
+    for algorithm in ('bfs', 'dfs', 'uniform', 'a_star'):
+        events = list(iter_search(problem, algorithm))
+        assert 'goal' not in [event.kind for event in events]
+        assert events[-1].result[0] == []
+
+
+class _RecordingViewer:
+    def __init__(self):
+        self.updates = []
+
+    def update(self, state=None, generated=[], expanded=[], path=[]):
+        self.updates.append((state, len(expanded), list(path)))
+
+
+def test_subscriptions_filter_and_throttle():
+    problem = MazeProblem(20, 20, 42)
+    n_expanded = a_star_search(problem)[3]
+    stream = EventStream(problem, 'a_star')
+    expands, every_ten, all_kinds = [], [], []
+    stream.subscribe(lambda event: expands.append(event.kind),
+                     kinds=['expand'])
+    stream.subscribe(lambda event: every_ten.append(event.kind),
+                     kinds=['expand'], every=10)
+    cancel = stream.subscribe(lambda event: all_kinds.append(event.kind))
+    cancel()
+    viewer = _RecordingViewer()
+    stream.subscribe(ViewerSubscriber(viewer, every=5))
+    path = stream.run()[0]
+
+    # 'goal' and 'done' always get through
+    assert expands == ['expand'] * n_expanded + ['goal', 'done']
+    assert every_ten == ['expand'] * (n_expanded // 10) + ['goal', 'done']
+    assert all_kinds == []
+    assert len(viewer.updates) == n_expanded // 5 + 1
+    assert viewer.updates[-1][1] == n_expanded
+    assert viewer.updates[-1][2] == path
+
+    with pytest.raises(ValueError):
+        EventStream(problem, 'ida_star')
+    with pytest.raises(ValueError):
+        next(iter_search(problem, 'ida_star'))
@@ -0,0 +1,57 @@
+# Run from the repository root: python -m pytest trab1/tests
+import os
+from math import inf
+
+import numpy as np
+import pytest
+
+from trab1.src.external import external_breadth_first_search
+from trab1.src.problems import MazeProblem
+from trab1.src.search import breadth_first_search
+from trab1.src.wavefront import distance_field
+
+
+class _NoCodec:
+    def has_codec(self):
+        return False
+
+
+@pytest.mark.parametrize('memory_limit', [1_000_000, 7])
+def test_matches_breadth_first_search(memory_limit):
+    for seed in range(10):
+        problem = MazeProblem(20, 20, seed, 0.3)
+        stats = {}
+        path, cost, _, _ = external_breadth_first_search(
+            problem, memory_limit=memory_limit, stats=stats)
+        expected, _ = breadth_first_search(problem, None)
+        assert len(path) == len(expected)
+        if not path:
+            assert cost == inf
+            continue
+        cells = [node.state for node in path]
+        assert cells[0] == problem.initial_state()
+        assert problem.is_goal(cells[-1])
+        assert all(b in problem.actions(a) for a, b in zip(cells, cells[1:]))
+        assert stats['layer_sizes'][0] == 1 and stats['peak_disk_bytes'] > 0
+
+
+def test_unsolvable_maze_enumerates_the_reachable_states(tmp_path):
+    problem = MazeProblem(9, 20, 3, 0.25)
+    stats = {}
+    path, cost, _, n_expanded = external_breadth_first_search(
+        problem, work_dir=str(tmp_path), memory_limit=16, stats=stats)
+    assert path == [] and cost == inf
+    dist, _ = distance_field(problem, method='bfs')
+    reachable = dist[dist < inf]
+    assert stats['n_reached'] == n_expanded == len(reachable)
+    # one layer per BFS depth, and an empty one at the end
+    assert stats['layer_sizes'][:-1] == \
+        np.bincount(reachable.astype(int)).tolist()
+    assert stats['layer_sizes'][-1] == 0
+    # a given work_dir is kept
+    assert os.listdir(tmp_path)
+
+
+def test_problem_without_codec():
+    with pytest.raises(ValueError):
+        external_breadth_first_search(_NoCodec())
@@ -0,0 +1,66 @@
+# Run from the repository root: python -m pytest trab1/tests
+import copy
+from math import inf, isclose
+
+from trab1.src.field_cache import DistanceFieldCache
+from trab1.src.problems import MazeProblem
+from trab1.src.search import uniform_search
+
+
+def test_answers_match_uniform_search():
+    cache = DistanceFieldCache()
+    for seed in range(10):
+        problem = MazeProblem(20, 20, seed, 0.3)
+        cost = cache.search(problem)[1]
+        expected = uniform_search(problem)[1]
+        assert cost == expected or isclose(cost, expected)
+        # the second query comes from the cache
+        assert cache.search(problem)[2] == 0
+
+
+def test_set_cell_through_any_copy_invalidates_the_field():
+    problem = MazeProblem(10, 10, 5, 0.0)
+    cache = DistanceFieldCache()
+    for other in (problem.reversed(), copy.copy(problem)):
+        cache.invalidate()
+        for row in range(10):
+            problem.set_cell((row, 5), 0)
+        assert isclose(cache.search(other, start=problem.initial_state(),
+                                    goal=problem._goal_state)[1],
+                       9 * 2 ** 0.5)
+
+        # wall column 5 except its last cell, through the original
+        for row in range(9):
+            problem.set_cell((row, 5), 1)
+        path, cost, n_reached, _ = cache.search(
+            other, start=problem.initial_state(), goal=problem._goal_state)
+        assert n_reached > 0
+        assert isclose(cost, uniform_search(problem)[1])
+        assert all(node.state[1] != 5 or node.state[0] == 9 for node in path)
+
+        # and back, through the copy
+        for row in range(9):
+            other.set_cell((row, 5), 0)
+        assert isclose(cache.search(problem)[1], 9 * 2 ** 0.5)
+
+
+def test_many_starts():
+    problem = MazeProblem(15, 15, 2, 0.3)
+    cache = DistanceFieldCache(max_size=2)
+    starts = [(row, col) for row in range(0, 15, 3)
+              for col in range(0, 15, 3) if problem._maze[row][col] == 0]
+    for start in starts:
+        other = copy.copy(problem)
+        other._initial_state = start
+        expected = uniform_search(other)[1]
+        path, cost, _, _ = cache.search(problem, start=start)
+        if expected == inf:
+            assert path == [] and cost == inf
+        else:
+            assert isclose(cost, expected)
+            assert path[0].state == start and problem.is_goal(path[-1].state)
+
+    # the least recently used field is dropped
+    cache.search(problem, goal=(0, 0))
+    cache.search(problem, goal=(0, 14))
+    assert len(cache) == 2 and cache.search(problem)[2] > 0
@@ -0,0 +1,97 @@
+# Run from the repository root: python -m pytest trab1/tests
+from math import inf
+
+import pytest
+
+from trab1.src.frontier import IndexedFrontier, PriorityFrontier, \
+    make_frontier
+from trab1.src.problems import MazeProblem
+from trab1.src.search import breadth_first_search, depth_first_search
+from trab1.src.wavefront import distance_field
+
+
+def test_priority_frontier_pops_in_priority_order():
+    frontier = PriorityFrontier()
+    for item, priority in (('c', 3.0), ('a', 1.0), ('d', 4.0), ('b', 2.0)):
+        frontier.push(item, priority)
+    assert len(frontier) == 4 and frontier.peek() == 'a'
+    assert [frontier.pop() for _ in range(4)] == ['a', 'b', 'c', 'd']
+    assert not frontier
+    with pytest.raises(KeyError):
+        frontier.pop()
+
+
+def test_priority_frontier_ties_leave_in_insertion_order():
+    frontier = PriorityFrontier()
+    for item in 'xyzw':
+        frontier.push(item, 1.0)
+    assert [frontier.pop() for _ in range(4)] == list('xyzw')
+
+
+def test_priority_frontier_push_again_is_a_decrease_key():
+    frontier = PriorityFrontier()
+    frontier.push('a', 5.0)
+    frontier.push('b', 3.0)
+    frontier.push('a', 1.0)
+    assert len(frontier) == 2 and frontier.priority('a') == 1.0
+    assert frontier.pop() == 'a'
+    # the outdated entry of 'a' is skipped
+    assert frontier.pop() == 'b'
+    assert not frontier
+
+
+def test_priority_frontier_remove():
+    frontier = PriorityFrontier()
+    for item, priority in (('a', 1.0), ('b', 2.0), ('c', 3.0)):
+        frontier.push(item, priority)
+    frontier.remove('a')
+    assert 'a' not in frontier and set(frontier) == {'b', 'c'}
+    assert frontier.peek() == 'b'
+    assert [frontier.pop() for _ in range(2)] == ['b', 'c']
+    with pytest.raises(KeyError):
+        frontier.peek()
+
+
+@pytest.mark.parametrize('lifo', [False, True])
+def test_indexed_frontier_order_and_membership(lifo):
+    frontier = IndexedFrontier(lifo)
+    for item in 'abca':
+        frontier.append(item)
+    assert len(frontier) == 4 and list(frontier) == list('abca')
+    expected = list('acba') if lifo else list('abca')
+    popped = []
+    while frontier:
+        popped.append(frontier.pop())
+        # an item stays in the frontier while any copy is queued
+        assert ('a' in frontier) == ('a' in expected[len(popped):])
+    assert popped == expected
+
+
+def test_make_frontier():
+    problem = MazeProblem(5, 5, 0)
+    assert isinstance(make_frontier(problem), PriorityFrontier)
+    frontier = make_frontier(problem, priority=False, lifo=True)
+    assert isinstance(frontier, IndexedFrontier) and frontier._lifo
+
+    problem.frontier_factory = lambda priority, lifo: ('own', priority, lifo)
+    assert make_frontier(problem, priority=False) == ('own', False, False)
+
+
+def test_breadth_and_depth_first_paths():
+    for seed in range(20):
+        problem = MazeProblem(15, 15, seed, 0.3)
+        dist, _ = distance_field(problem, method='bfs')
+        n_moves = dist[problem._goal_state]
+        bfs_path, _ = breadth_first_search(problem, None)
+        dfs_path, _, _, _ = depth_first_search(problem)
+        if n_moves == inf:
+            assert bfs_path == [] and dfs_path == []
+            continue
+        # breadth-first finds a path with the fewest moves
+        assert len(bfs_path) - 1 == n_moves
+        for path in (bfs_path, dfs_path):
+            cells = [node.state for node in path]
+            assert cells[0] == problem.initial_state()
+            assert problem.is_goal(cells[-1])
+            assert all(b in problem.actions(a)
+                       for a, b in zip(cells, cells[1:]))
@@ -0,0 +1,66 @@
+# Run from the repository root: python -m pytest trab1/tests
+from math import inf, isclose
+
+import pytest
+
+from trab1.src.hierarchical import HierarchicalMaze
+from trab1.src.problems import MazeProblem
+from trab1.src.search import uniform_search
+from trab1.src.wavefront import distance_field
+
+
+def test_reported_unreachable_maze(is_valid_path):
+    problem = MazeProblem(13, 11, 16, 0.25)
+    path, cost, _, _ = HierarchicalMaze(problem, cluster_size=4).search()
+    assert cost < inf
+    assert is_valid_path(problem, path)
+    assert cost >= uniform_search(problem)[1] - 1e-9
+
+
+@pytest.mark.parametrize('cluster_size', [2, 3, 4, 5])
+def test_finds_a_path_whenever_one_exists(cluster_size, is_valid_path):
+    for seed in range(40):
+        problem = MazeProblem(14, 12, seed, 0.3)
+        hierarchy = HierarchicalMaze(problem, cluster_size)
+        path, cost, _, _ = hierarchy.search()
+        exact = uniform_search(problem)[1]
+        dist, _ = distance_field(problem, problem._goal_state)
+        assert isclose(exact, dist[0, 0]) or exact == dist[0, 0] == inf
+        if exact == inf:
+            assert path == [] and cost == inf
+        else:
+            assert is_valid_path(problem, path)
+            assert cost >= exact - 1e-9
+
+
+def test_queries_between_any_cells():
+    problem = MazeProblem(16, 16, 7, 0.3)
+    hierarchy = HierarchicalMaze(problem, cluster_size=4)
+    dist, _ = distance_field(problem, (0, 0))
+    for row in range(16):
+        for col in range(16):
+            if problem._maze[row][col]:
+                continue
+            _, cost, _, _ = hierarchy.search(start=(0, 0), goal=(row, col))
+            assert (cost == inf) == (dist[row, col] == inf)
+
+
+def test_changed_maze_is_built_again(walled_goal, is_valid_path):
+    problem = walled_goal
+    hierarchy = HierarchicalMaze(problem, cluster_size=2)
+    assert hierarchy.search()[1] == inf
+    problem.set_cell((1, 1), 0)
+    path, cost, _, _ = hierarchy.search()
+    assert is_valid_path(problem, path) and isclose(cost, 2 * 2 ** 0.5)
+    # walling the goal off again is seen too
+    problem.set_cell((1, 1), 1)
+    assert hierarchy.search()[:2] == ([], inf)
+
+
+def test_queries_in_the_walled_maze(walled_goal):
+    hierarchy = HierarchicalMaze(walled_goal, cluster_size=2)
+    # obstacle cells are never reached
+    assert hierarchy.search(goal=(1, 1))[:2] == ([], inf)
+    path, cost, _, _ = hierarchy.search(start=(0, 2), goal=(2, 0))
+    assert [node.state for node in path] == [(0, 2), (0, 1), (1, 0), (2, 0)]
+    assert isclose(cost, 2 + 2 ** 0.5)
@@ -0,0 +1,59 @@
+# Run from the repository root: python -m pytest trab1/tests
+import copy
+import random
+from math import inf, isclose
+
+from trab1.src.incremental import DStarLite
+from trab1.src.problems import MazeProblem
+from trab1.src.search import uniform_search
+
+
+def _same_cost(cost, expected):
+    return cost == expected or isclose(cost, expected)
+
+
+def _from(problem, start):
+    # the same maze (shared grid) searched from another start
+    problem = copy.copy(problem)
+    problem._initial_state = start
+    return problem
+
+
+def test_replans_match_uniform_search():
+    for seed in range(20):
+        problem = MazeProblem(20, 20, seed, 0.3)
+        planner = DStarLite(problem)
+        path, cost, _, _ = planner.plan()
+        assert _same_cost(cost, uniform_search(problem)[1])
+
+        rng = random.Random(seed)
+        start = problem.initial_state()
+        for _ in range(8):
+            # walk one step along the plan, then the maze changes
+            if len(path) > 1:
+                start = path[1].state
+                planner.move_start(start)
+            cells = {(rng.randrange(20), rng.randrange(20)) for _ in range(5)}
+            planner.toggle_cells(cells - {start, problem._goal_state})
+
+            path, cost, _, _ = planner.plan()
+            expected = uniform_search(_from(problem, start))[1]
+            assert _same_cost(cost, expected)
+            if path:
+                cells = [node.state for node in path]
+                assert cells[0] == start and cells[-1] == problem._goal_state
+                assert all(b in problem.actions(a)
+                           for a, b in zip(cells, cells[1:]))
+
+
+def test_goal_walled_off_and_reopened(walled_goal):
+    planner = DStarLite(walled_goal)
+    assert planner.plan()[:2] == ([], inf)
+
+    planner.toggle_cells([(1, 1)])
+    path, cost, _, n_expanded = planner.plan()
+    assert [node.state for node in path] == [(0, 0), (1, 1), (2, 2)]
+    assert isclose(cost, 2 * 2 ** 0.5)
+
+    # nothing changed, so nothing is expanded again
+    assert planner.plan()[3] == 0
@@ -0,0 +1,23 @@
+# Run from the repository root: python -m pytest trab1/tests
+from math import inf, isclose
+
+import pytest
+
+from trab1.src.jps import jump_point_search
+from trab1.src.problems import MazeProblem
+from trab1.src.search import uniform_search
+
+
+@pytest.mark.parametrize('obstacle_ratio', [0.0, 0.2, 0.4])
+@pytest.mark.parametrize('shape', [(12, 12), (20, 35), (1, 10)])
+def test_matches_uniform_search(shape, obstacle_ratio, is_valid_path):
+    for seed in range(20):
+        problem = MazeProblem(*shape, seed, obstacle_ratio)
+        expected = uniform_search(problem)[1]
+        path, cost, _, _ = jump_point_search(problem)
+        if expected == inf:
+            assert path == [] and cost == inf
+        else:
+            # the jumps are expanded into single moves
+            assert isclose(cost, expected)
+            assert is_valid_path(problem, path)
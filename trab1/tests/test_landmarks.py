@@ -0,0 +1,87 @@
+# Run from the repository root: python -m pytest trab1/tests
+from math import inf, isclose
+
+import pytest
+
+from trab1.src.landmarks import STRATEGIES, LandmarkHeuristic
+from trab1.src.problems import MazeProblem
+from trab1.src.search import a_star_search, uniform_search
+from trab1.src.wavefront import distance_field
+
+
+def _free_cells(problem):
+    return [(row, col) for row in range(problem.n_rows)
+            for col in range(problem.n_cols) if problem._maze[row][col] == 0]
+
+
+def _assert_admissible(problem, landmarks):
+    goal = problem._goal_state
+    dist, _ = distance_field(problem, goal)
+    for cell in _free_cells(problem):
+        if dist[cell] < inf:
+            assert landmarks.lower_bound(cell, goal) <= dist[cell] + 1e-9
+
+
+@pytest.mark.parametrize('bytes_per_cell', [8, 4, 2])
+@pytest.mark.parametrize('strategy', STRATEGIES)
+def test_bounds_are_admissible_and_a_star_stays_optimal(strategy,
+                                                         bytes_per_cell):
+    for seed in range(5):
+        problem = MazeProblem(20, 20, seed, 0.3)
+        landmarks = LandmarkHeuristic(problem, 4, strategy, bytes_per_cell,
+                                      seed=seed)
+        assert len(landmarks.landmarks) == 4
+        _assert_admissible(problem, landmarks)
+
+        expected = uniform_search(problem)[1]
+        problem.set_landmarks(landmarks)
+        cost = a_star_search(problem)[1]
+        assert cost == expected or isclose(cost, expected)
+
+
+def test_float_bounds_are_consistent():
+    problem = MazeProblem(20, 20, 3, 0.3)
+    landmarks = LandmarkHeuristic(problem, seed=3)
+    goal = problem._goal_state
+    for cell in _free_cells(problem):
+        h = landmarks.lower_bound(cell, goal)
+        for neighbor in problem.actions(cell):
+            assert h <= landmarks.lower_bound(neighbor, goal) + \
+                problem._cell_distance(cell, neighbor) + 1e-9
+
+
+def test_memory_and_maze_changes():
+    problem = MazeProblem(20, 20, 1, 0.3)
+    sizes = {b: LandmarkHeuristic(problem, 4, bytes_per_cell=b, seed=1).n_bytes
+             for b in (8, 4, 2)}
+    assert sizes[8] == 2 * sizes[4] == 4 * sizes[2]
+
+    # a wall that forces a detour
+    for row in range(19):
+        problem.set_cell((row, 10), 1)
+    problem.set_cell((19, 10), 0)
+    landmarks = LandmarkHeuristic(problem, 4, seed=1)
+    problem.set_landmarks(landmarks)
+    a_star_search(problem)
+    # without it the old bounds would overestimate
+    for row in range(19):
+        problem.set_cell((row, 10), 0)
+    _assert_admissible(problem, landmarks)
+    expected = uniform_search(problem)[1]
+    assert isclose(a_star_search(problem)[1], expected)
+
+    with pytest.raises(ValueError):
+        LandmarkHeuristic(problem, strategy='nearest')
+    with pytest.raises(ValueError):
+        LandmarkHeuristic(problem, bytes_per_cell=3)
+    with pytest.raises(ValueError):
+        LandmarkHeuristic(problem, n_landmarks=0)
+
+
+@pytest.mark.parametrize('strategy', ['farthest', 'random'])
+def test_no_more_landmarks_than_reachable_cells(strategy):
+    # four free cells, all reachable from each other
+    problem = MazeProblem(2, 3, maze=[[0, 0, 0], [1, 1, 0]])
+    landmarks = LandmarkHeuristic(problem, 8, strategy, seed=0)
+    assert sorted(landmarks.landmarks) == _free_cells(problem)
+    _assert_admissible(problem, landmarks)
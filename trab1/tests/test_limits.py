@@ -0,0 +1,69 @@
+# Run from the repository root: python -m pytest trab1/tests
+from functools import partial
+from math import inf
+
+import pytest
+
+from trab1.src.limits import CancellationToken, SearchLimits
+from trab1.src.problems import MazeProblem
+from trab1.src.search import a_star_search, beam_search, \
+    breadth_first_search, depth_first_search, greedy_best_first_search, \
+    ida_star_search, sma_star_search, uniform_search
+
+SEARCHES = {
+    'dfs': depth_first_search,
+    'uniform': uniform_search,
+    'a_star': a_star_search,
+    'weighted_a_star': partial(a_star_search, weight=2.0),
+    'sma_star': sma_star_search,
+    'ida_star': partial(ida_star_search, table_size=1000),
+    'greedy': greedy_best_first_search,
+    'beam': partial(beam_search, beam_width=10),
+}
+
+
+def _run(search, problem, limits):
+    # breadth_first_search only returns the path and the cost
+    if search is breadth_first_search:
+        return search(problem, None, limits=limits) + (None, None)
+    return search(problem, limits=limits)
+
+
+@pytest.mark.parametrize('name', sorted(SEARCHES) + ['bfs'])
+def test_limits_stop_the_search(name):
+    search = SEARCHES.get(name, breadth_first_search)
+    problem = MazeProblem(30, 30, 1, 0.2)
+
+    limits = SearchLimits(max_expansions=5)
+    path, cost, _, n_expanded = _run(search, problem, limits)
+    assert path == [] and cost == inf and limits.reason == 'expansions'
+    assert n_expanded in (5, None)
+
+    token = CancellationToken()
+    token.cancel()
+    limits = SearchLimits(token=token)
+    path, cost, _, n_expanded = _run(search, problem, limits)
+    assert path == [] and cost == inf and limits.reason == 'cancelled'
+    assert n_expanded in (0, None)
+
+    limits = SearchLimits(time_limit=0.0, check_every=1)
+    assert _run(search, problem, limits)[:2] == ([], inf)
+    assert limits.reason == 'time'
+
+    # limits that are not reached change nothing, and are reset by
+    # the next run
+    limits = SearchLimits(time_limit=60.0, max_expansions=10 ** 6)
+    path, cost, _, _ = _run(search, problem, limits)
+    expected = _run(search, problem, None)
+    assert limits.reason is None
+    assert [node.state for node in path] == \
+        [node.state for node in expected[0]] and cost == expected[1]
+
+
+def test_limits_stop_unsolvable_searches():
+    problem = MazeProblem(9, 20, 3, 0.25)
+    for search in SEARCHES.values():
+        limits = SearchLimits(max_expansions=50)
+        path, cost, _, n_expanded = search(problem, limits=limits)
+        assert path == [] and cost == inf
+        assert n_expanded == 50 and limits.reason == 'expansions'
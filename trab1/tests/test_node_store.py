@@ -0,0 +1,36 @@
+# Run from the repository root: python -m pytest trab1/tests
+from trab1.src.node_store import NO_PARENT, NodeStore
+
+
+def test_fields_and_path():
+    store = NodeStore(capacity=2)
+    root = store.add('a')
+    child = store.add('b', root, 'to b', 1.5)
+    leaf = store.add(['c'], child, 'to c', 2.5)
+    assert len(store) == 3
+    assert store.parent(root) == NO_PARENT and store.parent(leaf) == child
+    assert store.state(leaf) == ['c'] and store.action(child) == 'to b'
+    assert store.g(leaf) == 2.5
+    assert store.path(leaf) == [root, child, leaf]
+    assert store.path(root) == [root]
+
+
+def test_grows_past_capacity():
+    store = NodeStore(capacity=1)
+    ids = [store.add(i, i - 1 if i else NO_PARENT, g=float(i))
+           for i in range(1000)]
+    assert ids == list(range(1000)) and len(store) == 1000
+    assert store.path(999) == ids
+    assert store.g(500) == 500.0
+
+
+def test_freed_ids_are_reused():
+    store = NodeStore()
+    root = store.add('a')
+    child = store.add('b', root)
+    store.free(child)
+    assert len(store) == 1 and store.state(child) is None
+    other = store.add('c', root, g=4.0)
+    assert other == child and len(store) == 2
+    assert store.state(other) == 'c' and store.g(other) == 4.0
+    assert store.path(other) == [root, other]
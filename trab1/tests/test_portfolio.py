@@ -0,0 +1,79 @@
+# Run from the repository root: python -m pytest trab1/tests
+import os
+import signal
+import time
+from math import inf, isclose
+
+import pytest
+
+from trab1.src.batch import ALGORITHMS
+from trab1.src.portfolio import portfolio_search
+from trab1.src.problems import MazeProblem
+from trab1.src.search import uniform_search
+
+
+def _killed(problem, viewer):
+    # a worker that dies without posting a result
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+def test_wait_for_best_finds_the_cheapest_path():
+    problem = MazeProblem(20, 20, 42)
+    stats = {}
+    _, cost, _, _ = portfolio_search(problem, algorithms=('dfs', 'a_star'),
+                                     wait_for_best=True, stats=stats)
+    assert isclose(cost, uniform_search(problem)[1])
+    assert stats['errors'] == {}
+
+
+def test_failed_workers_count_as_finished(monkeypatch):
+    monkeypatch.setitem(ALGORITHMS, 'broken', ('trab1.src.missing', 'search'))
+    monkeypatch.setitem(ALGORITHMS, 'killed',
+                        ('trab1.tests.test_portfolio', '_killed'))
+    stats = {}
+    path, cost, _, _ = portfolio_search(MazeProblem(20, 20, 42),
+                                        algorithms=('broken', 'killed'),
+                                        stats=stats)
+    assert path == [] and cost == inf
+    assert stats['winner'] is None
+    assert stats['errors']['broken'].startswith('ModuleNotFoundError')
+    assert stats['errors']['killed'] == f"worker exited with code " \
+                                        f"{-signal.SIGKILL}"
+
+    stats = {}
+    path, cost, _, _ = portfolio_search(MazeProblem(20, 20, 42),
+                                        algorithms=('killed', 'a_star'),
+                                        wait_for_best=True, stats=stats)
+    assert cost < inf and stats['winner'] == 'a_star'
+
+
+def test_unsolvable_maze_and_time_budget():
+    problem = MazeProblem(9, 20, 3, 0.25)
+    stats = {}
+    path, cost, _, _ = portfolio_search(problem, stats=stats)
+    assert path == [] and cost == inf and stats['winner'] is None
+    assert all(result[0] == inf for result in stats['results'].values())
+
+    # IDA* takes very long to give up here, so the budget stops it
+    stats = {}
+    start = time.perf_counter()
+    path, cost, _, _ = portfolio_search(problem,
+                                        algorithms=('ida_star', 'a_star'),
+                                        time_budget=0.5, stats=stats)
+    assert time.perf_counter() - start < 5
+    assert path == [] and cost == inf
+    assert stats['results']['ida_star'] is None
+
+    with pytest.raises(ValueError):
+        portfolio_search(problem, algorithms=('unknown',))
+
+
+def test_first_path_wins():
+    problem = MazeProblem(25, 25, 7, 0.3)
+    stats = {}
+    path, cost, _, _ = portfolio_search(problem, stats=stats)
+    assert stats['winner'] in ('dfs', 'a_star', 'bidirectional_a_star')
+    cells = [node.state for node in path]
+    assert cells[0] == problem.initial_state() and problem.is_goal(cells[-1])
+    assert all(b in problem.actions(a) for a, b in zip(cells, cells[1:]))
+    assert cost >= uniform_search(problem)[1] - 1e-9
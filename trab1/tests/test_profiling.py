@@ -0,0 +1,71 @@
+# Run from the repository root: python -m pytest trab1/tests
+import tracemalloc
+
+import pytest
+
+from trab1.src.problems import MazeProblem
+from trab1.src.profiling import profile_search, write_collapsed_stacks, \
+    write_profile_report
+from trab1.src.search import a_star_search, uniform_search
+
+
+@pytest.mark.parametrize('mode', ['cprofile', 'sample'])
+def test_result_is_unchanged_and_hotspots_are_found(mode, tmp_path, summary):
+    problem = MazeProblem(150, 150, 1, 0.25)
+    result, report = profile_search(a_star_search, problem, None, mode=mode)
+    assert summary(result) == summary(a_star_search(problem))
+    assert report.algorithm == 'a_star_search' and report.time_total > 0
+    assert report.peak_memory is None
+
+    names = [hotspot[0] for hotspot in report.hotspots]
+    if mode == 'cprofile':
+        # cProfile names functions without their class
+        assert any('actions (problems.py' in name for name in names)
+    else:
+        # the sampler may miss any one function, but not the search
+        assert any('(search.py' in name for name in names)
+    self_times = [hotspot[1] for hotspot in report.hotspots]
+    assert self_times == sorted(self_times, reverse=True)
+    calls = [hotspot[3] for hotspot in report.hotspots]
+    if mode == 'cprofile':
+        assert all(isinstance(n, int) for n in calls)
+    else:
+        assert set(calls) == {None}
+
+    # the stacks start at the search
+    assert report.n_samples == sum(report.stacks.values()) > 0
+    assert all('wrapper (search.py' in stack.split(';')[0]
+               for stack in report.stacks)
+
+    write_profile_report(report, tmp_path / 'perfil.txt')
+    text = (tmp_path / 'perfil.txt').read_text(encoding='UTF8')
+    assert text.startswith('algorithm: a_star_search\n')
+    write_collapsed_stacks(report, tmp_path / 'perfil.folded')
+    lines = (tmp_path / 'perfil.folded').read_text(encoding='UTF8').split('\n')
+    assert sum(int(line.rsplit(' ', 1)[1]) for line in lines if line) == \
+        report.n_samples
+
+
+def test_memory_tracing_and_bad_mode(summary):
+    problem = MazeProblem(30, 30, 2, 0.25)
+    result, report = profile_search(uniform_search, problem, None,
+                                    mode='sample', trace_memory=True)
+    assert summary(result) == summary(uniform_search(problem))
+    assert report.peak_memory > 0 and report.allocations
+    assert not tracemalloc.is_tracing()
+
+    with pytest.raises(ValueError):
+        profile_search(uniform_search, problem, None, mode='trace')
+
+
+def test_memory_tracing_of_the_caller_is_kept():
+    problem = MazeProblem(30, 30, 2, 0.25)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        _, report = profile_search(uniform_search, problem, None,
+                                   mode='sample', trace_memory=True)
+        assert tracemalloc.is_tracing()
+        assert report.peak_memory > 0 and report.allocations
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,220 @@
+# Run from the repository root: python -m pytest trab1/tests
+import time
+from math import inf, isclose
+
+import pytest
+
+from trab1.src.limits import CancellationToken, SearchLimits
+from trab1.src.problems import MazeProblem
+from trab1.src.jps import jump_point_search
+from trab1.src.search import a_star_search, anytime_a_star_search, \
+    beam_search, bidirectional_a_star_search, \
+    bidirectional_breadth_first_search, breadth_first_search, \
+    depth_first_search, greedy_best_first_search, ida_star_search, \
+    iter_anytime_a_star_search, sma_star_search, uniform_search
+from trab1.src.wavefront import distance_field
+
+
+class _CountingViewer:
+    # the searches below update the viewer once per expansion
+    def __init__(self):
+        self.n_updates = 0
+
+    def update(self, state=None, generated=[], expanded=[], path=[]):
+        self.n_updates += 1
+
+
+def _mazes(n=30, size=15, obstacle_ratio=0.3):
+    return [MazeProblem(size, size, seed, obstacle_ratio) for seed in range(n)]
+
+
+@pytest.mark.parametrize('extra_nodes', [1, 3])
+@pytest.mark.parametrize('size', [15, 25])
+def test_sma_star_matches_uniform_search(size, extra_nodes, is_valid_path):
+    # a budget just over the path length is enough
+    for problem in _mazes(size=size):
+        expected = uniform_search(problem)
+        path, cost, _, _ = sma_star_search(
+            problem, max_nodes=max(10, len(expected[0]) + extra_nodes))
+        if expected[1] == inf:
+            assert path == [] and cost == inf
+        else:
+            assert isclose(cost, expected[1])
+            assert is_valid_path(problem, path)
+
+
+@pytest.mark.parametrize('max_nodes', [10, 100])
+def test_sma_star_stops_on_unsolvable_maze_with_small_budget(max_nodes):
+    # 140 reachable cells and no path to the goal
+    problem = MazeProblem(9, 20, 3, 0.25)
+    assert uniform_search(problem)[1] == inf
+    path, cost, _, _ = sma_star_search(problem, max_nodes=max_nodes)
+    assert path == [] and cost == inf
+
+
+def test_a_star_with_max_nodes_uses_limits():
+    token = CancellationToken()
+    token.cancel()
+    limits = SearchLimits(token=token)
+    path, cost, _, n_expanded = a_star_search(MazeProblem(20, 20, 42),
+                                              max_nodes=100, limits=limits)
+    assert path == [] and cost == inf and n_expanded == 0
+    assert limits.reason == 'cancelled'
+
+    limits = SearchLimits(max_expansions=5)
+    _, cost, _, n_expanded = a_star_search(MazeProblem(20, 20, 42),
+                                           max_nodes=100, limits=limits)
+    assert cost == inf and n_expanded == 5
+    assert limits.reason == 'expansions'
+
+
+@pytest.mark.parametrize('search', [bidirectional_a_star_search,
+                                    jump_point_search,
+                                    anytime_a_star_search])
+def test_expansions_are_counted_once_per_pop(search, is_valid_path):
+    for problem in _mazes(10, 30, 0.25):
+        viewer = _CountingViewer()
+        path, cost, _, n_expanded = search(problem, viewer)
+        expected = uniform_search(problem)[1]
+        if expected == inf:
+            assert path == [] and cost == inf
+        else:
+            # anytime_a_star_search reports the counters of its last
+            # solution, so only solved mazes are compared
+            assert n_expanded == viewer.n_updates
+            assert isclose(cost, expected)
+            assert is_valid_path(problem, path)
+
+
+@pytest.mark.parametrize('table_size', [0, 50, 10000])
+def test_ida_star_matches_uniform_search(table_size, is_valid_path):
+    for problem in _mazes(size=10, obstacle_ratio=0.25):
+        expected = uniform_search(problem)[1]
+        if expected == inf:
+            continue
+        path, cost, _, _ = ida_star_search(problem, table_size=table_size)
+        assert isclose(cost, expected)
+        assert is_valid_path(problem, path)
+
+
+def test_ida_star_on_an_unsolvable_maze_is_stopped_by_limits():
+    limits = SearchLimits(max_expansions=1000)
+    path, cost, _, n_expanded = ida_star_search(
+        MazeProblem(9, 20, 3, 0.25), table_size=1000, limits=limits)
+    assert path == [] and cost == inf and n_expanded == 1000
+    assert limits.reason == 'expansions'
+
+
+def test_bidirectional_searches(is_valid_path):
+    for problem in _mazes(size=25) + [MazeProblem(9, 20, 3, 0.25)]:
+        expected = uniform_search(problem)[1]
+        n_moves = distance_field(problem, method='bfs')[0][problem._goal_state]
+        bfs_path, _, _, _ = bidirectional_breadth_first_search(problem)
+        path, cost, _, _ = bidirectional_a_star_search(problem)
+        if expected == inf:
+            assert bfs_path == [] and path == [] and cost == inf
+            continue
+        assert len(bfs_path) - 1 == n_moves
+        assert is_valid_path(problem, bfs_path)
+        assert isclose(cost, expected)
+        assert is_valid_path(problem, path)
+
+
+def test_sma_star_needs_room_for_the_path():
+    assert sma_star_search(MazeProblem(1, 1, 0, 0.0), max_nodes=1)[1] == 0
+    # the path has 5 cells, so 4 nodes cannot hold it
+    corridor = MazeProblem(1, 5, 0, 0.0)
+    assert sma_star_search(corridor, max_nodes=4)[:2] == ([], inf)
+    assert sma_star_search(corridor, max_nodes=5)[1] == 4
+
+
+def test_anytime_a_star_solutions_improve_to_the_optimum(is_valid_path):
+    for problem in _mazes(size=25, obstacle_ratio=0.25):
+        expected = uniform_search(problem)[1]
+        solutions = list(iter_anytime_a_star_search(problem, initial_weight=3.0,
+                                                    weight_step=0.5))
+        if expected == inf:
+            assert solutions == []
+            assert anytime_a_star_search(problem)[:2] == ([], inf)
+            continue
+        costs = [s[1] for s in solutions]
+        bounds = [s[2] for s in solutions]
+        assert costs == sorted(costs, reverse=True)
+        assert bounds == sorted(bounds, reverse=True) and bounds[-1] == 1
+        for path, cost, bound, _, _ in solutions:
+            assert is_valid_path(problem, path)
+            assert cost <= bound * expected + 1e-9
+        assert isclose(costs[-1], expected)
+
+
+def test_anytime_a_star_time_budget(is_valid_path):
+    problem = MazeProblem(400, 400, 1, 0.25)
+    start = time.perf_counter()
+    optimal = anytime_a_star_search(problem)[1]
+    full_time = time.perf_counter() - start
+
+    seen = []
+    start = time.perf_counter()
+    path, cost, _, _ = anytime_a_star_search(
+        problem, time_budget=full_time / 8,
+        on_solution=lambda path, cost, bound: seen.append((cost, bound)))
+    # the deadline is checked between expansions
+    assert time.perf_counter() - start < full_time / 2
+    assert cost >= optimal
+    if seen:
+        assert cost == seen[-1][0] and is_valid_path(problem, path)
+    else:
+        assert path == [] and cost == inf
+
+
+def test_greedy_and_beam_search_paths(is_valid_path):
+    for problem in _mazes(size=25) + [MazeProblem(9, 20, 3, 0.25)]:
+        expected = uniform_search(problem)[1]
+        # a beam wider than the maze keeps every state, so it finds a
+        # path whenever one exists; greedy search is complete too
+        for path, cost, _, _ in (greedy_best_first_search(problem),
+                                 beam_search(problem, beam_width=625)):
+            if expected == inf:
+                assert path == [] and cost == inf
+            else:
+                assert is_valid_path(problem, path)
+                assert cost >= expected - 1e-9
+        path, cost, _, _ = beam_search(problem, beam_width=3)
+        assert path == [] or is_valid_path(problem, path)
+
+
+@pytest.mark.parametrize('search', [greedy_best_first_search, beam_search])
+def test_greedy_and_beam_count_generated_states(search, walled_goal):
+    # the initial state is not counted, as in the other searches
+    assert search(MazeProblem(1, 1, 0, 0.0))[2] == 0
+    assert search(walled_goal)[2] == uniform_search(walled_goal)[2] == 4
+
+
+def test_anytime_a_star_weight_step_must_be_positive():
+    problem = MazeProblem(20, 20, 42)
+    for weight_step in (0, -0.5):
+        with pytest.raises(ValueError):
+            iter_anytime_a_star_search(problem, weight_step=weight_step)
+    # a small step gets to the optimum too
+    cost = anytime_a_star_search(problem, initial_weight=2, weight_step=0.01)[1]
+    assert isclose(cost, uniform_search(problem)[1])
+
+
+class _RecordingViewer:
+    def __init__(self):
+        self.updates = []
+
+    def update(self, state=None, generated=[], expanded=[], path=[]):
+        self.updates.append((state, list(generated), set(expanded)))
+
+
+@pytest.mark.parametrize('search', [breadth_first_search, depth_first_search])
+def test_viewer_sees_the_states_of_the_frontier(search):
+    # the frontier holds node ids, the viewer is shown their states
+    problem = MazeProblem(12, 12, 0, 0.2)
+    viewer = _RecordingViewer()
+    search(problem, viewer)
+    for state, generated, expanded in viewer.updates:
+        assert state in expanded and not expanded & set(generated)
+        assert all(isinstance(cell, tuple) for cell in generated)
+    assert len(viewer.updates[-1][2]) == len(viewer.updates)
@@ -0,0 +1,126 @@
+# Run from the repository root: python -m pytest trab1/tests
+import csv
+import json
+import threading
+import tracemalloc
+from math import inf
+
+from trab1.src.frontier import IndexedFrontier, PriorityFrontier
+from trab1.src.problems import MazeProblem, ProblemInterface
+from trab1.src.search import a_star_search, breadth_first_search, \
+    depth_first_search, uniform_search
+from trab1.src.stats import SearchStats, measure, write_stats_csv, \
+    write_stats_json
+
+
+class _MissionariesProblem(ProblemInterface):
+    # states are [missionaries, cannibals, boat] on the starting bank,
+    # as lists, so they can only be searched through the codec
+
+    def actions(self, state):
+        m, c, boat = state
+        sign = -1 if boat else 1
+        moves = []
+        for dm, dc in ((1, 0), (2, 0), (0, 1), (0, 2), (1, 1)):
+            m2, c2 = m + sign * dm, c + sign * dc
+            if 0 <= m2 <= 3 and 0 <= c2 <= 3 and \
+                    (m2 == 0 or m2 >= c2) and (m2 == 3 or 3 - m2 >= 3 - c2):
+                moves.append((dm, dc))
+        return moves
+
+    def transition(self, state, action):
+        sign = -1 if state[2] else 1
+        return [state[0] + sign * action[0], state[1] + sign * action[1],
+                1 - state[2]]
+
+    def step_cost(self, state, action, next_state):
+        return 1
+
+    def heuristic_cost(self, state, h=None):
+        return 0
+
+    def initial_state(self):
+        return [3, 3, 1]
+
+    def is_goal(self, state):
+        return state == [0, 0, 0]
+
+    def has_codec(self):
+        return True
+
+    def encode(self, state):
+        return (state[0] * 4 + state[1]) * 2 + state[2]
+
+    def decode(self, code):
+        return [code // 8, code // 2 % 4, code % 2]
+
+
+def test_problem_with_unhashable_states():
+    for search in (breadth_first_search, depth_first_search, a_star_search):
+        result, stats = measure(search, _MissionariesProblem(), None)
+        assert result[1] == 11
+        assert result[0][-1].state == [0, 0, 0]
+        assert 0 < stats.peak_closed <= 32
+
+
+def test_counts_match_the_search_counters():
+    problem = MazeProblem(20, 20, 42)
+    result, stats = measure(a_star_search, problem, None)
+    assert result[1:] == a_star_search(problem)[1:]
+    assert stats.expanded == result[3]
+    assert stats.peak_frontier > 0 and stats.time_frontier > 0
+    assert stats.peak_memory > 0
+
+
+def test_concurrent_measures_do_not_patch_the_frontier_classes():
+    methods = {cls: dict(vars(cls)) for cls in (PriorityFrontier,
+                                                IndexedFrontier)}
+    problems = [MazeProblem(40, 40, seed) for seed in range(4)]
+    results = {}
+
+    def run(problem):
+        results[id(problem)] = measure(depth_first_search, problem, None,
+                                       trace_memory=False)
+
+    threads = [threading.Thread(target=run, args=(problem,))
+               for problem in problems]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert {cls: dict(vars(cls)) for cls in methods} == methods
+    for problem in problems:
+        result, stats = results[id(problem)]
+        assert stats.expanded == result[3]
+        assert 0 < stats.peak_frontier <= 40 * 40
+
+
+def test_leaves_the_caller_tracing_memory():
+    tracemalloc.start()
+    try:
+        _, stats = measure(a_star_search, MazeProblem(20, 20, 42), None)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    _, stats = measure(a_star_search, MazeProblem(20, 20, 42), None)
+    assert not tracemalloc.is_tracing() and stats.peak_memory > 0
+
+
+def test_unsolvable_maze_and_reports(tmp_path):
+    # every reachable cell is expanded once by a graph search
+    problem = MazeProblem(9, 20, 3, 0.25)
+    result, stats = measure(uniform_search, problem, None,
+                            trace_memory=False)
+    assert result[:2] == ([], inf)
+    assert stats.cost == inf and stats.path_len == -1
+    assert stats.expanded == stats.peak_closed == result[3] == 140
+    assert stats.reopened == 0 and stats.peak_memory is None
+
+    write_stats_json([stats], tmp_path / 'stats.json')
+    with open(tmp_path / 'stats.json', encoding='UTF8') as f:
+        assert json.load(f)[0]['expanded'] == 140
+    write_stats_csv([stats], tmp_path / 'stats.csv')
+    with open(tmp_path / 'stats.csv', encoding='UTF8') as f:
+        rows = list(csv.reader(f, delimiter=';'))
+    assert rows[0] == list(SearchStats.FIELDS) and len(rows) == 2
@@ -0,0 +1,31 @@
+# Run from the repository root: python -m pytest trab1/tests
+import random
+
+from trab1.src.problems import MazeProblem
+from trab1.src.visited import BitsetVisited, make_visited
+
+
+def test_bitset_behaves_as_a_set():
+    problem = MazeProblem(13, 7, 0)
+    visited = make_visited(problem)
+    assert isinstance(visited, BitsetVisited)
+
+    rng = random.Random(0)
+    expected = set()
+    for _ in range(200):
+        cell = (rng.randrange(13), rng.randrange(7))
+        assert (cell in visited) == (cell in expected)
+        visited.add(cell)
+        expected.add(cell)
+        assert cell in visited and len(visited) == len(expected)
+    assert set(visited) == expected
+
+    # the last cell, in the last (partial) byte
+    visited.add((12, 6))
+    assert (12, 6) in visited and (12, 6) in set(visited)
+
+
+def test_other_problems_get_a_set():
+    problem = MazeProblem(5, 5, 0)
+    assert isinstance(make_visited(problem.reversed()), BitsetVisited)
+    assert make_visited(object()) == set()
@@ -0,0 +1,61 @@
+# Run from the repository root: python -m pytest trab1/tests
+import copy
+from math import inf, isclose
+
+import numpy as np
+import pytest
+
+from trab1.src.problems import MazeProblem
+from trab1.src.search import breadth_first_search, uniform_search
+from trab1.src.wavefront import distance_field, wavefront_search
+
+
+def _between(problem, start, goal):
+    # the same maze (shared grid) with another start and goal
+    problem = copy.copy(problem)
+    problem._initial_state = start
+    problem._goal_state = goal
+    return problem
+
+
+def test_search_matches_uniform_and_breadth_first_search():
+    for seed in range(20):
+        problem = MazeProblem(20, 30, seed, 0.3)
+        expected = uniform_search(problem)[1]
+        path, cost, _, _ = wavefront_search(problem)
+        bfs_path, _, _, _ = wavefront_search(problem, method='bfs')
+        if expected == inf:
+            assert path == [] and cost == inf and bfs_path == []
+            continue
+        assert isclose(cost, expected)
+        assert len(bfs_path) == len(breadth_first_search(problem, None)[0])
+        for p in (path, bfs_path):
+            cells = [node.state for node in p]
+            assert cells[0] == problem.initial_state()
+            assert problem.is_goal(cells[-1])
+            assert all(b in problem.actions(a)
+                       for a, b in zip(cells, cells[1:]))
+
+
+def test_field_holds_the_distance_to_every_cell():
+    problem = MazeProblem(15, 15, 4, 0.3)
+    source = (7, 7)
+    problem.set_cell(source, 0)
+    dist, parent = distance_field(problem, source)
+    assert dist[source] == 0 and parent[source] == -1
+    for row in range(15):
+        for col in range(15):
+            expected = uniform_search(
+                _between(problem, source, (row, col)))[1]
+            if expected == inf:
+                assert dist[row, col] == inf and parent[row, col] == -1
+            else:
+                assert isclose(dist[row, col], expected, abs_tol=1e-9)
+
+
+def test_field_of_the_walled_maze(walled_goal):
+    dist, _ = distance_field(walled_goal, method='bfs')
+    assert np.array_equal(dist, [[0, 1, 2], [1, inf, inf], [2, inf, inf]])
+
+    with pytest.raises(ValueError):
+        distance_field(walled_goal, method='a_star')